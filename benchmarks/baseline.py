@@ -0,0 +1,96 @@
+# =============================================================================
+# 🕰️ BENCHMARK UYARLAYICISI: OPTİMİZASYON ÖNCESİ UYGULAMA
+# =============================================================================
+# Optimizasyonlardan önceki app.py tek bir Streamlit betiğidir; parsing,
+# loaders ve sections modülleri henüz yoktur. Bu modül o sürümün app.py'sini
+# git'ten okur ve ölçülebilir parçalarını ayırır:
+#   - satır satır ayrıştırıcılar (parse_salary, parse_company_size,
+#     parse_skills ve betiğin içindeki parse_post_date) AST'den alınıp
+#     özgün dekoratörleriyle derlenir,
+#   - load_data + ön işleme satırları 'load.csv' olarak,
+#   - sayfanın tamamı (tüm bölümler) AppTest ile 'render.page' olarak ölçülür
+#     (güncel uygulamada varsayılan bölümle açılan sayfa).
+# Ölçüm adları bench_dashboard ile aynıdır; böylece --compare optimizasyon
+# öncesi ve sonrası sonuçları doğrudan karşılaştırır. Bölüm bazında
+# ölçümler (shared.*, compute.*, render.<bölüm>) özgün uygulamada karşılığı
+# olmadığı için yoktur.
+#
+# Çalıştırma (depo kökünden):
+#     python -m benchmarks.bench_dashboard --baseline <commit> --scales 1 10
+# =============================================================================
+
+import ast
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_dashboard import measure, measure_page
+
+# bench_dashboard.PARSERS adı -> (özgün satır ayrıştırıcısı, ham sütun)
+BASELINE_PARSERS = {
+    'parse_salary_column': ('parse_salary', 'salary'),
+    'parse_company_size_column': ('parse_company_size', 'company_size'),
+    'parse_skills_column': ('parse_skills', 'skills'),
+    'parse_post_date_column': ('parse_post_date', 'post_date'),
+}
+
+
+def baseline_source(rev):
+    """rev commit'indeki app.py metni"""
+    return subprocess.run(
+        ['git', 'show', f'{rev}:app.py'], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def baseline_parsers(source):
+    """Özgün betikteki satır ayrıştırıcıları (ad -> fonksiyon), özgün dekoratörleriyle"""
+    import streamlit as st
+
+    wanted = {parser for parser, _ in BASELINE_PARSERS.values()}
+    nodes = [
+        node for node in ast.walk(ast.parse(source))
+        if isinstance(node, ast.FunctionDef) and node.name in wanted
+    ]
+    namespace = {'st': st, 'pd': pd, 'np': np, 'ast': ast}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), 'baseline_app.py', 'exec'), namespace)
+    return {name: namespace[name] for name in wanted}
+
+
+def _measure_parsers(raw, parsers, cold, repeat, record):
+    """Özgün ayrıştırıcıların Series.apply ile sütun başına süreleri"""
+    for name, (parser, column) in BASELINE_PARSERS.items():
+        fn = parsers[parser]
+        record(f'parse.{name}', measure(cold(lambda: raw[column].apply(fn)), repeat))
+    record('parse.count_skills', measure(cold(lambda: raw['skills'].apply(parsers['parse_skills']).apply(len)), repeat))
+
+
+def run_baseline(source, path, repeat, timeout, record):
+    """Özgün uygulamanın load.* / parse.* / render.page ölçümleri (record(ad, süre özeti) ile)"""
+    import streamlit as st
+
+    parsers = baseline_parsers(source)
+
+    def cold(fn):
+        """Özgün ayrıştırıcılar st.cache_data ile sarılı; her tekrar soğuk önbellekle ölçülür"""
+        def run():
+            st.cache_data.clear()
+            fn()
+        return run
+
+    def load_and_prepare():
+        # özgün load_data + ön işleme satırları
+        df = pd.read_csv(path)
+        df['salary_numeric'] = df['salary'].apply(parsers['parse_salary'])
+        df['company_size_numeric'] = df['company_size'].apply(parsers['parse_company_size'])
+        df['skills_list'] = df['skills'].apply(parsers['parse_skills'])
+        df['skills_count'] = df['skills_list'].apply(len)
+        return df
+
+    record('load.csv', measure(cold(load_and_prepare), repeat))
+
+    _measure_parsers(pd.read_csv(path, dtype=str), parsers, cold, repeat, record)
+
+    st.cache_data.clear()
+    record('render.page', measure_page(source, path, repeat, timeout))
+    st.cache_data.clear()
@@ -0,0 +1,414 @@
+# =============================================================================
+# ⏱️ BENCHMARK: DASHBOARD HESAPLAMALARI (1× / 100× / 1000× VERİ)
+# =============================================================================
+# Sentetik ilan CSV'leri (benchmarks/synthetic.py) üzerinde her ölçek için
+# şunları ölçer:
+#   load.*     CSV'den parça parça yükleme ve Parquet anlık görüntüsünden okuma
+#   parse.*    parsing.py'deki her parse_* fonksiyonu ve prepare_dataset
+#   shared.*   bölümlerin paylaştığı önbellekli yapılar (soğuk önbellekle)
+#   compute.*  her bölümün hesaplama fonksiyonları (önbelleksiz)
+#   figure.*   her build_*_figure'ın figür kurulumu (figür önbelleği
+#              atlanır; hesaplama önbellekleri sıcak)
+#   render.*   her bölümün önbellekler ve figür deposu sıcakken çizimi
+#              (figür önbelleği isabetleri + Streamlit mesajları; AppTest
+#              ile); render.page app.py'nin tamamı (varsayılan bölümle
+#              açılan sayfa)
+# Sonuçlar commit'ler arasında karşılaştırılabilecek JSON olarak yazılır.
+# --baseline <commit> aynı adlı ölçümleri optimizasyon öncesi tek dosyalık
+# app.py üzerinde alır (bkz. benchmarks/baseline.py).
+#
+# Çalıştırma (depo kökünden):
+#     python -m benchmarks.bench_dashboard                      # 1×, 100×, 1000×
+#     python -m benchmarks.bench_dashboard --scales 1 10 --repeat 5
+#     python -m benchmarks.bench_dashboard --baseline <commit> --scales 1 10
+#     python -m benchmarks.bench_dashboard --compare eski.json yeni.json
+# =============================================================================
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import BASE_ROWS, write_postings_csv
+
+SCALES = (1, 100, 1000)
+RESULTS_DIR = os.path.join('benchmarks', 'results')
+
+# parse_* fonksiyonu -> ham sütun
+PARSERS = {
+    'parse_salary_column': 'salary',
+    'parse_company_size_column': 'company_size',
+    'parse_skills_column': 'skills',
+    'parse_post_date_column': 'post_date',
+}
+
+# Soğuk önbellekle, bağımlılık sırasıyla ölçülen paylaşılan yapılar
+SHARED_LOADERS = [
+    'load_prepared_data',
+    'load_filter_index',
+    'load_full_salary_cube',
+    'load_full_skill_incidence',
+    'load_skill_cooccurrence',
+    'load_skill_index',
+]
+
+# Bölüm -> (hesaplama fonksiyonu, veri anahtarı ve filtrelerden sonraki argümanlar);
+# argümanlar bölüm kontrollerinin varsayılan değerleridir
+SECTION_COMPUTATIONS = {
+    'overview': [('compute_overview', ())],
+    'missing': [('compute_missing_values', ())],
+    'outliers': [('compute_outlier_stats', ()), ('compute_outlier_boxes', ()), ('compute_outlier_histograms', ())],
+    'descriptive': [('compute_descriptive_stats', ())],
+    'distributions': [('compute_distributions', ())],
+    'correlation': [('compute_correlation', ()), ('compute_correlation_png', ())],
+    'salary': [
+        ('compute_salary_summary', ()), ('compute_salary_histogram', ('nice',)), ('compute_salary_kde_png', ()),
+    ],
+    'industry': [('compute_industry', ())],
+    'seniority': [('compute_seniority_stats', ()), ('compute_seniority_boxes', ())],
+    'skills': [
+        ('compute_skill_summary', ()),
+        ('compute_cooccurrence_heatmap', (15,)),
+        ('compute_itemset_tables', (0.05, 4)),
+        ('compute_anchor_cooccurrence', ('python',)),
+    ],
+    'location': [('compute_location', ())],
+    'advanced': [('compute_advanced', ()), ('compute_location_densities', ())],
+}
+
+# Bölüm -> (figür oluşturucu, veri anahtarı ve filtrelerden sonraki argümanlar);
+# argümanlar bölümün varsayılan çiziminde kullanılanlardır
+SECTION_FIGURES = {
+    'overview': [],
+    'missing': [('build_missing_figure', ())],
+    'outliers': [
+        (builder, (column, after))
+        for builder in ('build_outlier_box_figure', 'build_outlier_histogram_figure')
+        for column in ('salary_numeric', 'company_size_numeric')
+        for after in (False, True)
+    ] + [('build_outlier_box_figure', ('skills_count', False)), ('build_outlier_box_figure', ('skills_count', True))],
+    'descriptive': [],
+    'distributions': [
+        ('build_seniority_count_figure', ()), ('build_status_count_figure', ()),
+        ('build_status_pie_figure', ()), ('build_industry_count_figure', ()),
+    ],
+    'correlation': [],
+    'salary': [('build_salary_histogram_figure', ('nice',))],
+    'industry': [('build_industry_salary_figure', ()), ('build_size_salary_figure', ()), ('build_trend_figure', ())],
+    'seniority': [('build_seniority_box_figure', ())],
+    'skills': [
+        ('build_top_skills_figure', ()),
+        ('build_top_30_skills_figure', ()),
+        ('build_skill_pairs_figure', ()),
+        ('build_cooccurrence_heatmap_figure', (15,)),
+        ('build_skill_triplets_figure', ()),
+        ('build_anchor_figure', ('python',)),
+    ],
+    'location': [('build_location_figure', ())],
+    'advanced': [
+        ('build_dumbbell_figure', ()),
+        ('build_ridgeline_figure', (8,)),
+        ('build_error_bar_figure', ()),
+        ('build_industry_violin_figure', ()),
+        ('build_seniority_violin_figure', ()),
+    ],
+}
+
+
+def _timings(runs):
+    """Tekrar sürelerinin özeti (saniye)"""
+    return {'min': min(runs), 'median': statistics.median(runs), 'runs': runs}
+
+
+def measure(fn, repeat):
+    """fn'i repeat kez çalıştırıp süreleri döndür"""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return _timings(runs)
+
+
+def measure_figures(section, data_key, filters, repeat, record):
+    """Bölümün figür oluşturucuları, figür önbelleği olmadan (__wrapped__)
+
+    İlk çağrı hesaplama önbelleklerini doldurur; ölçülen yalnızca figür
+    kurulumu ve JSON'a serileştirmedir (önbelleğe yazılan iş).
+    """
+    module = __import__(f'sections.{section}', fromlist=['_'])
+    for name, args in SECTION_FIGURES[section]:
+        build = getattr(module, name).__wrapped__
+        build(data_key, filters, *args)
+        label = f"figure.{section}.{name}" + (f"({', '.join(map(str, args))})" if args else '')
+        record(label, measure(lambda: build(data_key, filters, *args).to_json(), repeat))
+
+
+def _render_section(section_key, path):
+    """AppTest betiği: bölümü filtresiz çizip süresini oturum durumuna yaz"""
+    import time
+
+    import streamlit as st
+
+    from filters import NO_FILTERS
+    from loaders import dataset_key, load_filtered_data
+    from sections import SECTIONS_BY_KEY
+
+    data_key = dataset_key(path)
+    df = load_filtered_data(*data_key, NO_FILTERS)
+    start = time.perf_counter()
+    SECTIONS_BY_KEY[section_key].render(df, data_key, NO_FILTERS)
+    st.session_state['render_seconds'] = time.perf_counter() - start
+
+
+def measure_render(section_key, path, repeat, timeout):
+    """Bölüm çizimi: ilk çalıştırma önbellekleri doldurur, sonraki repeat çalıştırma ölçülür"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_function(_render_section, args=(section_key, path), default_timeout=timeout)
+    runs = []
+    for _ in range(repeat + 1):
+        app.run()
+        if app.exception:
+            raise RuntimeError(f"{section_key}: {app.exception[0].message}")
+        runs.append(app.session_state['render_seconds'])
+    return _timings(runs[1:])
+
+
+# Uygulamanın veriyi okuduğu dosya adı (çalışma klasörüne göre)
+APP_DATA_FILE = 'data_science_job_posts_2025.csv'
+
+
+def _render_page(source):
+    """AppTest betiği: app.py kaynağını çalıştırıp süresini oturum durumuna yaz"""
+    import time
+
+    import streamlit as st
+
+    start = time.perf_counter()
+    exec(compile(source, 'app.py', 'exec'), {'__name__': '__main__'})
+    st.session_state['render_seconds'] = time.perf_counter() - start
+
+
+def measure_page(source, path, repeat, timeout):
+    """Sayfanın tamamı: ilk çalıştırma önbellekleri doldurur, sonraki repeat çalıştırma ölçülür
+
+    Uygulama veriyi çalışma klasöründeki sabit dosya adından okuduğu için
+    path geçici olarak bu ada taşınır ve çizimler path'in klasöründe yapılır.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    folder = os.path.dirname(os.path.abspath(path))
+    app_path = os.path.join(folder, APP_DATA_FILE)
+    app = AppTest.from_function(_render_page, args=(source,), default_timeout=timeout)
+    cwd = os.getcwd()
+    os.replace(path, app_path)
+    os.chdir(folder)
+    try:
+        runs = []
+        for _ in range(repeat + 1):
+            app.run()
+            if app.exception:
+                raise RuntimeError(f"sayfa: {app.exception[0].message}")
+            runs.append(app.session_state['render_seconds'])
+    finally:
+        os.chdir(cwd)
+        os.replace(app_path, path)
+    return _timings(runs[1:])
+
+
+def _measure_parsers(raw, repeat, record):
+    """parsing.py ayrıştırıcıları (ham tablo bu fonksiyondan çıkınca serbest kalır)"""
+    import parsing
+
+    for parser, column in PARSERS.items():
+        fn = getattr(parsing, parser)
+        record(f'parse.{parser}', measure(lambda: fn(raw[column]), repeat))
+    record('parse.count_skills', measure(lambda: parsing.count_skills(parsing.parse_skills_column(raw['skills'])), repeat))
+    record('parse.prepare_dataset', measure(lambda: parsing.prepare_dataset(raw), repeat))
+
+
+def run_current(path, repeat, timeout, sections, record):
+    """Güncel kodun ölçümleri (record(ad, süre özeti) ile)"""
+    import streamlit as st
+
+    import loaders
+    from filters import NO_FILTERS
+    from jobs_analytics import load
+
+    record('load.csv', measure(lambda: load(path, snapshot=False), repeat))
+    load(path)  # anlık görüntüyü yaz
+    record('load.snapshot', measure(lambda: load(path), repeat))
+
+    _measure_parsers(pd.read_csv(path, dtype=str), repeat, record)
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    data_key = loaders.dataset_key(path)
+    for loader in SHARED_LOADERS:
+        fn = getattr(loaders, loader)
+        record(f'shared.{loader}', measure(lambda: fn(*data_key), 1))
+
+    for section in sections:
+        module = __import__(f'sections.{section}', fromlist=['_'])
+        for name, args in SECTION_COMPUTATIONS[section]:
+            fn = getattr(module, name).__wrapped__
+            record(f'compute.{section}.{name}', measure(lambda: fn(data_key, NO_FILTERS, *args), repeat))
+
+    for section in sections:
+        measure_figures(section, data_key, NO_FILTERS, repeat, record)
+
+    for section in sections:
+        record(f'render.{section}', measure_render(section, path, repeat, timeout))
+
+    with open('app.py', encoding='utf-8') as f:
+        record('render.page', measure_page(f.read(), path, repeat, timeout))
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def run_scale(scale, repeat, seed, timeout, sections=None, baseline=None, log=print):
+    """Tek ölçek için tüm ölçümler (ad -> süre özeti)
+
+    baseline verilirse (optimizasyon öncesi app.py kaynağı) yalnızca onun
+    karşılığı olan ölçümler alınır.
+    """
+    n_rows = BASE_ROWS * scale
+    results = {}
+
+    def record(name, timing):
+        results[name] = timing
+        log(f"  {name:<72} {timing['min'] * 1e3:>12,.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'postings.csv')
+        start = time.perf_counter()
+        write_postings_csv(path, n_rows, seed)
+        log(f"× {scale}: {n_rows:,} satır, {os.path.getsize(path) / 2**20:,.1f} MB "
+            f"({time.perf_counter() - start:.1f} sn'de üretildi)")
+
+        if baseline is not None:
+            from benchmarks.baseline import run_baseline
+
+            run_baseline(baseline, path, repeat, timeout, record)
+        else:
+            run_current(path, repeat, timeout, sections or list(SECTION_COMPUTATIONS), record)
+
+    return {'scale': scale, 'rows': n_rows, 'timings': results}
+
+
+def _quiet_streamlit_logs():
+    """Çalışma zamanı olmadan önbellek kullanımı ve kullanımdan kaldırma uyarılarını gizle
+
+    AppTest her çalıştırmada günlük düzeyini yapılandırmadan yeniden kurduğu
+    için düzey yerine logger'lara filtre eklenir.
+    """
+    import streamlit  # Streamlit logger'larını oluşturur
+
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith('streamlit'):
+            logging.getLogger(name).addFilter(lambda record: record.levelno >= logging.ERROR)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment(args):
+    """Sonuçların karşılaştırılabilmesi için çalışma ortamı bilgileri"""
+    import plotly
+    import streamlit
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': {
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'plotly': plotly.__version__,
+            'streamlit': streamlit.__version__,
+        },
+        'base_rows': BASE_ROWS,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'baseline': args.baseline,
+    }
+
+
+def compare(base_path, new_path):
+    """İki sonuç dosyasının en iyi sürelerini ölçek ve ölçüm bazında karşılaştır"""
+    with open(base_path, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(new_path, encoding='utf-8') as f:
+        new = json.load(f)
+
+    base_scales = {result['scale']: result['timings'] for result in base['results']}
+    label = lambda meta: f"özgün app.py @ {meta['baseline']}" if meta.get('baseline') else meta.get('commit')
+    print(f"{label(base['meta'])} -> {label(new['meta'])}")
+    for result in new['results']:
+        old_timings = base_scales.get(result['scale'])
+        if old_timings is None:
+            continue
+        print(f"\n× {result['scale']} ({result['rows']:,} satır)")
+        print(f"{'ölçüm':<72} {'önce (ms)':>12} {'sonra (ms)':>12} {'oran':>8}")
+        for name, timing in result['timings'].items():
+            if name not in old_timings:
+                continue
+            before, after = old_timings[name]['min'], timing['min']
+            print(f"{name:<72} {before * 1e3:>12,.1f} {after * 1e3:>12,.1f} {after / before:>7.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik veri ölçeklerinde dashboard hesaplamaları benchmark'ı")
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--sections', nargs='+', choices=list(SECTION_COMPUTATIONS))
+    parser.add_argument('--timeout', type=float, default=600, help='bölüm çizimi başına AppTest zaman aşımı (sn)')
+    parser.add_argument('--output', help='JSON sonuç dosyası (varsayılan: benchmarks/results/<commit>.json)')
+    parser.add_argument('--baseline', metavar='COMMIT', help="optimizasyon öncesi app.py'yi bu commit'ten ölç")
+    parser.add_argument('--compare', nargs=2, metavar=('ONCE', 'SONRA'), help='iki sonuç dosyasını karşılaştır')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    _quiet_streamlit_logs()
+    baseline = None
+    if args.baseline:
+        from benchmarks.baseline import baseline_source
+
+        baseline = baseline_source(args.baseline)
+    results = [
+        run_scale(scale, args.repeat, args.seed, args.timeout, args.sections, baseline) for scale in args.scales
+    ]
+    name = f'baseline-{args.baseline}' if args.baseline else _git_commit() or 'local'
+    output = args.output or os.path.join(RESULTS_DIR, f'{name}.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': _environment(args), 'results': results}, f, indent=2)
+    print(f"\nSonuçlar: {output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
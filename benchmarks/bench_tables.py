@@ -0,0 +1,62 @@
+# =============================================================================
+# ⏱️ MİKRO BENCHMARK: HTML TABLO OLUŞTURUCU
+# =============================================================================
+# Eski iterrows + string birleştirme uygulaması ile tables.create_dark_table
+# karşılaştırılır.
+#
+# Çalıştırma (depo kökünden):
+#     python -m benchmarks.bench_tables
+# =============================================================================
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from tables import create_dark_table
+
+
+def legacy_create_dark_table(df, max_rows=None):
+    """Önceki (iterrows tabanlı) uygulama"""
+    if max_rows:
+        df = df.head(max_rows)
+
+    html = '<table class="dark-table">'
+    html += '<thead><tr>'
+    for col in df.columns:
+        html += f'<th>{col}</th>'
+    html += '</tr></thead>'
+    html += '<tbody>'
+    for _, row in df.iterrows():
+        html += '<tr>'
+        for val in row:
+            html += f'<td>{val}</td>'
+        html += '</tr>'
+    html += '</tbody></table>'
+    return html
+
+
+def make_frame(n_rows, seed=0):
+    """Uygulamadaki tablolara benzeyen karışık tipli örnek tablo"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Beceri': rng.choice(['python', 'sql', 'machine learning', 'aws', 'r'], n_rows),
+        'Sayı': rng.integers(0, 1000, n_rows),
+        'Oran (%)': rng.random(n_rows).round(2) * 100,
+        'Maaş': [f"€{x:,.0f}" for x in rng.integers(20_000, 300_000, n_rows)],
+    })
+
+
+def run(sizes=(10, 100, 1_000, 10_000), repeat=3):
+    print(f"{'satır':>8} {'eski (ms)':>12} {'yeni (ms)':>12} {'sayfa (ms)':>12} {'hızlanma':>10}")
+    for n_rows in sizes:
+        df = make_frame(n_rows)
+        number = max(1, 2_000 // n_rows)
+        legacy = min(timeit.repeat(lambda: legacy_create_dark_table(df), number=number, repeat=repeat)) / number
+        fast = min(timeit.repeat(lambda: create_dark_table(df), number=number, repeat=repeat)) / number
+        paged = min(timeit.repeat(lambda: create_dark_table(df, page_size=50), number=number, repeat=repeat)) / number
+        print(f"{n_rows:>8,} {legacy * 1e3:>12.2f} {fast * 1e3:>12.2f} {paged * 1e3:>12.2f} {legacy / fast:>9.1f}x")
+
+
+if __name__ == '__main__':
+    run()
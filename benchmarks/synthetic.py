@@ -0,0 +1,177 @@
+# =============================================================================
+# 🧪 SENTETİK İLAN ÜRETİCİ
+# =============================================================================
+# Gerçek CSV ile aynı sütunlara ve metin biçimlerine sahip ham ilan tablosu
+# üretir: "€100,472 - €200,938" / "€137,000" maaşlar, "55,110" / "Private" /
+# "€352.44B" şirket büyüklükleri, "['sql', 'python']" beceri listeleri,
+# "7 days ago" / "a month ago" tarihleri. Dağılımlar (eksik değer oranları,
+# aralık / tek değer oranı, beceri sıklıkları) 944 satırlık gerçek veri
+# setine göre ayarlanmıştır. Şirket, konum ve merkez sayıları satır sayısıyla
+# birlikte büyür; böylece ayrıştırıcıların benzersiz değer yolları da ölçeklenir.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+BASE_ROWS = 944  # gerçek veri setinin satır sayısı (ölçek 1)
+
+COLUMNS = [
+    'job_title', 'seniority_level', 'status', 'company', 'location', 'post_date', 'headquarter',
+    'industry', 'ownership', 'company_size', 'revenue', 'salary', 'skills',
+]
+
+JOB_TITLES = ['data scientist', 'machine learning engineer', 'data engineer', 'data analyst']
+JOB_TITLE_WEIGHTS = [0.55, 0.25, 0.12, 0.08]
+SENIORITY_LEVELS = ['senior', 'lead', 'midlevel', 'junior']
+SENIORITY_WEIGHTS = [0.67, 0.12, 0.12, 0.03]
+STATUSES = ['on-site', 'hybrid', 'remote']
+STATUS_WEIGHTS = [0.33, 0.27, 0.13]
+INDUSTRIES = ['Technology', 'Finance', 'Retail', 'Healthcare', 'Education', 'Energy', 'Manufacturing', 'Logistics']
+INDUSTRY_WEIGHTS = [0.40, 0.20, 0.12, 0.10, 0.07, 0.05, 0.04, 0.02]
+OWNERSHIPS = ['Public', 'Private']
+
+HEADQUARTERS = [
+    'San Francisco, CA, US', 'New York, NY, US', 'Mountain View, CA, US', 'Seattle, WA, US', 'McLean, VA, US',
+    'San Jose, CA, US', 'Bentonville, AR, US', 'Chicago, IL, US', 'Dublin, IE', 'Menlo Park, CA, US',
+    'Bengaluru, KA, IN', 'Boston, MA, US', 'Reston, VA, US', 'London, GB', 'Toronto, ON, CA',
+    'Paris, IDF, FR', 'Singapore, SG', 'Austin, TX, US',
+]
+LOCATIONS = [
+    'Bengaluru, Karnataka, India', 'Fully Remote', 'New York, NY', 'United States', 'On-site',
+    'San Francisco, CA', 'Mountain View, CA', 'Sunnyvale, CA', 'Hybrid', 'San Diego, CA', 'Seattle, WA',
+    'Hyderabad, Telangana, India', 'Atlanta, GA', 'Singapore, Singapore', 'McLean, VA', 'Bellevue, WA',
+    'London, England, United Kingdom', 'Toronto, Ontario, Canada', 'Pune, Maharashtra, India', 'San Jose, CA',
+]
+
+# Gerçek veri setindeki ilan sayılarıyla orantılı beceri sıklıkları
+SKILL_FREQUENCIES = {
+    'python': 640, 'machine learning': 580, 'sql': 442, 'r': 343, 'aws': 218, 'deep learning': 178,
+    'tensorflow': 165, 'spark': 161, 'azure': 155, 'pytorch': 148, 'tableau': 116, 'gcp': 106,
+    'scikit-learn': 91, 'scala': 85, 'database': 83, 'pandas': 76, 'java': 73, 'hadoop': 67, 'git': 65,
+    'numpy': 60, 'docker': 54, 'amazon': 51, 'kubernetes': 44, 'matplotlib': 36, 'keras': 32,
+    'powerbi': 25, 'airflow': 25, 'linux': 23, 'neural network': 15, 'scipy': 10, 'bash': 5,
+    'sklearn': 5, 'opencv': 4,
+}
+MAX_SKILLS = 17
+
+POST_DATE_KINDS = ['days', 'a month ago', 'months', 'a day ago', 'hours', 'years', 'a year ago']
+POST_DATE_WEIGHTS = [0.686, 0.177, 0.106, 0.019, 0.005, 0.004, 0.003]
+
+REVENUE_LABELS = ['Private', 'Public', 'Education', 'Nonprofit']
+REVENUE_WEIGHTS = [0.26, 0.24, 0.02, 0.013]  # kalan oran parasal değer veya eksik
+
+
+def _weighted(rng, options, weights, n_rows, missing=0.0):
+    """Ağırlıklı seçim; `missing` oranında NaN"""
+    weights = np.asarray(weights, dtype=np.float64)
+    values = np.asarray(options, dtype=object)[rng.choice(len(options), n_rows, p=weights / weights.sum())]
+    if missing:
+        values[rng.random(n_rows) < missing] = np.nan
+    return values
+
+
+def _zipf_pool(rng, base, n_rows, n_extra, template):
+    """Sabit havuz + satır sayısıyla büyüyen sentetik değerler; sıra ile azalan (Zipf) sıklık"""
+    pool = np.asarray(base + [template.format(k) for k in range(n_extra)], dtype=object)
+    weights = 1.0 / np.arange(1, len(pool) + 1)
+    return pool[rng.choice(len(pool), n_rows, p=weights / weights.sum())]
+
+
+def _money(values, decimals=0, suffix=''):
+    """Avro biçimli metinler: €137,000 veya €352.44B"""
+    return [f"€{value:,.{decimals}f}{suffix}" for value in values]
+
+
+def _salaries(rng, n_rows):
+    """%63 aralık ("€a - €b"), kalanı tek değer; merkezler log-normal, binde 3 uç değer"""
+    center = rng.lognormal(np.log(125_000), 0.55, n_rows)
+    center[rng.random(n_rows) < 0.003] *= 15
+    spread = rng.uniform(0.05, 0.45, n_rows)
+    low = np.maximum(center * (1 - spread), 5_000).round().astype(np.int64)
+    high = (center * (1 + spread)).round().astype(np.int64)
+    single = center.round().astype(np.int64)
+    is_range = rng.random(n_rows) < 0.63
+    return np.where(
+        is_range,
+        np.array([f"€{a:,} - €{b:,}" for a, b in zip(low, high)], dtype=object),
+        np.array(_money(single), dtype=object),
+    )
+
+
+def _company_sizes(rng, n_rows):
+    """Çoğunlukla çalışan sayısı ("55,110"); bir kısmı "Private" ya da "€352.44B" (kayık sütun)"""
+    sizes = np.clip(rng.lognormal(np.log(20_000), 2.4, n_rows), 5, 900_000).round().astype(np.int64)
+    values = np.array([f"{size:,}" for size in sizes], dtype=object)
+    kind = rng.random(n_rows)
+    values[kind < 0.016] = 'Private'
+    money = (kind >= 0.016) & (kind < 0.041)
+    values[money] = _money(rng.uniform(1, 400, money.sum()), decimals=2, suffix='B')
+    return values
+
+
+def _revenues(rng, n_rows):
+    """Etiketler (Private / Public / ...), "€913.33M"-"€1.45T" değerleri ve %1.6 eksik"""
+    values = _weighted(rng, REVENUE_LABELS + ['money'], REVENUE_WEIGHTS + [1 - sum(REVENUE_WEIGHTS)], n_rows)
+    money = values == 'money'
+    amounts = rng.uniform(1, 999, money.sum())
+    suffixes = rng.choice(['M', 'B', 'T'], money.sum(), p=[0.3, 0.6, 0.1])
+    values[money] = [f"€{amount:,.2f}{suffix}" for amount, suffix in zip(amounts, suffixes)]
+    values[rng.random(n_rows) < 0.016] = np.nan
+    return values
+
+
+def _post_dates(rng, n_rows):
+    """"7 days ago", "a month ago", "3 months ago", "5 hours ago" ... biçimli tarihler"""
+    kinds = _weighted(rng, POST_DATE_KINDS, POST_DATE_WEIGHTS, n_rows)
+    amounts = {'days': rng.integers(2, 31, n_rows), 'months': rng.integers(2, 12, n_rows),
+               'hours': rng.integers(1, 24, n_rows), 'years': rng.integers(2, 4, n_rows)}
+    values = kinds.copy()
+    for unit, amount in amounts.items():
+        mask = kinds == unit
+        values[mask] = [f"{n} {unit} ago" for n in amount[mask]]
+    return values
+
+
+def _skill_lists(rng, n_rows):
+    """Python liste literalleri ("['sql', 'python']", "[]"); beceri sayısı ve seçimi gerçek sıklıklarla
+
+    Her satır için k beceri, ağırlıklarla yerine koymadan seçilir (Gumbel top-k).
+    """
+    names = np.array(list(SKILL_FREQUENCIES), dtype=object)
+    weights = np.array(list(SKILL_FREQUENCIES.values()), dtype=np.float64)
+    counts = np.clip(rng.gamma(1.5, 3.0, n_rows).round().astype(np.int64), 0, MAX_SKILLS)
+    keys = np.log(weights)[None, :] + rng.gumbel(size=(n_rows, len(names)))
+    order = np.argsort(-keys, axis=1)[:, :MAX_SKILLS]
+    return np.array([
+        '[' + ', '.join(f"'{skill}'" for skill in names[row[:k]]) + ']'
+        for row, k in zip(order, counts)
+    ], dtype=object)
+
+
+def generate_postings(n_rows, seed=0):
+    """Gerçek CSV biçiminde n_rows satırlık ham ilan tablosu (tüm sütunlar metin)"""
+    rng = np.random.default_rng(seed)
+    n_companies = max(1_000, n_rows // 2)
+    n_places = int(6 * np.sqrt(n_rows))
+    data = {
+        'job_title': _weighted(rng, JOB_TITLES, JOB_TITLE_WEIGHTS, n_rows, missing=0.003),
+        'seniority_level': _weighted(rng, SENIORITY_LEVELS, SENIORITY_WEIGHTS, n_rows, missing=0.064),
+        'status': _weighted(rng, STATUSES, STATUS_WEIGHTS, n_rows, missing=0.27),
+        'company': np.array([f"company_{i:03d}" for i in rng.integers(0, n_companies, n_rows)], dtype=object),
+        'location': _zipf_pool(rng, LOCATIONS, n_rows, n_places, 'City {}, ST'),
+        'post_date': _post_dates(rng, n_rows),
+        'headquarter': _zipf_pool(rng, HEADQUARTERS, n_rows, n_places, 'Town {}, ST, US'),
+        'industry': _weighted(rng, INDUSTRIES, INDUSTRY_WEIGHTS, n_rows),
+        'ownership': _weighted(rng, OWNERSHIPS, [0.55, 0.45], n_rows, missing=0.05),
+        'company_size': _company_sizes(rng, n_rows),
+        'revenue': _revenues(rng, n_rows),
+        'salary': _salaries(rng, n_rows),
+        'skills': _skill_lists(rng, n_rows),
+    }
+    return pd.DataFrame(data, columns=COLUMNS)
+
+
+def write_postings_csv(path, n_rows, seed=0):
+    """Sentetik ilanları CSV olarak yaz; yolu döndür"""
+    generate_postings(n_rows, seed).to_csv(path, index=False)
+    return path
@@ -0,0 +1,121 @@
+# =============================================================================
+# 🧊 MAAŞ KÜPÜ (OLAP)
+# =============================================================================
+# Kıdem × çalışma modeli × sektör × şirket merkezi kombinasyonlarının her biri
+# için maaş ölçüleri (ilan sayısı, maaşlı ilan sayısı, toplam, kareler
+# toplamı, min, max) bir kez hesaplanır. Grafiklerin ihtiyaç duyduğu
+# ortalama / standart sapma / min / max / sayım tabloları satırlar yerine bu
+# hücrelerin toplanmasıyla (roll-up) üretilir: maliyet O(hücre), O(satır)
+# değil. Kategorik filtreler de yalnızca hücreleri süzer.
+#
+# Medyan ve çeyrekler toplanabilir ölçüler olmadığından her hücre ayrıca bir
+# quantile özeti (sketch.py) taşır; roll-up sırasında özetler birleştirilir.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+from filters import FILTER_COLUMNS
+from sketch import merge_sketches, sketch_from_values, sketch_quantile
+
+CUBE_DIMENSIONS = FILTER_COLUMNS
+CUBE_MEASURES = ['postings', 'count', 'sum', 'sumsq', 'min', 'max']
+
+
+def build_salary_cube(df):
+    """Boyut kombinasyonu başına maaş ölçüleri (bir hücre = bir kombinasyon)
+
+    Eksik boyut değerleri de kendi hücrelerinde tutulur; böylece boyutlardan
+    birine göre yapılan toplamlar diğer boyutlarda eksik olan ilanları
+    kaybetmez.
+    """
+    salary = df['salary_numeric'].astype('float64')
+    frame = pd.DataFrame({col: df[col] for col in CUBE_DIMENSIONS})
+    frame['salary'] = salary
+    frame['salary_sq'] = salary * salary
+
+    grouper = frame.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, sort=False)
+    cells = grouper.agg(
+        postings=('salary', 'size'),
+        count=('salary', 'count'),
+        sum=('salary', 'sum'),
+        sumsq=('salary_sq', 'sum'),
+        min=('salary', 'min'),
+        max=('salary', 'max'),
+    )
+    cells['sketch'] = _group_sketches(grouper.ngroup().to_numpy(), salary.to_numpy(), len(cells))
+    return cells.reset_index()
+
+
+def _object_column(values):
+    """Demetleri (özetleri) tek tek hücre değeri olarak tutan object dizisi"""
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
+
+
+def _group_sketches(group_ids, salary, n_groups):
+    """Satırları grup numarasına (0..n_groups-1) göre ayırıp grup başına maaş özeti çıkar"""
+    if n_groups == 0:
+        return _object_column([])
+    order = np.lexsort((salary, group_ids))
+    bounds = np.searchsorted(group_ids[order], np.arange(1, n_groups))
+    chunks = np.split(salary[order], bounds)
+    return _object_column([sketch_from_values(chunk) for chunk in chunks])
+
+
+def cube_sketch(cells):
+    """Hücrelerin tümünü kapsayan tek maaş özeti"""
+    return merge_sketches(cells['sketch'])
+
+
+def slice_cube(cells, filters):
+    """Kategorik filtrelere uyan hücreler (maaş aralığı burada uygulanamaz)"""
+    mask = np.ones(len(cells), dtype=bool)
+    for col in CUBE_DIMENSIONS:
+        selected = getattr(filters, col)
+        if selected:
+            mask &= cells[col].isin(selected).to_numpy()
+    return cells[mask]
+
+
+def rollup(cells, dims):
+    """Hücreleri verilen boyutlara göre topla; mean, std, median ve sketch sütunlarını ekle
+
+    Boyutlarından biri eksik ya da boş metin olan gruplar atlanır (sayfadaki
+    groupby'ların davranışıyla aynı). Gruplar kategori sırasındadır.
+    """
+    dims = list(dims)
+    valid = np.ones(len(cells), dtype=bool)
+    for col in dims:
+        valid &= (cells[col].notna() & (cells[col] != '')).to_numpy()
+
+    cells = cells[valid]
+    grouper = cells.groupby(dims, observed=True, sort=True)
+    grouped = grouper.agg(
+        postings=('postings', 'sum'),
+        count=('count', 'sum'),
+        sum=('sum', 'sum'),
+        sumsq=('sumsq', 'sum'),
+        min=('min', 'min'),
+        max=('max', 'max'),
+    )
+
+    count = grouped['count'].to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = grouped['sum'].to_numpy() / count
+        # Örneklem varyansı (ddof=1); yuvarlama kaynaklı küçük negatifler 0'a çekilir
+        var = (grouped['sumsq'].to_numpy() - count * mean * mean) / (count - 1)
+    grouped['mean'] = np.where(count > 0, mean, np.nan)
+    grouped['std'] = np.where(count > 1, np.sqrt(np.clip(var, 0, None)), np.nan)
+
+    # Grup başına hücre özetlerini birleştir
+    group_ids = grouper.ngroup().to_numpy()
+    order = np.argsort(group_ids, kind='stable')
+    bounds = np.searchsorted(group_ids[order], np.arange(1, len(grouped)))
+    cell_sketches = cells['sketch'].to_numpy()[order]
+    sketches = [merge_sketches(chunk) for chunk in np.split(cell_sketches, bounds)] if len(grouped) else []
+    grouped['median'] = [float(sketch_quantile(sketch, 0.5)) for sketch in sketches]
+    grouped['sketch'] = _object_column(sketches)
+    return grouped.reset_index()
@@ -0,0 +1,141 @@
+# =============================================================================
+# 🗂️ PLOTLY FİGÜR ÖNBELLEĞİ
+# =============================================================================
+# Plotly figürleri her yeniden çalıştırmada ve her oturum için baştan
+# kurulmaz: bölümlerin figür oluşturucuları (`build_*_figure`) yalnızca veri
+# anahtarı (dosya yolu, boyutu, değişiklik zamanı), global filtreler ve
+# bölüm kontrollerinin değerlerini argüman olarak alır ve `cached_figure`
+# ile sarılır. Figür ilk kez kurulduğunda JSON'a serileştirilip sözlük
+# olarak tüm oturumların paylaştığı, bayt bütçeli bir LRU önbelleğe konur.
+# Sonraki çağrılar Figure kurmaz: sözlük FigureSpec ile st.plotly_chart'a
+# verilir ve Streamlit onu doğrudan JSON'a yazar (plotly.express, trace
+# doğrulaması, Figure kurulumu ve to_dict kopyası atlanır). Bütçe, figürlerin
+# JSON uzunluğuyla ölçülür; aşılınca en uzun süredir kullanılmayan figürler
+# atılır. Önbellek bir cache_resource olduğu için st.cache_resource.clear()
+# ile birlikte temizlenir.
+# =============================================================================
+
+import functools
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io
+import streamlit as st
+
+from instrumentation import stage
+
+# Figür JSON'ları için toplam bellek bütçesi (ortam değişkeni ile değiştirilebilir)
+FIGURE_CACHE_MB = float(os.environ.get('JOBS_FIGURE_CACHE_MB', 64))
+
+
+class FigureStore:
+    """Figür sözlüklerinin bayt bütçeli (JSON uzunluğu), iş parçacığı güvenli LRU önbelleği"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # anahtar -> (figür sözlüğü, JSON uzunluğu); en eski kullanılan başta
+        self._building = {}            # anahtar -> kilit (aynı figür aynı anda bir kez kurulur)
+        self._lock = threading.Lock()
+
+    def _lookup(self, key):
+        """Kilit altında çağrılır: varsa sözlüğü döndür ve en yeni kullanılan yap"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def get_or_build(self, key, build):
+        """key'in figür sözlüğünü döndür; yoksa build() -> (sözlük, JSON uzunluğu) ile üretip önbelleğe ekle"""
+        with self._lock:
+            spec = self._lookup(key)
+            if spec is not None:
+                return spec
+            key_lock = self._building.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                spec = self._lookup(key)
+            if spec is None:
+                spec, size = build()
+                self._store(key, spec, size)
+        with self._lock:
+            self._building.pop(key, None)
+        return spec
+
+    def _store(self, key, spec, size):
+        with self._lock:
+            self.misses += 1
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (spec, size)
+            self.n_bytes += size
+            while self.n_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.n_bytes -= evicted
+
+    def stats(self):
+        """(figür sayısı, toplam bayt, isabet, ıska)"""
+        with self._lock:
+            return len(self._entries), self.n_bytes, self.hits, self.misses
+
+
+@st.cache_resource(show_spinner=False)
+def figure_store():
+    """Süreç genelinde paylaşılan figür önbelleği"""
+    return FigureStore(int(FIGURE_CACHE_MB * 2**20))
+
+
+class FigureSpec(go.Figure):
+    """Hazır figür sözlüğünü Figure olarak taşıyan salt okunur sarmalayıcı
+
+    st.plotly_chart Figure'ı to_dict ile sözlüğe çevirip JSON'a yazar;
+    FigureSpec bu sözlüğü kopyalamadan verir, trace nesneleri hiç kurulmaz.
+    Yalnızca to_dict / to_plotly_json / to_json desteklenir; sözlük
+    önbellekte oturumlar arasında paylaşıldığı için değiştirilmemelidir.
+    """
+
+    def __init__(self, spec):
+        # Figure.__init__ bilerek çağrılmaz (trace / layout nesneleri kurulmaz)
+        self._spec = spec
+
+    def to_dict(self):
+        return self._spec
+
+    def to_plotly_json(self):
+        return self._spec
+
+    def to_json(self, *args, **kwargs):
+        return plotly.io.to_json(self._spec, *args, validate=False, **kwargs)
+
+
+def figure_from_json(text):
+    """JSON'dan figür (doğrulama yapılmaz; JSON doğrulanmış bir figürden üretildi)"""
+    return FigureSpec(json.loads(text))
+
+
+def cached_figure(build):
+    """Figür oluşturucuyu paylaşılan JSON önbelleğiyle sar
+
+    build(data_key, filters, *kontroller) modül düzeyinde bir fonksiyon
+    olmalı ve figürü yalnızca argümanlarından üretmelidir; önbellek anahtarı
+    fonksiyon adı ve argümanlardır.
+    """
+    name = f'{build.__module__}.{build.__qualname__}'
+
+    def build_spec(args, kwargs):
+        with stage(build.__name__):
+            text = build(*args, **kwargs).to_json()
+        return json.loads(text), len(text)
+
+    @functools.wraps(build)
+    def wrapper(*args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        return FigureSpec(figure_store().get_or_build(key, lambda: build_spec(args, kwargs)))
+    return wrapper
@@ -0,0 +1,114 @@
+# =============================================================================
+# 🎛️ GLOBAL FİLTRELER
+# =============================================================================
+# Kıdem, çalışma modeli, sektör, şirket merkezi ve maaş aralığı filtreleri.
+# Kategorik sütunların kodları veri dosyası başına bir kez çıkarılır; bir
+# seçim, kategori başına izin tablosundan (allowed[codes]) tek bir gather ile
+# maskeye çevrilir ve maskeler bitwise AND ile birleştirilir. Metin
+# karşılaştırması yapılmaz.
+# =============================================================================
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ['seniority_level', 'status', 'industry', 'headquarter']
+
+
+class Filters(NamedTuple):
+    """Seçili filtre değerleri (boş demet = kısıt yok); önbellek anahtarı olarak kullanılır"""
+    seniority_level: tuple = ()
+    status: tuple = ()
+    industry: tuple = ()
+    headquarter: tuple = ()
+    salary_range: tuple = None  # (alt, üst) veya None
+
+    @property
+    def active(self):
+        return any(getattr(self, col) for col in FILTER_COLUMNS) or self.salary_range is not None
+
+
+NO_FILTERS = Filters()
+
+
+class CategoryCodes(NamedTuple):
+    """Bir kategorik sütunun kodları ve kategori adları"""
+    codes: np.ndarray       # int32, eksik değer için -1
+    categories: np.ndarray  # kod -> kategori adı
+    valid: np.ndarray       # kod -> kategori boş metin değil mi
+
+
+class FilterIndex(NamedTuple):
+    """Filtre maskelerini üretmek için önceden çıkarılmış diziler"""
+    columns: dict           # sütun adı -> CategoryCodes
+    salary: np.ndarray      # float64 maaş (eksik = NaN)
+    n_rows: int
+
+
+def category_codes(series):
+    """Sütunu (gerekirse kategoriye çevirerek) kodlarına ayır"""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype('category')
+    categories = np.asarray(series.cat.categories, dtype=object)
+    valid = np.array([category != '' for category in categories], dtype=bool)
+    return CategoryCodes(series.cat.codes.to_numpy(dtype=np.int32), categories, valid)
+
+
+def has_value(series):
+    """Boş ya da boş metin olmayan satırların maskesi
+
+    Kategorik sütunlarda karşılaştırma kategori başına bir kez yapılır,
+    satırlar yalnızca kodlar üzerinden taranır.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        valid = np.append(np.asarray(series.cat.categories, dtype=object) != '', False)
+        return pd.Series(valid[codes], index=series.index)
+    return series.notna() & (series != '')
+
+
+def build_filter_index(df):
+    """Filtre sütunlarının kodlarını ve maaş dizisini çıkar (veri dosyası başına bir kez)"""
+    return FilterIndex(
+        columns={col: category_codes(df[col]) for col in FILTER_COLUMNS},
+        salary=df['salary_numeric'].to_numpy(dtype=np.float64, na_value=np.nan),
+        n_rows=len(df),
+    )
+
+
+def filter_options(index, column):
+    """Bir filtre sütununun seçilebilir (boş olmayan) değerleri"""
+    column_codes = index.columns[column]
+    return column_codes.categories[column_codes.valid].tolist()
+
+
+def salary_bounds(index):
+    """Maaş filtresinin (alt, üst) sınırları (maaş verisi yoksa None)"""
+    salary = index.salary[np.isfinite(index.salary)]
+    if len(salary) == 0:
+        return None
+    return int(np.floor(salary.min())), int(np.ceil(salary.max()))
+
+
+def filter_mask(index, filters):
+    """Filtrelerin tümünü sağlayan satırların maskesi (filtre yoksa None)"""
+    if not filters.active:
+        return None
+
+    mask = np.ones(index.n_rows, dtype=bool)
+    for col in FILTER_COLUMNS:
+        selected = getattr(filters, col)
+        if not selected:
+            continue
+        column_codes = index.columns[col]
+        # Son eleman -1 (eksik değer) kodu için: her zaman dışarıda
+        allowed = np.zeros(len(column_codes.categories) + 1, dtype=bool)
+        allowed[:-1] = np.isin(column_codes.categories, list(selected))
+        mask &= allowed[column_codes.codes]
+
+    if filters.salary_range is not None:
+        low, high = filters.salary_range
+        # NaN karşılaştırmaları False döner; maaşı olmayan ilanlar elenir
+        mask &= (index.salary >= low) & (index.salary <= high)
+    return mask
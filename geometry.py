@@ -0,0 +1,178 @@
+# =============================================================================
+# 📦 ÖNCEDEN HESAPLANMIŞ KUTU VE VIOLIN GEOMETRİSİ
+# =============================================================================
+# Kutu ve violin grafikleri ham maaş dizileri yerine quantile özetlerinden
+# (sketch.py) sunucu tarafında hesaplanan şekillerle çizilir: kutular
+# Plotly'nin q1 / median / q3 / lowerfence / upperfence modunda, violinler
+# KDE eğrisinin (kde.py, gruplu FFT) dolgulu çokgeni olarak gönderilir.
+# Yalnızca aykırı değerler nokta olarak eklenir; figür boyutu ilan sayısından
+# bağımsızdır. Koordinatlar float32 olarak gönderilir (grafik çözünürlüğü
+# için yeterli).
+# =============================================================================
+
+from typing import NamedTuple
+
+import numpy as np
+import plotly.graph_objects as go
+
+from kde import grouped_kde, silverman_bandwidth
+from sketch import BoxStats, box_stats, sketch_mean_std, sketch_outside, sketch_quantile
+
+DENSITY_POINTS = 100
+
+
+class BoxGeometry(NamedTuple):
+    """Kutu istatistikleri ve sınırların dışında kalan değerler"""
+    stats: BoxStats
+    outliers: np.ndarray
+
+
+class DensityCurve(NamedTuple):
+    """KDE eğrisi (ızgara ve yoğunluk) ve dağılımın ortalaması"""
+    grid: np.ndarray
+    density: np.ndarray
+    mean: float
+
+
+def box_geometry(sketch):
+    """Özetten kutu istatistikleri ve aykırı noktalar"""
+    stats = box_stats(sketch)
+    return BoxGeometry(stats, sketch_outside(sketch, stats.lower_fence, stats.upper_fence))
+
+
+def sketch_bandwidth(sketch):
+    """Özetten Silverman bant genişliği (Plotly violin ile aynı kural)"""
+    mean, std = sketch_mean_std(sketch)
+    q1, q3 = sketch_quantile(sketch, [0.25, 0.75])
+    bandwidth = silverman_bandwidth(std, q3 - q1, sketch.count)
+    if not np.isfinite(bandwidth) or bandwidth <= 0:
+        # Tek değerli ya da sabit gruplar: merkezin %1'i genişliğinde dar bir tepe
+        bandwidth = 0.01 * max(abs(mean), 1.0)
+    return bandwidth
+
+
+def density_curves(sketches, n_points=DENSITY_POINTS):
+    """Özetlerin merkezlerinden gruplu FFT KDE (tek çağrı); boş özetler için None
+
+    Yoğunluklar ortak ince ızgarada hesaplanır, sonra her grubun Plotly'deki
+    'soft' aralığına (min - 2 bant ... max + 2 bant) n_points noktayla
+    örneklenir.
+    """
+    curves = [None] * len(sketches)
+    filled = [i for i, sketch in enumerate(sketches) if sketch.count > 0]
+    if not filled:
+        return curves
+
+    groups = [sketches[i] for i in filled]
+    bandwidths = np.array([sketch_bandwidth(sketch) for sketch in groups])
+    codes = np.repeat(np.arange(len(groups)), [len(sketch.means) for sketch in groups])
+    grid, densities = grouped_kde(
+        codes,
+        np.concatenate([sketch.means for sketch in groups]),
+        len(groups),
+        bandwidths,
+        weights=np.concatenate([sketch.weights for sketch in groups]),
+    )
+
+    for i, sketch, bandwidth, density in zip(filled, groups, bandwidths, densities):
+        span = np.linspace(sketch.min - 2 * bandwidth, sketch.max + 2 * bandwidth, n_points)
+        curves[i] = DensityCurve(span, np.interp(span, grid, density), sketch_mean_std(sketch)[0])
+    return curves
+
+
+def density_curve(sketch, n_points=DENSITY_POINTS):
+    """Tek özet için KDE eğrisi (boş özet için None)"""
+    return density_curves([sketch], n_points)[0]
+
+
+# =============================================================================
+# 🎨 PLOTLY İZLERİ
+# =============================================================================
+
+def _oriented(position, values, orientation):
+    """Konum ekseni ve değer ekseni koordinatlarını yönlendirmeye göre (x, y) yap"""
+    return (position, values) if orientation == 'v' else (values, position)
+
+
+def box_traces(geometry, name, color, position=None, orientation='v', **box_kwargs):
+    """Önceden hesaplanmış kutu ve aykırı değer noktaları (konum verilmezse kategori adı)"""
+    stats = geometry.stats
+    if not np.isfinite(stats.median):
+        return []
+    if position is None:
+        position = name
+    x, y = _oriented([position], None, orientation)
+    traces = [go.Box(
+        x=x, y=y,
+        q1=[stats.q1], median=[stats.median], q3=[stats.q3],
+        lowerfence=[stats.lower_whisker], upperfence=[stats.upper_whisker],
+        name=name,
+        orientation=orientation,
+        boxpoints=False,
+        marker_color=color,
+        line_color=color,
+        **box_kwargs
+    )]
+    if len(geometry.outliers):
+        # Konum ekseni x0/y0 + sıfır adımla verilir: kategori adı nokta başına tekrarlanmaz
+        values = geometry.outliers.astype(np.float32)
+        coords = dict(x0=position, dx=0, y=values) if orientation == 'v' else dict(y0=position, dy=0, x=values)
+        traces.append(go.Scatter(
+            **coords,
+            mode='markers',
+            marker=dict(color=color, size=6),
+            name=name,
+            showlegend=False,
+        ))
+    return traces
+
+
+def violin_traces(curve, geometry, name, color, position, half_width=0.4):
+    """Dikey violin: en geniş noktası half_width olan KDE çokgeni, içte kutu ve aykırı noktalar"""
+    if curve is None:
+        return []
+    offset = curve.density / curve.density.max() * half_width
+    traces = [go.Scatter(
+        x=np.concatenate([position + offset, (position - offset)[::-1]]).astype(np.float32),
+        y=np.concatenate([curve.grid, curve.grid[::-1]]).astype(np.float32),
+        fill='toself',
+        mode='lines',
+        line=dict(color=color, width=1.5),
+        opacity=0.6,
+        name=name,
+        showlegend=False,
+        hoverinfo='skip',
+    )]
+    return traces + box_traces(geometry, name, color, position, width=half_width / 2, showlegend=False)
+
+
+def ridge_traces(curve, name, color, position, height=0.75, opacity=0.7):
+    """Yatay, tek taraflı (ridgeline) yoğunluk eğrisi ve ortalama çizgisi"""
+    if curve is None:
+        return []
+    scale = height / curve.density.max()
+    mean_height = np.interp(curve.mean, curve.grid, curve.density) * scale
+    return [
+        # Eğri boyunca üst kenar + taban çizgisinin iki ucu; çokgeni Plotly kapatır
+        go.Scatter(
+            x=np.r_[curve.grid, curve.grid[-1], curve.grid[0]].astype(np.float32),
+            y=np.r_[position + curve.density * scale, position, position].astype(np.float32),
+            fill='toself',
+            mode='lines',
+            line=dict(color=color),
+            fillcolor=color,
+            opacity=opacity,
+            name=name,
+            showlegend=False,
+            hoverinfo='skip',
+        ),
+        go.Scatter(
+            x=[curve.mean, curve.mean],
+            y=[position, position + mean_height],
+            mode='lines',
+            line=dict(color=color, width=2),
+            name=name,
+            showlegend=False,
+            hovertemplate=f'<b>{name}</b><br>Ortalama: €%{{x:,.0f}}<extra></extra>',
+        ),
+    ]
@@ -0,0 +1,140 @@
+# =============================================================================
+# 📊 SUNUCU TARAFI HİSTOGRAMLAR
+# =============================================================================
+# Histogramlar np.histogram ile sunucuda sayılır ve önceden kutulanmış çubuk
+# izleri olarak gönderilir; figür boyutu satır sayısıyla değil kutu sayısıyla
+# orantılıdır. Kutu sınırları değişkenin quantile özetinden (min / max /
+# çeyrekler) çıkarılır: varsayılan olarak Plotly'nin otomatik kutulamasına
+# benzer "yuvarlak" genişlikler, istenirse Freedman–Diaconis kuralı.
+#
+# Önce / sonra karşılaştırmalarında tek bir ince sayım yapılır: kutu genişliği
+# IQR sınırları içindeki aralığa göre seçilir, "sonra" histogramı aykırı
+# değer kutuları çıkarılarak elde edilir ve "önce" histogramı komşu kutular
+# birleştirilerek kabalaştırılır.
+# =============================================================================
+
+from typing import NamedTuple
+
+import numpy as np
+import plotly.graph_objects as go
+
+from sketch import box_stats, sketch_quantile
+
+BIN_METHODS = ('nice', 'fd')
+DEFAULT_MAX_BINS = 50
+MAX_FD_BINS = 200
+MAX_TOTAL_BINS = 1000  # uzak aykırı değerler ince kutu sayısını bu sınırın üzerine çıkaramaz
+_NICE_STEPS = (1, 2, 5)
+
+
+class Histogram(NamedTuple):
+    """Kutu sınırları (n+1) ve kutu başına sayılar (n)"""
+    edges: np.ndarray
+    counts: np.ndarray
+
+
+def _nice_width(raw_width):
+    """raw_width'ten küçük olmayan en yakın 1 / 2 / 5 × 10^k genişlik"""
+    magnitude = 10.0 ** np.floor(np.log10(raw_width))
+    for step in _NICE_STEPS:
+        if step * magnitude >= raw_width:
+            return step * magnitude
+    return 10 * magnitude
+
+
+def _aligned_edges(low, high, width):
+    """Genişliğin katlarına hizalanmış, [low, high] aralığını kapsayan sınırlar"""
+    start = np.floor(low / width) * width
+    n_bins = max(1, int(np.ceil((high - start) / width)))
+    # Üst sınıra tam denk gelen değer de son kutuya düşsün
+    if start + n_bins * width <= high:
+        n_bins += 1
+    return start + width * np.arange(n_bins + 1)
+
+
+def bin_edges(sketch, max_bins=DEFAULT_MAX_BINS, method='nice', inlier_width=False):
+    """Özetten kutu sınırları (boş özet için None)
+
+    'nice': en fazla max_bins kutu, 1 / 2 / 5 × 10^k genişlik.
+    'fd': Freedman–Diaconis genişliği 2 × IQR × n^(-1/3) (en fazla MAX_FD_BINS kutu).
+    inlier_width=True ise 'nice' genişliği yalnızca IQR sınırları içindeki
+    aralığa göre seçilir; sınırlar yine tüm değerleri kapsar.
+    """
+    if sketch.count == 0:
+        return None
+    low, high = sketch.min, sketch.max
+    if high <= low:
+        return np.array([low - 0.5, high + 0.5])
+
+    if method == 'fd':
+        width = (high - low) / max_bins
+        q1, q3 = sketch_quantile(sketch, [0.25, 0.75])
+        if q3 > q1:
+            width = max(2 * (q3 - q1) * sketch.count ** (-1 / 3), (high - low) / MAX_FD_BINS)
+        return _aligned_edges(low, high, width)
+
+    span_low, span_high = low, high
+    if inlier_width:
+        stats = box_stats(sketch)
+        span_low, span_high = max(low, stats.lower_fence), min(high, stats.upper_fence)
+        if span_high <= span_low:
+            span_low, span_high = low, high
+    width = max(_nice_width((span_high - span_low) / max_bins), _nice_width((high - low) / MAX_TOTAL_BINS))
+    return _aligned_edges(low, high, width)
+
+
+def histogram(values, edges):
+    """Değerlerin verilen sınırlara göre kutu sayıları (NaN'lar atlanır)"""
+    values = np.asarray(values, dtype=np.float64)
+    counts, _ = np.histogram(values[~np.isnan(values)], bins=edges)
+    return Histogram(edges, counts)
+
+
+def subtract_histograms(hist, other):
+    """Aynı sınırlara sahip iki histogramın farkı (ör. tümü − aykırı değerler)"""
+    return Histogram(hist.edges, hist.counts - other.counts)
+
+
+def trim_empty(hist):
+    """Baştaki ve sondaki boş kutuları at"""
+    filled = np.flatnonzero(hist.counts)
+    if len(filled) == 0:
+        return hist
+    first, last = filled[0], filled[-1] + 1
+    return Histogram(hist.edges[first:last + 1], hist.counts[first:last])
+
+
+def coarsen(hist, max_bins=DEFAULT_MAX_BINS):
+    """Eşit genişlikli histogramın komşu kutularını 1 / 2 / 5 × 10^k'lık gruplarla birleştir"""
+    n_bins = len(hist.counts)
+    factor = 1
+    while n_bins > factor * max_bins:
+        magnitude = 10 ** int(np.log10(factor))
+        factor = next(
+            step * magnitude for step in (*_NICE_STEPS, 10)
+            if step * magnitude > factor
+        )
+    if factor == 1:
+        return hist
+
+    # Son grup eksikse sınırlar aynı genişlikle uzatılır (boş kutularla doldurulur)
+    n_groups = -(-n_bins // factor)
+    width = hist.edges[1] - hist.edges[0]
+    counts = np.zeros(n_groups * factor, dtype=hist.counts.dtype)
+    counts[:n_bins] = hist.counts
+    edges = hist.edges[0] + factor * width * np.arange(n_groups + 1)
+    return Histogram(edges, counts.reshape(n_groups, factor).sum(axis=1))
+
+
+def histogram_trace(hist, color, name=''):
+    """Önceden kutulanmış histogram çubukları"""
+    edges = hist.edges
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=hist.counts,
+        width=np.diff(edges),
+        name=name,
+        marker=dict(color=color, line_width=0),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        hovertemplate='%{customdata[0]:,.0f} – %{customdata[1]:,.0f}<br>Frekans: %{y}<extra></extra>',
+    )
@@ -0,0 +1,56 @@
+# =============================================================================
+# 🖼️ ÖNBELLEKLİ MATPLOTLIB GÖRSELLERİ
+# =============================================================================
+# Seaborn / Matplotlib grafikleri her yeniden çalıştırmada çizilmez: bölümler
+# grafiği veri anahtarı, filtreler ve tema başına bir kez PNG baytlarına
+# çevirip önbellekler. Şekiller pyplot yerine doğrudan Figure nesnesiyle
+# oluşturulur (pyplot'un global durumuna dokunulmaz). Matplotlib ve Seaborn
+# yalnızca bir görsel ilk kez üretilirken içe aktarılır.
+# =============================================================================
+
+import io
+
+from instrumentation import stage
+
+THEMES = {
+    'dark': {
+        'background': '#0e1117',
+        'text': 'white',
+        'accent': '#00d4ff',
+        'grid': '#3d4a5c',
+        'edge': '#1a1f2e',
+    },
+}
+DEFAULT_THEME = 'dark'
+
+# st.pyplot'un varsayılan kayıt ayarlarıyla aynı
+PNG_DPI = 200
+
+# st.image bundan geniş görselleri her çizimde yeniden boyutlandırıp kodlar;
+# geniş figürler bu genişliğe sığacak DPI ile kaydedilir
+MAX_PNG_WIDTH = 1460
+
+
+def new_figure(figsize, theme=DEFAULT_THEME):
+    """Tema arka planıyla tek eksenli Matplotlib figürü"""
+    from matplotlib.figure import Figure
+
+    background = THEMES[theme]['background']
+    fig = Figure(figsize=figsize)
+    fig.patch.set_facecolor(background)
+    ax = fig.subplots()
+    ax.set_facecolor(background)
+    return fig, ax
+
+
+def figure_png(fig):
+    """Figürü PNG baytlarına çevir"""
+    from matplotlib import rcParams
+
+    buffer = io.BytesIO()
+    with stage('Matplotlib PNG'):
+        # bbox_inches='tight' her iki yana savefig.pad_inches kadar boşluk ekler
+        width_inches = fig.get_tightbbox().width + 2 * rcParams['savefig.pad_inches']
+        dpi = min(PNG_DPI, int(MAX_PNG_WIDTH / width_inches))
+        fig.savefig(buffer, format='png', bbox_inches='tight', dpi=dpi)
+    return buffer.getvalue()
@@ -0,0 +1,76 @@
+# =============================================================================
+# 🌊 PARÇALI (STREAMING) CSV OKUMA
+# =============================================================================
+# Çok büyük ilan dışa aktarımları tek seferde okunmaz: CSV parça parça
+# okunur, her parça ayrı ayrı ön işlenir (maaş/büyüklük/beceri ayrıştırma,
+# küçültme, kategorikleştirme) ve sıkıştırılmış parçalar birleştirilir.
+# =============================================================================
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from parsing import prepare_dataset
+from startup import startup_phase
+
+DEFAULT_CHUNKSIZE = 50_000
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """Okunan veri, tanımlanan bellek bütçesini aştı"""
+
+
+def iter_prepared_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """CSV'yi parça parça okuyup her parçayı ön işlenmiş olarak döndür"""
+    # Tüm ham sütunlar metin: parçalar arasında tip çıkarımı farklılaşmasın
+    with pd.read_csv(path, chunksize=chunksize, dtype=str) as reader:
+        while True:
+            with startup_phase('CSV okuma'):
+                chunk = next(reader, None)
+            if chunk is None:
+                return
+            with startup_phase('Ön işleme'):
+                prepared = prepare_dataset(chunk)
+            yield prepared
+
+
+def _concat_column(pieces):
+    """Aynı sütunun parçalarını birleştir (kategorikler birleşik kategori ile)"""
+    if all(isinstance(p.dtype, pd.CategoricalDtype) for p in pieces):
+        return pd.Series(union_categoricals(pieces, sort_categories=True), name=pieces[0].name)
+    return pd.concat(pieces, ignore_index=True)
+
+
+def concat_prepared(chunks):
+    """Ön işlenmiş parçaları sütun sütun birleştir
+
+    Her sütun birleştirildikçe parçalardaki kopyası bırakılır; böylece tepe
+    bellek kullanımı tüm veri + tek sütun kadar kalır.
+    """
+    if not chunks:
+        raise ValueError("Birleştirilecek parça yok")
+    columns = list(chunks[0].columns)
+    result = {}
+    for col in columns:
+        pieces = [chunk.pop(col) for chunk in chunks]
+        result[col] = _concat_column(pieces).reset_index(drop=True)
+        del pieces
+    return pd.DataFrame(result, columns=columns)
+
+
+def load_prepared_streaming(path, chunksize=DEFAULT_CHUNKSIZE, memory_budget_bytes=None):
+    """CSV'yi parça parça okuyup ön işlenmiş tek bir DataFrame döndür
+
+    memory_budget_bytes verilirse, biriken parçaların toplam boyutu bu
+    sınırı aştığında işlem MemoryBudgetExceeded ile durdurulur.
+    """
+    chunks = []
+    used = 0
+    for chunk in iter_prepared_chunks(path, chunksize):
+        used += int(chunk.memory_usage(deep=True).sum())
+        if memory_budget_bytes is not None and used > memory_budget_bytes:
+            raise MemoryBudgetExceeded(
+                f"'{path}' için bellek bütçesi aşıldı: "
+                f"{used / 2**20:,.1f} MB > {memory_budget_bytes / 2**20:,.1f} MB"
+            )
+        chunks.append(chunk)
+    return concat_prepared(chunks)
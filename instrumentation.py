@@ -0,0 +1,382 @@
+# =============================================================================
+# 📏 BÖLÜM PERFORMANS ÖLÇÜMÜ
+# =============================================================================
+# Her bölüm fragment'ının çizimi için duvar saati süresi, CPU süresi (betik
+# iş parçacığı), tarayıcıya gönderilen mesaj baytları (toplam ve grafik
+# öğeleri) ve isteğe bağlı olarak tracemalloc tepe bellek artışı kaydedilir.
+# Önbellekli yükleyiciler ve hesaplama fonksiyonları `instrumented` ile
+# aşama olarak eklenir; yalnızca önbellek ıskalandığında çalıştıkları için
+# aşama listesi o çizimde neyin yeniden hesaplandığını gösterir. Bölüm
+# içindeki fragment'lar iç içe aşama olarak, tek başına yeniden
+# çalıştıklarında kendi kayıtları olarak görünür.
+#
+# Ölçümün maliyeti çizim başına birkaç sayaç okuması ve mesaj başına bir
+# ByteSize çağrısıdır. Mesaj baytları Streamlit'in özel
+# ScriptRunContext._enqueue metodu sarılarak sayılır; bu metot (ya da mesaj
+# API'si) bir Streamlit sürümünde değişirse sayım bir uyarıyla kapanır,
+# bölüm çizimi ve süre ölçümleri etkilenmez. tracemalloc tüm süreçteki bellek ayırmalarını
+# yavaşlattığı için varsayılan olarak kapalıdır; açıkken tepe değer süreç
+# genelidir (eşzamanlı oturumların ayırmaları da sayılır). st.image ile
+# gösterilen PNG'ler medya dosyası olarak ayrı HTTP isteğiyle indirilir;
+# grafik baytlarına yalnızca görsel öğesinin mesajı girer.
+#
+# Ortam değişkenleri:
+#     JOBS_PERF_PANEL=1           performans paneli (ya da adreste ?perf=1)
+#     JOBS_PERF_TRACEMALLOC=1     tepe bellek ölçümü
+#     JOBS_PERF_LOG=1             her kaydı tek satır JSON olarak logla
+#     JOBS_PERF_PROMETHEUS=yol    Prometheus textfile biçiminde metrik dosyası
+#     JOBS_PERF_PROMETHEUS_INTERVAL=sn  dosyanın en sık yazılma aralığı (15;
+#                                 son durum süreç kapanırken de yazılır)
+# =============================================================================
+
+import atexit
+import functools
+import json
+import logging
+import math
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+PANEL_ENV = 'JOBS_PERF_PANEL'
+TRACEMALLOC_ENV = 'JOBS_PERF_TRACEMALLOC'
+LOG_ENV = 'JOBS_PERF_LOG'
+PROMETHEUS_ENV = 'JOBS_PERF_PROMETHEUS'
+PROMETHEUS_INTERVAL_ENV = 'JOBS_PERF_PROMETHEUS_INTERVAL'
+DEFAULT_PROMETHEUS_INTERVAL_S = 15.0
+
+# Süreçte saklanan son kayıt sayısı (tüm oturumlar)
+HISTORY_SIZE = 500
+
+# Grafik sayılan Streamlit öğe türleri (Element.type)
+FIGURE_ELEMENTS = frozenset({
+    'plotly_chart', 'imgs', 'vega_lite_chart', 'deck_gl_json_chart', 'graphviz_chart', 'echarts_chart',
+})
+
+
+class Stage(NamedTuple):
+    name: str
+    depth: int       # iç içe aşamalarda 1, 2, ...
+    wall_s: float
+    cpu_s: float
+
+
+class SectionRecord(NamedTuple):
+    section: str
+    session_id: str
+    timestamp: float     # time.time()
+    wall_s: float
+    cpu_s: float
+    peak_bytes: float    # tracemalloc kapalıysa NaN
+    payload_bytes: int   # bölümün gönderdiği tüm mesajlar
+    figure_bytes: int    # FIGURE_ELEMENTS öğelerinin mesajları
+    n_figures: int
+    stages: tuple        # Stage'ler, başlama sırasıyla
+
+
+class _Run:
+    """Süren bir bölüm ölçümünün sayaçları"""
+
+    def __init__(self):
+        self.depth = 0
+        self.stages = []
+        self.payload_bytes = 0
+        self.figure_bytes = 0
+        self.n_figures = 0
+
+
+_lock = threading.Lock()
+_local = threading.local()
+_history = deque(maxlen=HISTORY_SIZE)
+_totals = {}  # bölüm -> [çizim, duvar s, CPU s, yük bayt, grafik bayt, son duvar s, son tepe bayt]
+_payload_counting = True  # mesaj sayımı bu Streamlit sürümünde çalışıyor mu
+_prometheus = {'last_write': -math.inf, 'pending': False}
+
+
+def panel_enabled(query_params=None):
+    """Performans paneli açık mı (ortam değişkeni ya da ?perf=1)"""
+    return bool(os.environ.get(PANEL_ENV)) or (query_params is not None and query_params.get('perf') == '1')
+
+
+def _script_context():
+    """Betik çalıştırma bağlamı (Streamlit çalışma zamanı dışında None)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def _disable_payload_counting(reason):
+    """Mesaj sayımını süreç boyunca kapat (bir kez uyarır)"""
+    global _payload_counting
+    if _payload_counting:
+        _payload_counting = False
+        logger.warning("Bölüm mesaj baytları ölçülemiyor, sayım kapatıldı: %s", reason)
+
+
+def _hook_enqueue(ctx):
+    """Bağlamın özgün enqueue metodu; sarılamıyorsa None"""
+    if ctx is None or not _payload_counting:
+        return None
+    enqueue = getattr(ctx, '_enqueue', None)
+    if not callable(enqueue):
+        _disable_payload_counting('ScriptRunContext._enqueue bulunamadı')
+        return None
+    return enqueue
+
+
+def _counting(enqueue, run):
+    """Gönderilen mesajların baytlarını run'a ekleyen enqueue sarmalayıcısı"""
+    def counted(msg):
+        if _payload_counting:
+            try:
+                size = msg.ByteSize()
+                figure = (
+                    msg.WhichOneof('type') == 'delta'
+                    and msg.delta.WhichOneof('type') == 'new_element'
+                    and msg.delta.new_element.WhichOneof('type') in FIGURE_ELEMENTS
+                )
+            except (AttributeError, TypeError, ValueError) as exc:
+                _disable_payload_counting(exc)
+            else:
+                run.payload_bytes += size
+                if figure:
+                    run.figure_bytes += size
+                    run.n_figures += 1
+        return enqueue(msg)
+    return counted
+
+
+@contextmanager
+def stage(name):
+    """Süren bölüm ölçümüne aşama ekle (ölçüm yoksa hiçbir şey yapmaz)"""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        yield
+        return
+    run.depth += 1
+    depth = run.depth
+    index = len(run.stages)
+    run.stages.append(None)  # başlama sırasını korumak için yer tut
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        run.stages[index] = Stage(name, depth, time.perf_counter() - wall, time.thread_time() - cpu)
+        run.depth -= 1
+
+
+def instrumented(func):
+    """Fonksiyon çağrısını aşama olarak ölç; önbellek dekoratörünün altına konur"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with stage(func.__name__):
+            result = func(*args, **kwargs)
+        observer = getattr(_local, 'observer', None)
+        if observer is not None:
+            observer(func, args, kwargs, result)
+        return result
+    return wrapper
+
+
+@contextmanager
+def observe_results(observer):
+    """Bu iş parçacığında instrumented fonksiyonların sonuçlarını observer(func, args, kwargs, sonuç) ile bildir
+
+    Yalnızca önbellek ıskalanıp fonksiyon gerçekten çalıştığında çağrılır
+    (ön çizim derlemesi hesaplanan tabloları bu yolla toplar).
+    """
+    previous = getattr(_local, 'observer', None)
+    _local.observer = observer
+    try:
+        yield
+    finally:
+        _local.observer = previous
+
+
+@contextmanager
+def measure_section(section):
+    """Bölüm çizimini ölçüp kaydet; başka bir ölçümün içindeyse aşama olarak ekle
+
+    Dekoratör olarak da kullanılır (@st.fragment'ın altına).
+    """
+    if getattr(_local, 'run', None) is not None:
+        with stage(section):
+            yield
+        return
+
+    run = _Run()
+    ctx = _script_context()
+    enqueue = _hook_enqueue(ctx)
+    if enqueue is not None:
+        ctx._enqueue = _counting(enqueue, run)
+    if os.environ.get(TRACEMALLOC_ENV) and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    _local.run = run
+    wall, cpu = time.perf_counter(), time.thread_time()
+    completed = False
+    try:
+        yield
+        completed = True
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+        _local.run = None
+        if enqueue is not None:
+            ctx._enqueue = enqueue
+        # st.rerun / st.stop ile yarıda kalan çizimler kaydedilmez
+        if completed:
+            peak = tracemalloc.get_traced_memory()[1] - baseline if tracing else math.nan
+            _record(SectionRecord(
+                section, getattr(ctx, 'session_id', ''), time.time(), wall, cpu, peak,
+                run.payload_bytes, run.figure_bytes, run.n_figures, tuple(run.stages),
+            ))
+
+
+def _record(record):
+    """Kaydı geçmişe ve toplamlara ekle, istenen dışa aktarımları yap"""
+    with _lock:
+        _history.append(record)
+        totals = _totals.setdefault(record.section, [0, 0.0, 0.0, 0, 0, 0.0, math.nan])
+        totals[0] += 1
+        totals[1] += record.wall_s
+        totals[2] += record.cpu_s
+        totals[3] += record.payload_bytes
+        totals[4] += record.figure_bytes
+        totals[5] = record.wall_s
+        totals[6] = record.peak_bytes
+    if os.environ.get(LOG_ENV):
+        _log_record(record)
+    if os.environ.get(PROMETHEUS_ENV):
+        _flush_prometheus(force=False)
+
+
+def recent_records(session_id=None, limit=20):
+    """Son kayıtlar (yeniden eskiye); session_id verilirse yalnızca o oturumun"""
+    with _lock:
+        records = list(_history)
+    if session_id is not None:
+        records = [record for record in records if record.session_id == session_id]
+    return records[::-1][:limit]
+
+
+def stage_rows(record):
+    """(aşama, duvar ms, CPU ms) satırları; iç içe aşamalar girintili, son satır aşama dışı kalan süre"""
+    rows = [
+        ('\u00a0' * 4 * (stage.depth - 1) + ('↳ ' if stage.depth > 1 else '') + stage.name,
+         stage.wall_s * 1e3, stage.cpu_s * 1e3)
+        for stage in record.stages
+    ]
+    top = [stage for stage in record.stages if stage.depth == 1]
+    rows.append((
+        'Kalan (figür oluşturma, serileştirme, Streamlit)',
+        (record.wall_s - sum(stage.wall_s for stage in top)) * 1e3,
+        (record.cpu_s - sum(stage.cpu_s for stage in top)) * 1e3,
+    ))
+    return rows
+
+
+def current_session_id():
+    """Çalışan betiğin oturum kimliği (çalışma zamanı dışında None)"""
+    return getattr(_script_context(), 'session_id', None)
+
+
+# =============================================================================
+# 📤 DIŞA AKTARIM: JSON LOG VE PROMETHEUS TEXTFILE
+# =============================================================================
+
+def _log_record(record):
+    """Kaydı tek satır JSON olarak logla"""
+    if not logger.handlers and not logging.getLogger().handlers:
+        logger.addHandler(logging.StreamHandler())
+        logger.setLevel(logging.INFO)
+    logger.info(json.dumps({
+        'event': 'section_render',
+        'section': record.section,
+        'session_id': record.session_id,
+        'timestamp': record.timestamp,
+        'wall_ms': round(record.wall_s * 1e3, 3),
+        'cpu_ms': round(record.cpu_s * 1e3, 3),
+        'peak_bytes': None if math.isnan(record.peak_bytes) else int(record.peak_bytes),
+        'payload_bytes': record.payload_bytes,
+        'figure_bytes': record.figure_bytes,
+        'n_figures': record.n_figures,
+        'stages': [
+            {'name': s.name, 'depth': s.depth, 'wall_ms': round(s.wall_s * 1e3, 3), 'cpu_ms': round(s.cpu_s * 1e3, 3)}
+            for s in record.stages
+        ],
+    }, ensure_ascii=False))
+
+
+# (metrik, tür, açıklama, _totals indeksi)
+PROMETHEUS_METRICS = [
+    ('jobs_section_renders_total', 'counter', 'Bölüm çizim sayısı', 0),
+    ('jobs_section_wall_seconds_total', 'counter', 'Bölüm çizimlerinin toplam duvar saati süresi', 1),
+    ('jobs_section_cpu_seconds_total', 'counter', 'Bölüm çizimlerinin toplam CPU süresi', 2),
+    ('jobs_section_payload_bytes_total', 'counter', 'Bölümlerin gönderdiği toplam mesaj baytı', 3),
+    ('jobs_section_figure_bytes_total', 'counter', 'Bölümlerin gönderdiği toplam grafik baytı', 4),
+    ('jobs_section_last_wall_seconds', 'gauge', 'Son çizimin duvar saati süresi', 5),
+    ('jobs_section_peak_memory_bytes', 'gauge', 'Son çizimin tracemalloc tepe bellek artışı', 6),
+]
+
+
+def prometheus_text():
+    """Toplamların Prometheus metin biçimi"""
+    with _lock:
+        totals = {section: list(values) for section, values in _totals.items()}
+    lines = []
+    for metric, kind, description, index in PROMETHEUS_METRICS:
+        lines.append(f'# HELP {metric} {description}')
+        lines.append(f'# TYPE {metric} {kind}')
+        for section, values in sorted(totals.items()):
+            if not math.isnan(values[index]):
+                lines.append(f'{metric}{{section="{section}"}} {values[index]}')
+    return '\n'.join(lines) + '\n'
+
+
+def _prometheus_interval():
+    """Metrik dosyasının en sık yazılma aralığı (sn)"""
+    try:
+        return float(os.environ.get(PROMETHEUS_INTERVAL_ENV, DEFAULT_PROMETHEUS_INTERVAL_S))
+    except ValueError:
+        return DEFAULT_PROMETHEUS_INTERVAL_S
+
+
+def _flush_prometheus(force=True):
+    """Metrik dosyasını yaz; force değilse son yazımdan bu yana aralık dolmadıysa ertele"""
+    path = os.environ.get(PROMETHEUS_ENV)
+    if not path:
+        return
+    now = time.monotonic()
+    with _lock:
+        if not force and now - _prometheus['last_write'] < _prometheus_interval():
+            _prometheus['pending'] = True
+            return
+        if force and not _prometheus['pending']:
+            return
+        _prometheus['last_write'] = now
+        _prometheus['pending'] = False
+    try:
+        write_prometheus(path)
+    except OSError as exc:
+        logger.warning("Prometheus metrik dosyası yazılamadı (%s): %s", path, exc)
+
+
+# Aralık içinde ertelenen son kayıtlar süreç kapanırken yazılır
+atexit.register(_flush_prometheus)
+
+
+def write_prometheus(path):
+    """Metrikleri dosyaya atomik olarak yaz (node_exporter textfile toplayıcısı için)"""
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
@@ -0,0 +1,102 @@
+# =============================================================================
+# 🧩 SIK BECERİ KÜMELERİ (FREQUENT ITEMSET MINING)
+# =============================================================================
+# Beceri insidans matrisi üzerinde Eclat tarzı (derinlik öncelikli) sık öğe
+# kümesi madenciliği. İlan başına tüm kombinasyonları üretmek yerine yalnızca
+# minimum desteği geçen kümeler genişletilir (Apriori budaması); bellekte her
+# an yalnızca aktif yol üzerindeki ilan kümeleri tutulur.
+# =============================================================================
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from skill_matrix import top_indices
+
+ITEMSET_COLUMNS = ['itemset', 'size', 'count', 'support']
+RULE_COLUMNS = ['antecedent', 'consequent', 'count', 'support', 'confidence', 'lift']
+
+
+def frequent_itemsets(incidence, min_support=0.05, max_size=4, cooccurrence=None):
+    """Desteği min_support oranını geçen tüm beceri kümeleri
+
+    Dönen DataFrame sütunları: itemset (alfabetik beceri demeti), size,
+    count (ilan sayısı), support (ilan oranı). cooccurrence (X.T @ X)
+    verilirse ikili kümelerin sayıları doğrudan buradan okunur.
+    """
+    matrix = incidence.matrix
+    csc = matrix.tocsc()
+    n_postings = matrix.shape[0]
+    min_count = max(1, math.ceil(min_support * n_postings))
+
+    item_counts = np.diff(csc.indptr)
+    frequent_items = np.flatnonzero(item_counts >= min_count)
+
+    found = []
+
+    def rows_of(item):
+        return csc.indices[csc.indptr[item]:csc.indptr[item + 1]]
+
+    def extend(prefix, rows, candidates):
+        # Önekle birlikte geçen aday becerilerin sayıları tek seferde
+        if len(prefix) == 1 and cooccurrence is not None:
+            counts = cooccurrence[prefix[0]].toarray().ravel()[candidates]
+        else:
+            counts = np.asarray(matrix[rows][:, candidates].sum(axis=0)).ravel()
+        keep = counts >= min_count
+        candidates, counts = candidates[keep], counts[keep]
+
+        for pos, (item, count) in enumerate(zip(candidates, counts)):
+            itemset = prefix + (item,)
+            found.append((itemset, int(count)))
+            # Yalnızca önekle sık olan becerilerle genişlet
+            if len(itemset) < max_size and pos + 1 < len(candidates):
+                new_rows = np.intersect1d(rows, rows_of(item), assume_unique=True)
+                extend(itemset, new_rows, candidates[pos + 1:])
+
+    for pos, item in enumerate(frequent_items):
+        found.append(((item,), int(item_counts[item])))
+        if max_size > 1 and pos + 1 < len(frequent_items):
+            extend((item,), rows_of(item), frequent_items[pos + 1:])
+
+    vocabulary = incidence.vocabulary
+    itemsets = pd.DataFrame({
+        'itemset': [tuple(vocabulary[i] for i in items) for items, _ in found],
+        'size': np.array([len(items) for items, _ in found], dtype=np.int64),
+        'count': np.array([count for _, count in found], dtype=np.int64),
+    }, columns=ITEMSET_COLUMNS[:3])
+    itemsets['support'] = itemsets['count'] / n_postings if n_postings else 0.0
+    return itemsets.sort_values(['size', 'count'], ascending=[True, False], kind='stable').reset_index(drop=True)
+
+
+def top_itemsets(itemsets, size, top=10):
+    """Belirli büyüklükteki en sık `top` küme; indeks beceri demetleridir"""
+    subset = itemsets[itemsets['size'] == size]
+    order = top_indices(subset['count'].to_numpy(), top)
+    return pd.Series(
+        subset['count'].to_numpy()[order],
+        index=subset['itemset'].to_numpy()[order].tolist(),
+        dtype=np.int64,
+    )
+
+
+def association_rules(itemsets, n_postings, min_confidence=0.0):
+    """Sık kümelerden tek sonuçlu birliktelik kuralları (A → b)
+
+    confidence = sayı(A ∪ b) / sayı(A), lift = confidence / destek(b).
+    Apriori özelliği gereği A her zaman itemsets içinde bulunur.
+    """
+    counts = dict(zip(itemsets['itemset'], itemsets['count']))
+    rules = []
+    for itemset, count in zip(itemsets['itemset'], itemsets['count']):
+        if len(itemset) < 2:
+            continue
+        for i, consequent in enumerate(itemset):
+            antecedent = itemset[:i] + itemset[i + 1:]
+            confidence = count / counts[antecedent]
+            if confidence < min_confidence:
+                continue
+            lift = confidence / (counts[(consequent,)] / n_postings)
+            rules.append((antecedent, consequent, count, count / n_postings, confidence, lift))
+    return pd.DataFrame(rules, columns=RULE_COLUMNS)
@@ -0,0 +1,37 @@
+# =============================================================================
+# 📚 JOBS_ANALYTICS: STREAMLIT'TEN BAĞIMSIZ ANALİZ KÜTÜPHANESİ
+# =============================================================================
+# Dashboard'un hesaplamaları (ön işleme, aykırı değer sınırları, betimsel
+# istatistikler, maaş grup özetleri, beceri birlikteliği, ilan trendi) düz
+# DataFrame / dizi döndüren saf fonksiyonlardır. Streamlit çalışma zamanı
+# gerektirmez; toplu işler, benchmark'lar ve çok süreçli çalıştırma bu
+# fonksiyonları doğrudan çağırır. Dashboard bölümleri aynı fonksiyonları
+# önbellekli yükleyicilerin (loaders.py) ürettiği yapılarla besler.
+#
+#     from jobs_analytics import load, salary_by
+#     df = load('data_science_job_posts_2025.csv')
+#     salary_by(df, 'seniority_level')
+# =============================================================================
+
+from jobs_analytics.dataset import load, prepare
+from jobs_analytics.stats import (
+    DESCRIPTIVE_COLUMNS,
+    OUTLIER_COLUMNS,
+    descriptive_stats,
+    outlier_summary,
+    posting_trend,
+    salary_by,
+)
+from jobs_analytics.skills import skill_cooccurrence
+
+__all__ = [
+    'load',
+    'prepare',
+    'outlier_summary',
+    'descriptive_stats',
+    'salary_by',
+    'skill_cooccurrence',
+    'posting_trend',
+    'DESCRIPTIVE_COLUMNS',
+    'OUTLIER_COLUMNS',
+]
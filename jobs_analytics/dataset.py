@@ -0,0 +1,26 @@
+# =============================================================================
+# 📂 VERİ SETİ: YÜKLEME VE ÖN İŞLEME
+# =============================================================================
+
+from ingest import DEFAULT_CHUNKSIZE, load_prepared_streaming
+from parsing import prepare_dataset
+from snapshot import load_with_snapshot
+
+
+def prepare(df):
+    """Ham ilan tablosunu ön işle (maaş / şirket büyüklüğü / beceri / tarih ayrıştırma)"""
+    return prepare_dataset(df)
+
+
+def load(path, chunksize=DEFAULT_CHUNKSIZE, memory_budget_bytes=None, snapshot=True):
+    """CSV'yi parça parça okuyup ön işlenmiş veri setini döndür
+
+    snapshot=True ise CSV'nin yanındaki Parquet anlık görüntüsü güncelse
+    ondan okunur, değilse üretilip yazılır.
+    """
+    def build(csv_path):
+        return load_prepared_streaming(csv_path, chunksize=chunksize, memory_budget_bytes=memory_budget_bytes)
+
+    if snapshot:
+        return load_with_snapshot(path, build)
+    return build(path)
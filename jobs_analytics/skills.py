@@ -0,0 +1,19 @@
+# =============================================================================
+# 🛠️ BECERİ BİRLİKTELİĞİ
+# =============================================================================
+# skill_matrix (SciPy sparse) yalnızca fonksiyon ilk çağrıldığında içe
+# aktarılır; paketi içe aktarmak SciPy'yi yüklemez.
+# =============================================================================
+
+
+def skill_cooccurrence(df, top=20, incidence=None, cooccurrence=None):
+    """En sık `top` beceri arasındaki birliktelik sayıları (kare DataFrame; köşegen tekil sayılar)
+
+    incidence / cooccurrence verilirse (ör. önbellekten) df'in beceri
+    listelerinden yeniden kurulmaz.
+    """
+    from skill_matrix import build_skill_incidence, cooccurrence_frame
+
+    if incidence is None:
+        incidence = build_skill_incidence(df['skills_list'])
+    return cooccurrence_frame(incidence, top=top, cooccurrence=cooccurrence)
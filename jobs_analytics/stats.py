@@ -0,0 +1,66 @@
+# =============================================================================
+# 📈 İSTATİSTİKLER: AYKIRI DEĞERLER, BETİMSEL ÖZET, MAAŞ GRUPLARI, TREND
+# =============================================================================
+# Fonksiyonlar ön işlenmiş veri setini (prepare / load çıktısı) alır. Maaş
+# küpü veya quantile özetleri zaten hesaplanmışsa (ör. dashboard'un
+# önbelleğinden) parametre olarak verilebilir; verilmezse veri setinden
+# üretilir.
+# =============================================================================
+
+import pandas as pd
+
+from cube import build_salary_cube, rollup
+from sketch import box_stats, sketch_from_values
+
+OUTLIER_COLUMNS = ['salary_numeric', 'company_size_numeric', 'skills_count']
+DESCRIPTIVE_COLUMNS = ['salary_numeric', 'company_size_numeric', 'skills_count']
+OUTLIER_FIELDS = ['n_outliers', 'lower_fence', 'upper_fence', 'q1', 'q3', 'iqr']
+
+
+def outlier_summary(df, columns=OUTLIER_COLUMNS, sketches=None):
+    """Sütun başına IQR yöntemiyle aykırı değer sayısı, sınırlar ve çeyrekler
+
+    sketches verilirse (sütun adı -> quantile özeti) o sütunlar için veri
+    yerine özet kullanılır.
+    """
+    sketches = sketches or {}
+    rows = []
+    for col in columns:
+        stats = box_stats(sketches[col] if col in sketches else sketch_from_values(df[col]))
+        rows.append((stats.n_outliers, stats.lower_fence, stats.upper_fence, stats.q1, stats.q3, stats.iqr))
+    return pd.DataFrame(rows, index=pd.Index(columns, name='column'), columns=OUTLIER_FIELDS)
+
+
+def descriptive_stats(df, columns=DESCRIPTIVE_COLUMNS):
+    """Sütun başına ortalama, medyan, standart sapma, min, max ve geçerli değer sayısı"""
+    return pd.DataFrame({
+        col: [
+            df[col].mean(),
+            df[col].median(),
+            df[col].std(),
+            df[col].min(),
+            df[col].max(),
+            df[col].notna().sum(),
+        ]
+        for col in columns
+    }, index=['mean', 'median', 'std', 'min', 'max', 'count'], dtype=float)
+
+
+def salary_by(df, dims, cube=None):
+    """Boyut(lar)a göre maaş özeti: postings, count, sum, min, max, mean, std, median, sketch
+
+    cube verilirse (ör. filtrelenmiş maaş küpü) df yerine onun hücreleri toplanır.
+    """
+    dims = [dims] if isinstance(dims, str) else list(dims)
+    if cube is None:
+        cube = build_salary_cube(df)
+    return rollup(cube, dims)
+
+
+def posting_trend(df):
+    """İlan yaşına (kaç gün önce) göre ilan sayıları: days_ago (int), postings"""
+    trend = df['days_ago'].dropna().value_counts(sort=False).sort_index()
+    return pd.DataFrame({
+        'days_ago': trend.index.astype(int),
+        'postings': trend.to_numpy(),
+    })
@@ -0,0 +1,174 @@
+# =============================================================================
+# 📂 VERİ YÜKLEME FONKSİYONLARI
+# =============================================================================
+# Veri setini ve ondan türetilen paylaşılan yapıları (beceri insidans matrisi,
+# birliktelik matrisi, ters indeks, sık kümeler) önbellekli olarak yükler.
+# Tüm fonksiyonlar veri dosyasının (yol, boyut, değişiklik zamanı) anahtarıyla
+# ve isteğe bağlı global filtrelerle çağrılır; filtreli görünümler filtre
+# kombinasyonu başına önbelleklenir (max_entries dolunca en eski kullanılan
+# kombinasyon atılır). Beceri yapılarının modülleri (SciPy sparse) yalnızca
+# beceri bölümleri ilk kez yüklenirken içe aktarılır.
+# =============================================================================
+
+import os
+
+import numpy as np
+import streamlit as st
+
+from cube import build_salary_cube, slice_cube
+from filters import NO_FILTERS, build_filter_index, filter_mask
+from histograms import DEFAULT_MAX_BINS, bin_edges
+from startup import startup_phase
+from ingest import DEFAULT_CHUNKSIZE
+from instrumentation import instrumented
+from jobs_analytics import load
+from sketch import sketch_from_values
+
+DATA_PATH = 'data_science_job_posts_2025.csv'
+
+# Parçalı okuma ayarları (ortam değişkenleri ile değiştirilebilir)
+INGEST_CHUNKSIZE = int(os.environ.get('JOBS_INGEST_CHUNKSIZE', DEFAULT_CHUNKSIZE))
+MEMORY_BUDGET_MB = os.environ.get('JOBS_MEMORY_BUDGET_MB')
+
+# Beceri çifti/üçlüsü grafikleri için minimum destek oranı
+ITEMSET_MIN_SUPPORT = 0.01
+
+# Aynı anda önbellekte tutulan filtre kombinasyonu sayısı
+FILTERED_VIEW_CACHE_SIZE = 16
+
+
+def dataset_key(path=DATA_PATH):
+    """Veri dosyasının (yol, boyut, değişiklik zamanı) anahtarı"""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+@instrumented
+def load_prepared_data(path, size, mtime_ns):
+    """Ön işlenmiş veri setini yükle
+
+    Sonuç tüm oturumlar arasında kopyalanmadan paylaşılır; bu yüzden
+    dönen DataFrame salt okunur kabul edilmeli, yerinde değiştirilmemelidir.
+    CSV'nin yanındaki Parquet anlık görüntüsü güncelse metin ayrıştırılmaz.
+    """
+    budget = int(float(MEMORY_BUDGET_MB) * 2**20) if MEMORY_BUDGET_MB else None
+    with startup_phase('Veri yükleme'):
+        return load(path, chunksize=INGEST_CHUNKSIZE, memory_budget_bytes=budget)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+@instrumented
+def load_filter_index(path, size, mtime_ns):
+    """Filtre sütunlarının kategori kodları (veri dosyası başına bir kez)"""
+    return build_filter_index(load_prepared_data(path, size, mtime_ns))
+
+
+@st.cache_resource(max_entries=FILTERED_VIEW_CACHE_SIZE, show_spinner=False)
+@instrumented
+def load_filtered_rows(path, size, mtime_ns, filters):
+    """Filtreleri sağlayan satırların konumları (filtre yoksa None)"""
+    mask = filter_mask(load_filter_index(path, size, mtime_ns), filters)
+    return None if mask is None else np.flatnonzero(mask)
+
+
+@st.cache_resource(max_entries=FILTERED_VIEW_CACHE_SIZE, show_spinner=False)
+@instrumented
+def load_filtered_data(path, size, mtime_ns, filters=NO_FILTERS):
+    """Filtrelenmiş veri görünümü (salt okunur; filtre yoksa tüm veri seti)"""
+    df = load_prepared_data(path, size, mtime_ns)
+    rows = load_filtered_rows(path, size, mtime_ns, filters)
+    if rows is None:
+        return df
+    view = df.take(rows)
+    # Görünümde geçmeyen kategoriler sayım tablolarında 0 satırı olarak çıkmasın
+    for col in view.select_dtypes('category').columns:
+        view[col] = view[col].cat.remove_unused_categories()
+    return view
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+@instrumented
+def load_full_salary_cube(path, size, mtime_ns):
+    """Tüm veri setinin maaş küpü (veri dosyası başına bir kez)"""
+    return build_salary_cube(load_prepared_data(path, size, mtime_ns))
+
+
+@st.cache_resource(max_entries=FILTERED_VIEW_CACHE_SIZE, show_spinner=False)
+@instrumented
+def load_salary_cube(path, size, mtime_ns, filters=NO_FILTERS):
+    """Filtrelenmiş görünümün maaş küpü hücreleri
+
+    Kategorik filtreler tam küpün hücrelerini süzer; maaş aralığı hücre
+    düzeyinde uygulanamadığından o durumda küp filtreli görünümden kurulur.
+    """
+    if filters.salary_range is not None:
+        return build_salary_cube(load_filtered_data(path, size, mtime_ns, filters))
+    return slice_cube(load_full_salary_cube(path, size, mtime_ns), filters)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+@instrumented
+def load_full_skill_incidence(path, size, mtime_ns):
+    """Tüm veri setinin ilan × beceri insidans matrisi (veri dosyası başına bir kez)"""
+    from skill_matrix import build_skill_incidence
+
+    return build_skill_incidence(load_prepared_data(path, size, mtime_ns)['skills_list'])
+
+
+@st.cache_resource(max_entries=FILTERED_VIEW_CACHE_SIZE, show_spinner=False)
+@instrumented
+def load_skill_incidence(path, size, mtime_ns, filters=NO_FILTERS):
+    """Filtrelenmiş görünümün insidans matrisi
+
+    Filtreli görünümler tam matrisin satır alt kümesidir; beceri sözlüğü
+    ve sütun numaraları değişmez.
+    """
+    from skill_matrix import SkillIncidence
+
+    full = load_full_skill_incidence(path, size, mtime_ns)
+    rows = load_filtered_rows(path, size, mtime_ns, filters)
+    if rows is None:
+        return full
+    return SkillIncidence(full.matrix[rows], full.vocabulary, full.index)
+
+
+@st.cache_resource(max_entries=FILTERED_VIEW_CACHE_SIZE, show_spinner=False)
+@instrumented
+def load_skill_cooccurrence(path, size, mtime_ns, filters=NO_FILTERS):
+    """Beceri × beceri birliktelik matrisi (X.T @ X)"""
+    from skill_matrix import cooccurrence_matrix
+
+    return cooccurrence_matrix(load_skill_incidence(path, size, mtime_ns, filters))
+
+
+@st.cache_resource(max_entries=FILTERED_VIEW_CACHE_SIZE, show_spinner=False)
+@instrumented
+def load_skill_index(path, size, mtime_ns, filters=NO_FILTERS):
+    """Beceri → ilan kümesi ters indeksi (kombinasyon sorguları için)"""
+    from skill_index import build_skill_bitmap_index
+
+    return build_skill_bitmap_index(load_skill_incidence(path, size, mtime_ns, filters))
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+@instrumented
+def mine_skill_itemsets(path, size, mtime_ns, min_support, max_size, filters=NO_FILTERS):
+    """Sık beceri kümelerini çıkar (veri dosyası, filtre ve parametreler başına bir kez)"""
+    from itemsets import frequent_itemsets
+
+    return frequent_itemsets(
+        load_skill_incidence(path, size, mtime_ns, filters),
+        min_support=min_support,
+        max_size=max_size,
+        cooccurrence=load_skill_cooccurrence(path, size, mtime_ns, filters)
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+@instrumented
+def load_bin_edges(path, size, mtime_ns, column, max_bins=DEFAULT_MAX_BINS, method='nice', filters=NO_FILTERS,
+                   inlier_width=False):
+    """Sayısal bir sütunun histogram kutu sınırları (sütun, filtre ve parametreler başına bir kez)"""
+    values = load_filtered_data(path, size, mtime_ns, filters)[column]
+    return bin_edges(sketch_from_values(values), max_bins=max_bins, method=method, inlier_width=inlier_width)
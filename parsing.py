@@ -0,0 +1,144 @@
+# =============================================================================
+# ⚙️ VEKTÖREL VERİ AYRIŞTIRMA
+# =============================================================================
+# Maaş, şirket büyüklüğü ve beceri sütunlarını satır satır değil, sütun
+# bazında (pandas string accessor + NumPy) sayısal/list sütunlara çevirir.
+# =============================================================================
+
+import ast
+
+import numpy as np
+import pandas as pd
+
+# "€100,472 - €200,938" gibi aralıklar: ilk iki uç değer alınır
+SALARY_RANGE_PATTERN = r'^(?P<low>.*?) - (?P<high>.*?)(?: - |$)'
+
+# "['spark', 'r', 'python']" biçimindeki basit beceri listeleri
+SKILLS_LIST_PATTERN = r"^\[(?:'[^',\\]*'(?:, '[^',\\]*')*)?\]$"
+
+# prepare_dataset tarafından eklenen türetilmiş sütunlar
+DERIVED_COLUMNS = ['salary_numeric', 'company_size_numeric', 'skills_list', 'skills_count', 'days_ago']
+
+# Tekrar eden değerler içeren, pandas categorical olarak tutulan sütunlar
+CATEGORY_COLUMNS = ['job_title', 'seniority_level', 'status', 'company', 'headquarter', 'industry', 'ownership']
+
+
+def _to_float(values):
+    """Metin sütununu float64'e çevir (çevrilemeyenler NaN)"""
+    numeric = pd.to_numeric(values.astype(object), errors='coerce')
+    return numeric.astype('float64')
+
+
+def _clean_numeric_text(series):
+    """€ ve binlik ayırıcı virgülleri kaldır"""
+    text = series.astype('string')
+    return text.str.replace('€', '', regex=False).str.replace(',', '', regex=False)
+
+
+def _on_uniques(series, parser):
+    """Ayrıştırıcıyı yalnızca benzersiz değerlerde çalıştırıp sonucu satırlara yay"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    parsed = parser(pd.Series(np.asarray(uniques, dtype=object), dtype=object))
+    values = parsed.to_numpy()[codes]
+    return pd.Series(values, index=series.index, name=series.name, dtype=parsed.dtype)
+
+
+def _parse_salary_unique(series):
+    cleaned = _clean_numeric_text(series)
+
+    bounds = cleaned.str.extract(SALARY_RANGE_PATTERN)
+    low = _to_float(bounds['low'].str.strip())
+    high = _to_float(bounds['high'].str.strip())
+    single = _to_float(cleaned.str.strip())
+
+    is_range = bounds['low'].notna().to_numpy()
+    values = np.where(is_range, (low.to_numpy() + high.to_numpy()) / 2, single.to_numpy())
+    return pd.Series(values, dtype='float64')
+
+
+def _parse_company_size_unique(series):
+    cleaned = _clean_numeric_text(series).str.strip()
+    return pd.Series(_to_float(cleaned).to_numpy(), dtype='float64')
+
+
+def parse_salary_column(series):
+    """Maaş sütununu sayısala çevir (aralıklarda orta nokta)"""
+    return _on_uniques(series, _parse_salary_unique)
+
+
+def parse_company_size_column(series):
+    """Şirket büyüklüğü sütununu sayısala çevir"""
+    return _on_uniques(series, _parse_company_size_unique)
+
+
+def _literal_skills(skills_str):
+    """Hızlı yola uymayan satırlar için yedek ayrıştırıcı"""
+    try:
+        return ast.literal_eval(skills_str)
+    except Exception:
+        return []
+
+
+def _parse_skills_unique(series):
+    text = series.astype('string')
+    values = np.empty(len(series), dtype=object)
+    values[:] = [[] for _ in range(len(series))]
+
+    simple = text.str.fullmatch(SKILLS_LIST_PATTERN).fillna(False).to_numpy(dtype=bool)
+    non_empty = simple & text.str.len().gt(2).fillna(False).to_numpy(dtype=bool)
+    if non_empty.any():
+        inner = text[non_empty].str.slice(2, -2)
+        values[non_empty] = inner.astype(object).str.split("', '").to_numpy(dtype=object)
+
+    # Basit kalıba uymayan (ör. kaçış karakteri içeren) satırlar
+    fallback = ~simple & text.notna().to_numpy(dtype=bool) & text.ne('[]').fillna(False).to_numpy(dtype=bool)
+    if fallback.any():
+        values[fallback] = text[fallback].astype(object).map(_literal_skills).to_numpy(dtype=object)
+
+    return pd.Series(values, dtype=object)
+
+
+def parse_skills_column(series):
+    """Skills sütununu Python listelerine çevir
+
+    Aynı metne sahip satırlar aynı liste nesnesini paylaşır; listeler
+    yerinde değiştirilmemelidir.
+    """
+    return _on_uniques(series, _parse_skills_unique)
+
+
+def count_skills(skills_list):
+    """Her ilandaki beceri sayısı"""
+    return skills_list.str.len().fillna(0).astype('int64')
+
+
+def parse_post_date_column(series):
+    """post_date sütununu gün sayısına çevir ("7 days ago" -> 7, "2 months ago" -> 60)"""
+    text = series.astype('string').str.lower()
+    first = text.str.split().str[0]
+    amount = _to_float(first.where(first.str.fullmatch(r'[+-]?\d+').fillna(False)))
+
+    unit = np.select(
+        [
+            text.str.contains('day', regex=False).fillna(False).to_numpy(dtype=bool),
+            text.str.contains('month', regex=False).fillna(False).to_numpy(dtype=bool),
+            text.str.contains('year', regex=False).fillna(False).to_numpy(dtype=bool),
+        ],
+        [1.0, 30.0, 365.0],
+        default=np.nan,
+    )
+    return pd.Series(amount.to_numpy() * unit, index=series.index, name=series.name)
+
+
+def prepare_dataset(raw_df):
+    """Ham veri setinden türetilmiş sütunları içeren yeni bir DataFrame üret"""
+    df = raw_df.copy()
+    df['salary_numeric'] = parse_salary_column(df['salary'])
+    df['company_size_numeric'] = parse_company_size_column(df['company_size'])
+    df['skills_list'] = parse_skills_column(df['skills'])
+    df['skills_count'] = pd.to_numeric(count_skills(df['skills_list']), downcast='integer')
+    # Gün sayıları float32'de kayıpsız temsil edilir
+    df['days_ago'] = parse_post_date_column(df['post_date']).astype('float32')
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype('category')
+    return df
@@ -0,0 +1,442 @@
+# =============================================================================
+# 🧊 ÖN ÇİZİM: STATİK DASHBOARD ÇIKTISI
+# =============================================================================
+# Veri seti yalnızca yeni bir dışa aktarım yayımlandığında değişir; filtresiz
+# görünüm ve bölüm kontrollerinin varsayılan değerleriyle çizilen sayfa bu
+# yüzden deterministiktir. `build` komutu tüm bölümleri başsız olarak (AppTest
+# betik bağlamında) çizer: bölüm modüllerindeki ve tables.py'deki `st` geçici
+# olarak bir kaydediciyle değiştirilir ve her çağrı bir öğe ağacına yazılır.
+# Çıktı klasörü:
+#
+#     manifest.json          kaynak dosya özeti, bölüm listesi, tablo dizini
+#     sections/<bölüm>.json  öğe ağacı (başlık, metin / HTML tablo, metrik,
+#                            sütunlar, kontroller, figür ve görsel referansları)
+#     figures/*.json         Plotly figür JSON'ları
+#     images/*.png           Matplotlib / Seaborn PNG'leri
+#     tables/*.parquet       bölüm hesaplamalarının (compute_*) DataFrame /
+#                            Series sonuçları; skaler sonuçlar manifest'te
+#
+# Dashboard JOBS_STATIC_DIR=<klasör> ile başlatıldığında veri seti yüklenmez
+# ve hiçbir hesaplama çalışmaz; seçilen bölüm öğe ağacından yeniden çizilir.
+# Global filtreler ve bölüm kontrolleri statik modda varsayılan değerleriyle
+# devre dışı gösterilir. Yeni derleme eski klasörün yerine taşınır; çalışan
+# dashboard manifest değiştiğinde yeni çıktıyı okur.
+#
+# Çalıştırma (depo kökünden):
+#     python -m prerender build                          # static_build/
+#     python -m prerender build --data yeni.csv --output yayin/
+#     JOBS_STATIC_DIR=static_build streamlit run app.py
+# =============================================================================
+
+import argparse
+import functools
+import inspect
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from datetime import datetime, timezone
+
+import streamlit as st
+
+from figures import figure_from_json
+from instrumentation import measure_section
+
+STATIC_ENV = 'JOBS_STATIC_DIR'
+DEFAULT_OUTPUT = 'static_build'
+MANIFEST = 'manifest.json'
+
+# Çıktının biçimi değiştiğinde artırılmalı
+FORMAT_VERSION = 1
+
+# Argümanlarıyla olduğu gibi kaydedilip yeniden çağrılan öğeler
+TEXT_ELEMENTS = frozenset({
+    'header', 'subheader', 'markdown', 'caption', 'info', 'success', 'warning', 'error', 'metric',
+})
+# Statik modda varsayılan değerleriyle devre dışı gösterilen kontroller
+WIDGETS = frozenset({'slider', 'selectbox', 'radio', 'multiselect'})
+
+
+def _json_default(value):
+    """NumPy skalerlerini JSON'a yazılabilir Python değerlerine çevir"""
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"JSON'a yazılamayan değer: {type(value).__name__}")
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, default=_json_default)
+
+
+# =============================================================================
+# 🎙️ KAYIT (DERLEME)
+# =============================================================================
+
+class _Column:
+    """Kaydedici sütunu: `with` bloğundaki çağrılar sütunun çocuklarına yazılır"""
+
+    def __init__(self, recorder, children):
+        self._recorder = recorder
+        self._children = children
+
+    def __enter__(self):
+        self._recorder._containers.append(self._children)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._recorder._containers.pop()
+        return False
+
+
+class _Recorder:
+    """Bölüm modülündeki `st` yerine geçip çağrıları öğe ağacına kaydeder
+
+    Kontroller varsayılan değerlerini döndürür; desteklenmeyen bir Streamlit
+    çağrısı derlemeyi AttributeError ile durdurur.
+    """
+
+    def __init__(self, section_key, output_dir):
+        self.blocks = []
+        self._containers = [self.blocks]
+        self._section_key = section_key
+        self._output_dir = output_dir
+        self._n_files = 0
+
+    def _append(self, block):
+        self._containers[-1].append(block)
+
+    def _write_file(self, folder, suffix, data):
+        """Dosyayı çıktı klasörüne yaz, göreli yolunu döndür"""
+        self._n_files += 1
+        relative = f'{folder}/{self._section_key}-{self._n_files:02d}{suffix}'
+        if isinstance(data, bytes):
+            with open(os.path.join(self._output_dir, relative), 'wb') as f:
+                f.write(data)
+        else:
+            with open(os.path.join(self._output_dir, relative), 'w', encoding='utf-8') as f:
+                f.write(data)
+        return relative
+
+    def columns(self, spec, **kwargs):
+        children = [[] for _ in range(spec if isinstance(spec, int) else len(spec))]
+        self._append({'type': 'columns', 'args': [spec], 'kwargs': kwargs, 'children': children})
+        return [_Column(self, column) for column in children]
+
+    def plotly_chart(self, figure, **kwargs):
+        relative = self._write_file('figures', '.json', figure.to_json())
+        self._append({'type': 'plotly_chart', 'file': relative, 'kwargs': kwargs})
+
+    def image(self, image, **kwargs):
+        if not isinstance(image, bytes):
+            raise TypeError(f"Ön çizim yalnızca PNG baytlarını kaydeder ({type(image).__name__} verildi)")
+        relative = self._write_file('images', '.png', image)
+        self._append({'type': 'image', 'file': relative, 'kwargs': kwargs})
+
+    def _widget(self, name, *args, **kwargs):
+        """Kontrolü kaydet, varsayılan değerini döndür"""
+        arguments = inspect.signature(getattr(st, name)).bind(*args, **kwargs).arguments
+        if 'options' in arguments:
+            arguments['options'] = list(arguments['options'])
+        if name == 'slider':
+            value = arguments.get('value', arguments.get('min_value'))
+        elif name == 'multiselect':
+            value = list(arguments.get('default') or [])
+        else:
+            value = arguments['options'][arguments.get('index', 0)]
+
+        # Seçenekler görüntülenen etiketleriyle kaydedilir
+        format_func = arguments.pop('format_func', None)
+        if format_func is not None:
+            arguments['options'] = [format_func(option) for option in arguments['options']]
+            if arguments.get('default'):
+                arguments['default'] = [format_func(option) for option in arguments['default']]
+        self._append({'type': name, 'kwargs': arguments})
+        return value
+
+    def __getattr__(self, name):
+        if name in TEXT_ELEMENTS:
+            return lambda *args, **kwargs: self._append({'type': name, 'args': list(args), 'kwargs': kwargs})
+        if name in WIDGETS:
+            return functools.partial(self._widget, name)
+        raise AttributeError(f"Ön çizim st.{name} çağrısını desteklemiyor")
+
+
+def _is_scalar(value):
+    return value is None or isinstance(value, (str, bool, int, float)) or (
+        hasattr(value, 'item') and getattr(value, 'ndim', None) == 0
+    )
+
+
+def _table_leaves(value, path=()):
+    """Hesaplama sonucundaki (yol, DataFrame / Series / skaler / skaler listesi) yaprakları
+
+    NumPy dizileri, seyrek matrisler ve PNG baytları atlanır; bunlar zaten
+    figürlere ve görsellere dönüşmüş olarak çıktıda bulunur.
+    """
+    import pandas as pd
+
+    if isinstance(value, (pd.DataFrame, pd.Series)) or _is_scalar(value):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _table_leaves(item, path + (str(key),))
+    elif isinstance(value, tuple) and hasattr(value, '_fields'):
+        for key, item in zip(value._fields, value):
+            yield from _table_leaves(item, path + (key,))
+    elif isinstance(value, (list, tuple)):
+        if all(_is_scalar(item) for item in value):
+            yield path, list(value)
+        else:
+            for i, item in enumerate(value):
+                yield from _table_leaves(item, path + (str(i),))
+
+
+def _parquet_frame(table):
+    """Series'i tek sütunlu tabloya, sütun adlarını metne çevir (Parquet şartı)"""
+    if not hasattr(table, 'columns'):
+        table = table.to_frame('value' if table.name is None else str(table.name))
+    if not all(isinstance(column, str) for column in table.columns):
+        table = table.set_axis([
+            ' / '.join(map(str, column)) if isinstance(column, tuple) else str(column)
+            for column in table.columns
+        ], axis=1)
+    return table
+
+
+class _TableCollector:
+    """Bölüm hesaplamalarının sonuçlarını tables/ altına yazıp dizinini tutar"""
+
+    def __init__(self, output_dir):
+        self.entries = []
+        self._output_dir = output_dir
+        self._calls = {}
+
+    def __call__(self, func, args, kwargs, result):
+        if not func.__module__.startswith('sections.'):
+            return
+        name = f"{func.__module__.removeprefix('sections.')}.{func.__name__}"
+        self._calls[name] = self._calls.get(name, 0) + 1
+        stem = name if self._calls[name] == 1 else f'{name}-{self._calls[name]}'
+
+        tables, values = {}, {}
+        for path, leaf in _table_leaves(result):
+            key = '.'.join(path)
+            if hasattr(leaf, 'to_frame') or hasattr(leaf, 'columns'):
+                relative = f"tables/{stem}{'.' + key if key else ''}.parquet"
+                _parquet_frame(leaf).to_parquet(os.path.join(self._output_dir, relative))
+                tables[key or 'result'] = relative
+            else:
+                values[key or 'result'] = leaf
+        # data_key ve filtreler her çağrıda aynı (veri dosyası, filtresiz)
+        self.entries.append({
+            'function': name, 'args': list(args[2:]), 'kwargs': kwargs, 'tables': tables, 'values': values,
+        })
+
+
+def record_sections(path, output_dir):
+    """Tüm bölümleri filtresiz çizip öğe ağaçlarını ve tablolarını output_dir'e yaz
+
+    Streamlit betik bağlamında çağrılmalıdır (fragment'lar bağlam dışında
+    çalışmaz); build bunu AppTest ile sağlar.
+    """
+    import importlib
+
+    import tables
+    from filters import NO_FILTERS
+    from instrumentation import observe_results
+    from loaders import dataset_key, load_filtered_data
+    from sections import SECTIONS
+
+    data_key = dataset_key(path)
+    collector = _TableCollector(output_dir)
+    sections = []
+    with observe_results(collector):
+        df = load_filtered_data(*data_key, NO_FILTERS)
+        for section in SECTIONS:
+            module = importlib.import_module(f'sections.{section.module}')
+            recorder = _Recorder(section.key, output_dir)
+            # sayfalı tablolar (render_dark_table) da kaydediciye yazar
+            module.st = tables.st = recorder
+            try:
+                section.render(df, data_key, NO_FILTERS)
+            finally:
+                module.st = tables.st = st
+            relative = f'sections/{section.key}.json'
+            _write_json(os.path.join(output_dir, relative), recorder.blocks)
+            sections.append({'key': section.key, 'title': section.title, 'file': relative})
+    return {'n_rows': len(df), 'sections': sections, 'tables': collector.entries}
+
+
+def _build_script(path, output_dir):
+    """AppTest betiği: bölümleri kaydedip özetini oturum durumuna yaz"""
+    import streamlit as st
+
+    from prerender import record_sections
+
+    st.session_state['prerender'] = record_sections(path, output_dir)
+
+
+def _replace_directory(source, target):
+    """source klasörünü target'ın yerine taşı, eski çıktıyı sil"""
+    if not os.path.exists(target):
+        os.replace(source, target)
+        return
+    previous = f'{target}.{os.getpid()}.old'
+    os.replace(target, previous)
+    os.replace(source, target)
+    shutil.rmtree(previous)
+
+
+def build(path, output=DEFAULT_OUTPUT, timeout=600):
+    """Tüm bölümleri çizip çıktıyı output klasörüne yaz, manifest'i döndür"""
+    from streamlit.testing.v1 import AppTest
+
+    from snapshot import file_sha256
+
+    output = os.path.normpath(output)
+    if os.path.exists(output) and not os.path.exists(os.path.join(output, MANIFEST)):
+        raise FileExistsError(f"{output} bir ön çizim çıktısı değil; üzerine yazılmadı")
+    tmp = f'{output}.{os.getpid()}.tmp'
+    for folder in ('sections', 'figures', 'images', 'tables'):
+        os.makedirs(os.path.join(tmp, folder))
+    try:
+        app = AppTest.from_function(
+            _build_script, args=(os.path.abspath(path), os.path.abspath(tmp)), default_timeout=timeout
+        )
+        app.run()
+        if app.exception:
+            raise RuntimeError(f"Ön çizim başarısız: {app.exception[0].message}")
+        manifest = {
+            'format_version': FORMAT_VERSION,
+            'built_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'source': {
+                'file': os.path.basename(path),
+                'size': os.path.getsize(path),
+                'sha256': file_sha256(path),
+            },
+            **app.session_state['prerender'],
+        }
+        _write_json(os.path.join(tmp, MANIFEST), manifest)
+        _replace_directory(tmp, output)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return manifest
+
+
+# =============================================================================
+# 🖼️ STATİK MOD (DASHBOARD)
+# =============================================================================
+
+def static_dir():
+    """Statik mod klasörü (JOBS_STATIC_DIR tanımlı değilse None)"""
+    return os.environ.get(STATIC_ENV) or None
+
+
+def static_key(directory):
+    """Ön çizim çıktısının (klasör, manifest değişiklik zamanı) anahtarı"""
+    return os.path.abspath(directory), os.stat(os.path.join(directory, MANIFEST)).st_mtime_ns
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_manifest(directory, mtime_ns):
+    """Çıktının manifest'i (yeni bir derleme manifest'i değiştirince yeniden okunur)"""
+    with open(os.path.join(directory, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        raise ValueError(
+            f"Ön çizim çıktısının biçimi eski (sürüm {manifest.get('format_version')}); "
+            "`python -m prerender build` ile yeniden derleyin"
+        )
+    return manifest
+
+
+def _referenced_files(blocks):
+    for block in blocks:
+        if 'file' in block:
+            yield block['file']
+        for children in block.get('children', ()):
+            yield from _referenced_files(children)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_static_section(directory, mtime_ns, section_key):
+    """Bölümün öğe ağacı ve başvurduğu figür JSON'ları / PNG baytları"""
+    section = next(s for s in load_manifest(directory, mtime_ns)['sections'] if s['key'] == section_key)
+    with open(os.path.join(directory, section['file']), encoding='utf-8') as f:
+        blocks = json.load(f)
+    files = {}
+    for relative in _referenced_files(blocks):
+        with open(os.path.join(directory, relative), 'rb') as f:
+            data = f.read()
+        files[relative] = data.decode('utf-8') if relative.endswith('.json') else data
+    return blocks, files
+
+
+def _replay(blocks, files):
+    """Kaydedilmiş öğe ağacını Streamlit çağrılarıyla yeniden çiz"""
+    for block in blocks:
+        kind = block['type']
+        if kind == 'columns':
+            for column, children in zip(st.columns(*block['args'], **block['kwargs']), block['children']):
+                with column:
+                    _replay(children, files)
+        elif kind == 'plotly_chart':
+            st.plotly_chart(figure_from_json(files[block['file']]), **block['kwargs'])
+        elif kind == 'image':
+            st.image(files[block['file']], **block['kwargs'])
+        elif kind in WIDGETS:
+            getattr(st, kind)(**block['kwargs'], disabled=True)
+        elif kind in TEXT_ELEMENTS:
+            getattr(st, kind)(*block['args'], **block['kwargs'])
+        else:
+            raise ValueError(f"Bilinmeyen öğe türü: {kind}")
+
+
+def render_static_section(directory, mtime_ns, section_key):
+    """Bölümü ön çizim çıktısından çiz (veri seti ve hesaplamalar kullanılmaz)"""
+    with measure_section(f'static.{section_key}'):
+        _replay(*load_static_section(directory, mtime_ns, section_key))
+
+
+# =============================================================================
+# 💻 KOMUT SATIRI
+# =============================================================================
+
+def _quiet_streamlit_logs():
+    """Çalışma zamanı dışı önbellek ve kullanımdan kaldırma uyarılarını gizle"""
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith('streamlit'):
+            logging.getLogger(name).addFilter(lambda record: record.levelno >= logging.ERROR)
+
+
+def main(argv=None):
+    _quiet_streamlit_logs()
+    from loaders import DATA_PATH
+
+    parser = argparse.ArgumentParser(description="Dashboard'un statik ön çizim çıktısı")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help='tüm bölümleri çizip çıktı klasörüne yaz')
+    build_parser.add_argument('--data', default=DATA_PATH, help=f'veri dosyası (varsayılan: {DATA_PATH})')
+    build_parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'çıktı klasörü (varsayılan: {DEFAULT_OUTPUT})')
+    build_parser.add_argument('--timeout', type=float, default=600, help='AppTest zaman aşımı (sn)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    manifest = build(args.data, args.output, args.timeout)
+    n_figures = sum(
+        len(os.listdir(os.path.join(args.output, folder))) for folder in ('figures', 'images')
+    )
+    n_tables = sum(len(entry['tables']) for entry in manifest['tables'])
+    print(
+        f"{len(manifest['sections'])} bölüm, {n_figures} grafik, {n_tables} tablo -> {args.output} "
+        f"({time.perf_counter() - start:.1f} sn)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# =============================================================================
+# 🧭 DASHBOARD BÖLÜMLERİ VE BÖLÜM KAYDI
+# =============================================================================
+# Her bölüm kendi modülünde bir fragment'tır: önbellekli hesaplama
+# fonksiyonları yalnızca veri anahtarını, global filtreleri (ve bölümün kendi
+# kontrollerini) girdi olarak alır. Bölüm içindeki bir kontrol değiştiğinde yalnızca o
+# fragment yeniden çalışır; seçilmeyen bölümler hiç çalıştırılmaz. Bölüm
+# modülleri (ve Plotly Express, SciPy gibi ağır bağımlılıkları) ancak bölüm ilk
+# kez seçildiğinde içe aktarılır.
+# =============================================================================
+
+import importlib
+from typing import NamedTuple
+
+from startup import startup_phase
+
+
+class Section(NamedTuple):
+    key: str
+    title: str
+    module: str    # sections paketindeki modül adı
+    function: str  # modüldeki render fonksiyonu
+
+    def render(self, df, data_key, filters):
+        """Bölüm modülünü (ilk kullanımda) içe aktarıp fragment'ı çiz"""
+        with startup_phase(f'import sections.{self.module}'):
+            module = importlib.import_module(f'sections.{self.module}')
+        return getattr(module, self.function)(df, data_key, filters)
+
+
+SECTIONS = [
+    Section('overview', '📁 Örnek Veriler', 'overview', 'render_overview'),
+    Section('missing', '🔍 Eksik Değerler', 'missing', 'render_missing_values'),
+    Section('outliers', '📉 Aykırı Değerler', 'outliers', 'render_outliers'),
+    Section('descriptive', '📈 Betimsel İstatistikler', 'descriptive', 'render_descriptive_stats'),
+    Section('distributions', '📊 Dağılımlar', 'distributions', 'render_distributions'),
+    Section('correlation', '🔗 Korelasyon', 'correlation', 'render_correlation'),
+    Section('salary', '💶 Maaş Dağılımı', 'salary', 'render_salary_distribution'),
+    Section('industry', '🏢 Sektör ve Şirket', 'industry', 'render_industry'),
+    Section('seniority', '📦 Kıdem vs Maaş', 'seniority', 'render_seniority'),
+    Section('skills', '🛠️ Beceri Analizi', 'skills', 'render_skills'),
+    Section('location', '🌍 Lokasyon', 'location', 'render_location'),
+    Section('advanced', '🎯 İleri Düzey', 'advanced', 'render_advanced'),
+]
+SECTIONS_BY_KEY = {section.key: section for section in SECTIONS}
@@ -0,0 +1,416 @@
+# =============================================================================
+# 🎯 BÖLÜM: İLERİ DÜZEY GÖRSELLEŞTİRMELER
+# =============================================================================
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from figures import cached_figure
+from filters import has_value
+from geometry import box_geometry, density_curves, ridge_traces, violin_traces
+from instrumentation import instrumented, measure_section
+from jobs_analytics import salary_by
+from loaders import load_filtered_data, load_salary_cube
+from tables import create_dark_table
+
+# Ridgeline'da seçilebilecek en fazla lokasyon sayısı
+RIDGE_MAX_LOCATIONS = 40
+
+
+def _group_sketches(df, cube, dim):
+    """Maaşı olan gruplar için grup değeri -> maaş özeti"""
+    groups = salary_by(df, dim, cube=cube)
+    groups = groups[groups['count'] > 0]
+    return dict(zip(groups[dim], groups['sketch']))
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_advanced(data_key, filters):
+    """Dumbbell ve error bar istatistikleri, ridgeline ve violin şekilleri"""
+    df = load_filtered_data(*data_key, filters)
+    cube = load_salary_cube(*data_key, filters)
+
+    seniority_salary = salary_by(df, 'seniority_level', cube=cube)[['seniority_level', 'min', 'max', 'mean', 'count']]
+    seniority_salary.columns = ['Kıdem', 'Min Maaş', 'Max Maaş', 'Ort Maaş', 'İlan Sayısı']
+    seniority_salary = seniority_salary.dropna()
+    seniority_salary = seniority_salary.sort_values('Ort Maaş', ascending=True)
+
+    status_stats = salary_by(df, 'status', cube=cube)[['status', 'mean', 'std', 'count']]
+    status_stats.columns = ['Çalışma Modeli', 'Ortalama', 'Std Sapma', 'Sayı']
+    status_stats = status_stats.dropna()
+    status_stats['Std Sapma'] = status_stats['Std Sapma'].fillna(0)
+
+    top_industries = df['industry'].value_counts().head(5).index.tolist()
+    # Violinler, grupların maaşlı ilanlarda ilk göründüğü sırada çizilir
+    salaried = df[df['salary_numeric'].notna()]
+    industry_order = salaried.loc[salaried['industry'].isin(top_industries), 'industry'].unique().tolist()
+    seniority_order = salaried.loc[has_value(salaried['seniority_level']), 'seniority_level'].unique().tolist()
+
+    # Yoğunluk eğrileri ve kutular grup özetlerinden (ham maaş dizileri gönderilmez)
+    industry_sketches = _group_sketches(df, cube, 'industry')
+    industry_sketches = [industry_sketches[industry] for industry in industry_order]
+    seniority_sketches = _group_sketches(df, cube, 'seniority_level')
+    seniority_sketches = [seniority_sketches[level] for level in seniority_order]
+
+    return {
+        'seniority_salary': seniority_salary,
+        'status_stats': status_stats,
+        'industry_violins': list(zip(
+            industry_order, density_curves(industry_sketches), map(box_geometry, industry_sketches)
+        )),
+        'seniority_violins': list(zip(
+            seniority_order, density_curves(seniority_sketches), map(box_geometry, seniority_sketches)
+        )),
+    }
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_location_densities(data_key, filters):
+    """Maaşı olan en çok ilanlı RIDGE_MAX_LOCATIONS şirket merkezinin yoğunluk eğrileri (tek FFT çağrısı)
+
+    Yalnızca ridgeline'da gösterilebilecek merkezler hesaplanır; ortak KDE
+    ızgarası da bu merkezlerin maaş aralığından kurulur.
+    """
+    df = load_filtered_data(*data_key, filters)
+    location_sketches = _group_sketches(df, load_salary_cube(*data_key, filters), 'headquarter')
+    locations = [
+        location for location in df['headquarter'].value_counts().index
+        if location in location_sketches
+    ][:RIDGE_MAX_LOCATIONS]
+    curves = density_curves([location_sketches[location] for location in locations])
+    return list(zip(locations, curves))
+
+
+@cached_figure
+def build_ridgeline_figure(data_key, filters, ridge_size):
+    """En çok ilan veren ridge_size şirket merkezinin ridgeline figürü"""
+    ridge = compute_location_densities(data_key, filters)[:ridge_size]
+
+    fig_ridge = go.Figure()
+
+    colors = ['#00d4ff', '#ff6b6b', '#48bb78', '#ed8936', '#9f7aea', '#f687b3', '#68d391', '#fc8181']
+
+    for i, (location, curve) in enumerate(ridge):
+        fig_ridge.add_traces(ridge_traces(curve, location, colors[i % len(colors)], i))
+
+    fig_ridge.update_layout(
+        title='<b>Lokasyona Göre Maaş Dağılımı (Ridgeline Tarzı)</b>',
+        template='plotly_dark',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        title_font=dict(size=18, color='#00d4ff'),
+        font=dict(color='#e0e0e0'),
+        xaxis_title='Maaş (€)',
+        yaxis=dict(
+            title='',
+            tickmode='array',
+            tickvals=list(range(len(ridge))),
+            ticktext=[location for location, _ in ridge]
+        ),
+        # Lokasyon sayısı arttıkça satırlar sıkışmasın
+        height=max(550, 45 * len(ridge))
+    )
+    return fig_ridge
+
+
+@cached_figure
+def build_dumbbell_figure(data_key, filters):
+    """Kıdem seviyelerine göre min - ortalama - max maaş dumbbell figürü"""
+    seniority_salary = compute_advanced(data_key, filters)['seniority_salary']
+
+    fig_dumbbell = go.Figure()
+
+    # Çizgiler (min-max arası)
+    for i, row in seniority_salary.iterrows():
+        fig_dumbbell.add_trace(go.Scatter(
+            x=[row['Min Maaş'], row['Max Maaş']],
+            y=[row['Kıdem'], row['Kıdem']],
+            mode='lines',
+            line=dict(color='#4a5568', width=3),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+
+    # Min noktaları (kırmızı)
+    fig_dumbbell.add_trace(go.Scatter(
+        x=seniority_salary['Min Maaş'],
+        y=seniority_salary['Kıdem'],
+        mode='markers',
+        marker=dict(color='#ff6b6b', size=14, symbol='circle'),
+        name='Min Maaş',
+        hovertemplate='<b>%{y}</b><br>Min Maaş: €%{x:,.0f}<extra></extra>'
+    ))
+
+    # Max noktaları (mavi)
+    fig_dumbbell.add_trace(go.Scatter(
+        x=seniority_salary['Max Maaş'],
+        y=seniority_salary['Kıdem'],
+        mode='markers',
+        marker=dict(color='#00d4ff', size=14, symbol='circle'),
+        name='Max Maaş',
+        hovertemplate='<b>%{y}</b><br>Max Maaş: €%{x:,.0f}<extra></extra>'
+    ))
+
+    # Ortalama noktaları (yeşil)
+    fig_dumbbell.add_trace(go.Scatter(
+        x=seniority_salary['Ort Maaş'],
+        y=seniority_salary['Kıdem'],
+        mode='markers',
+        marker=dict(color='#48bb78', size=10, symbol='diamond'),
+        name='Ortalama Maaş',
+        hovertemplate='<b>%{y}</b><br>Ort Maaş: €%{x:,.0f}<extra></extra>'
+    ))
+
+    fig_dumbbell.update_layout(
+        title='<b>Kıdem Seviyesine Göre Maaş Aralığı (Min - Ort - Max)</b>',
+        template='plotly_dark',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        title_font=dict(size=18, color='#00d4ff'),
+        font=dict(color='#e0e0e0'),
+        xaxis_title='Maaş (€)',
+        yaxis_title='',
+        height=450,
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+    )
+    return fig_dumbbell
+
+
+@cached_figure
+def build_error_bar_figure(data_key, filters):
+    """Çalışma modeline göre ortalama maaş ± standart sapma figürü"""
+    status_stats = compute_advanced(data_key, filters)['status_stats']
+
+    fig_error = go.Figure()
+
+    fig_error.add_trace(go.Bar(
+        x=status_stats['Çalışma Modeli'],
+        y=status_stats['Ortalama'],
+        error_y=dict(
+            type='data',
+            array=status_stats['Std Sapma'],
+            visible=True,
+            color='#ff6b6b',
+            thickness=2,
+            width=8
+        ),
+        marker_color='#00d4ff',
+        name='Ortalama Maaş',
+        text=[f"€{x:,.0f}" for x in status_stats['Ortalama']],
+        textposition='outside',
+        textfont=dict(color='#e0e0e0')
+    ))
+
+    fig_error.update_layout(
+        title='<b>Çalışma Modeline Göre Ortalama Maaş (± Standart Sapma)</b>',
+        template='plotly_dark',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        title_font=dict(size=18, color='#00d4ff'),
+        font=dict(color='#e0e0e0'),
+        xaxis_title='Çalışma Modeli',
+        yaxis_title='Maaş (€)',
+        height=450,
+        showlegend=False
+    )
+    return fig_error
+
+
+@cached_figure
+def build_industry_violin_figure(data_key, filters):
+    """En sık 5 sektörün maaş violin figürü"""
+    industry_violins = compute_advanced(data_key, filters)['industry_violins']
+    colors = ['#00d4ff', '#ff6b6b', '#48bb78', '#ed8936', '#9f7aea']
+
+    fig_violin1 = go.Figure()
+    for i, (industry, curve, geometry) in enumerate(industry_violins):
+        fig_violin1.add_traces(violin_traces(curve, geometry, industry, colors[i % len(colors)], i))
+    fig_violin1.update_layout(
+        title='<b>Sektöre Göre Maaş Dağılımı (Violin Plot)</b>',
+        template='plotly_dark',
+        title_font=dict(size=18, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        height=500,
+        showlegend=False,
+        xaxis=dict(
+            title='Sektör',
+            tickmode='array',
+            tickvals=list(range(len(industry_violins))),
+            ticktext=[industry for industry, _, _ in industry_violins],
+            tickangle=-30
+        ),
+        yaxis_title='Maaş (€)'
+    )
+    return fig_violin1
+
+
+@cached_figure
+def build_seniority_violin_figure(data_key, filters):
+    """Kıdem seviyelerinin maaş violin figürü"""
+    seniority_violins = compute_advanced(data_key, filters)['seniority_violins']
+    colors = ['#00d4ff', '#ff6b6b', '#48bb78', '#ed8936']
+
+    fig_violin2 = go.Figure()
+    for i, (level, curve, geometry) in enumerate(seniority_violins):
+        fig_violin2.add_traces(violin_traces(curve, geometry, level, colors[i % len(colors)], i))
+    fig_violin2.update_layout(
+        title='<b>Kıdem Seviyesine Göre Maaş Dağılımı (Violin Plot)</b>',
+        template='plotly_dark',
+        title_font=dict(size=18, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        height=500,
+        showlegend=False,
+        xaxis=dict(
+            title='Kıdem Seviyesi',
+            tickmode='array',
+            tickvals=list(range(len(seniority_violins))),
+            ticktext=[level for level, _, _ in seniority_violins]
+        ),
+        yaxis_title='Maaş (€)'
+    )
+    return fig_violin2
+
+
+@st.fragment
+@measure_section('advanced.ridgeline')
+def render_ridgeline(data_key, filters):
+    """Seçilen sayıda şirket merkezi için ridgeline (tek taraflı KDE eğrileri üst üste)"""
+    location_densities = compute_location_densities(data_key, filters)
+    n_locations = len(location_densities)
+
+    # En çok ilan veren lokasyonlar (headquarter)
+    ridge_size = st.slider(
+        "Gösterilecek lokasyon sayısı",
+        min_value=min(3, n_locations),
+        max_value=min(RIDGE_MAX_LOCATIONS, n_locations),
+        value=min(8, n_locations),
+        key='ridge_locations'
+    ) if n_locations > 3 else n_locations
+    st.plotly_chart(build_ridgeline_figure(data_key, filters, ridge_size), use_container_width=True)
+
+
+@st.fragment
+@measure_section('advanced')
+def render_advanced(df, data_key, filters):
+    """Dumbbell, ridgeline, error bar ve violin grafikleri"""
+    # ==========================================================================
+    # 🎯 İLERİ DÜZEY GRAFİKLER
+    # ==========================================================================
+    st.header("🎯 İleri Düzey Görselleştirmeler")
+    
+    aggregates = compute_advanced(data_key, filters)
+    
+    # --------------------------------------------------------------------------
+    # 1️⃣ DUMBBELL CHART - Kıdem Seviyelerine Göre Min-Max Maaş Karşılaştırması
+    # --------------------------------------------------------------------------
+    st.subheader("🏋️ Dumbbell Chart: Kıdem Seviyelerine Göre Maaş Aralığı")
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>📌 Dumbbell Chart Nedir?</strong> Her kıdem seviyesi için minimum ve maksimum maaş 
+        değerlerini gösterir. İki nokta arasındaki çizgi, maaş aralığının genişliğini temsil eder.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Kıdem seviyesine göre min-max maaş
+    st.plotly_chart(build_dumbbell_figure(data_key, filters), use_container_width=True)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Lead pozisyonlar en geniş maaş aralığına sahipken, Junior pozisyonlar 
+        daha dar bir aralıkta kalmaktadır. Kırmızı noktalar minimum, mavi noktalar maksimum, yeşil 
+        elmaslar ise ortalama maaşı göstermektedir.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # --------------------------------------------------------------------------
+    # 2️⃣ RIDGELINE PLOT - Lokasyona Göre Maaş Dağılımı
+    # --------------------------------------------------------------------------
+    st.subheader("🌊 Ridgeline Plot: Lokasyona Göre Maaş Dağılımı")
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>📌 Ridgeline Plot Nedir?</strong> Farklı kategorilerin dağılımlarını üst üste 
+        yerleştirerek karşılaştırmayı kolaylaştırır. Her lokasyonun maaş dağılımını görmek için idealdir.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    render_ridgeline(data_key, filters)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> San Francisco ve New York gibi teknoloji merkezleri en geniş ve yüksek 
+        maaş dağılımına sahiptir. Farklı lokasyonlar arasındaki maaş farkları açıkça görülmektedir. 
+        Silikon Vadisi lokasyonları diğer bölgelere göre belirgin şekilde yüksek maaş sunmaktadır.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # --------------------------------------------------------------------------
+    # 3️⃣ ERROR BAR CHART - Çalışma Modeline Göre Maaş (Ortalama ± Std)
+    # --------------------------------------------------------------------------
+    st.subheader("📊 Error Bar Chart: Çalışma Modeline Göre Maaş Dağılımı")
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>📌 Error Bar Chart Nedir?</strong> Ortalama değerleri ve belirsizlik/varyans 
+        aralığını gösterir. Hata çubukları, standart sapma veya güven aralığını temsil eder.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Çalışma modeline göre maaş istatistikleri
+    status_stats = aggregates['status_stats']
+    
+    st.plotly_chart(build_error_bar_figure(data_key, filters), use_container_width=True)
+    
+    # İstatistik tablosu
+    error_table = status_stats.copy()
+    error_table['Ortalama'] = error_table['Ortalama'].apply(lambda x: f"€{x:,.0f}")
+    error_table['Std Sapma'] = error_table['Std Sapma'].apply(lambda x: f"€{x:,.0f}")
+    st.markdown(create_dark_table(error_table), unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Remote pozisyonlar en yüksek ortalama maaşa sahipken, aynı zamanda 
+        en yüksek standart sapmaya da sahiptir. Bu, remote pozisyonlarda maaş çeşitliliğinin 
+        daha fazla olduğunu göstermektedir.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # --------------------------------------------------------------------------
+    # 4️⃣ VIOLIN PLOT - Sektör ve Kıdem Seviyesine Göre Maaş
+    # --------------------------------------------------------------------------
+    st.subheader("🎻 Violin Plot: Sektör ve Kıdem Seviyesine Göre Maaş Dağılımı")
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>📌 Violin Plot Nedir?</strong> Box plot ve KDE (yoğunluk grafiği) birleşimidir. 
+        Dağılımın şeklini, medyanı ve çeyreklikleri aynı anda gösterir.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # İlk olarak sektöre göre violin plot (en sık 5 sektör)
+    st.plotly_chart(build_industry_violin_figure(data_key, filters), use_container_width=True)
+    
+    # Kıdem seviyesine göre violin plot
+    st.plotly_chart(build_seniority_violin_figure(data_key, filters), use_container_width=True)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Violin plotlar, maaş dağılımının şeklini net bir şekilde ortaya koyar. 
+        Technology sektöründe çift tepeli (bimodal) bir dağılım görülürken, Lead pozisyonlarda 
+        maaşlar geniş bir aralığa yayılmaktadır. Junior pozisyonlar ise dar ve düşük bir aralıkta 
+        yoğunlaşmıştır.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,80 @@
+# =============================================================================
+# 🔗 BÖLÜM: KORELASYON ANALİZİ
+# =============================================================================
+
+import streamlit as st
+
+from images import DEFAULT_THEME, THEMES, figure_png, new_figure
+from instrumentation import instrumented, measure_section
+from loaders import load_filtered_data
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_correlation(data_key, filters):
+    """Sayısal değişkenlerin korelasyon matrisi (yeterli veri yoksa None)"""
+    df = load_filtered_data(*data_key, filters)
+    numeric_for_corr = df[['salary_numeric', 'company_size_numeric', 'skills_count']].dropna()
+    if len(numeric_for_corr) <= 10:
+        return None
+    return numeric_for_corr.corr()
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_correlation_png(data_key, filters, theme=DEFAULT_THEME):
+    """Korelasyon ısı haritasının PNG görüntüsü (yeterli veri yoksa None)"""
+    corr_matrix = compute_correlation(data_key, filters)
+    if corr_matrix is None:
+        return None
+
+    import seaborn as sns  # yalnızca görsel ilk kez üretilirken yüklenir
+
+    palette = THEMES[theme]
+    fig_corr, ax = new_figure((6, 5), theme)  # Küçültülmüş boyut
+    sns.heatmap(
+        corr_matrix,
+        annot=True,
+        cmap='coolwarm',
+        center=0,
+        fmt='.2f',
+        linewidths=0.5,
+        ax=ax,
+        annot_kws={'color': palette['text'], 'fontsize': 11},
+        cbar_kws={'shrink': 0.8}
+    )
+
+    labels = ['Maaş', 'Şirket Büyüklüğü', 'Beceri Sayısı']
+    ax.set_xticklabels(labels, color=palette['text'], fontsize=10)
+    ax.set_yticklabels(labels, color=palette['text'], rotation=0, fontsize=10)
+    ax.set_title('Korelasyon Isı Haritası', fontsize=14, fontweight='bold', color=palette['accent'], pad=15)
+
+    fig_corr.tight_layout()
+    return figure_png(fig_corr)
+
+
+@st.fragment
+@measure_section('correlation')
+def render_correlation(df, data_key, filters):
+    """Sayısal değişkenler arası korelasyon"""
+    # ==========================================================================
+    # 6️⃣ KORELASYON ANALİZİ
+    # ==========================================================================
+    st.header("🔗 Korelasyon Analizi")
+    
+    # Isı haritası veri anahtarı / filtre / tema başına bir kez PNG olarak üretilir
+    corr_png = compute_correlation_png(data_key, filters)
+    
+    if corr_png is not None:
+        # Küçültülmüş korelasyon grafiği
+        col1, col2, col3 = st.columns([1, 2, 1])
+        
+        with col2:
+            st.image(corr_png, use_container_width=True)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Korelasyon analizi, değişkenler arasındaki doğrusal ilişkileri gösterir. 
+        +1'e yakın değerler güçlü pozitif, -1'e yakın değerler güçlü negatif ilişkiyi ifade eder.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,108 @@
+# =============================================================================
+# 📈 BÖLÜM: BETİMSEL İSTATİSTİKLER
+# =============================================================================
+
+import pandas as pd
+import streamlit as st
+
+from filters import has_value
+from instrumentation import instrumented, measure_section
+from jobs_analytics import descriptive_stats
+from loaders import load_filtered_data
+from tables import create_dark_table
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_descriptive_stats(data_key, filters):
+    """Sayısal özet tablosu ve kategorik değişken sıklıkları"""
+    df = load_filtered_data(*data_key, filters)
+
+    stats = descriptive_stats(df, ['salary_numeric', 'company_size_numeric', 'skills_count'])
+    salary, size, skills = stats['salary_numeric'], stats['company_size_numeric'], stats['skills_count']
+    has_size = size['count'] > 0
+
+    numeric_stats = pd.DataFrame({
+        'İstatistik': ['Ortalama', 'Medyan', 'Std Sapma', 'Min', 'Max', 'Geçerli Değer'],
+        'Maaş (€)': [
+            f"{salary['mean']:,.0f}",
+            f"{salary['median']:,.0f}",
+            f"{salary['std']:,.0f}",
+            f"{salary['min']:,.0f}",
+            f"{salary['max']:,.0f}",
+            f"{salary['count']:,.0f}"
+        ],
+        'Şirket Büyüklüğü': [
+            f"{size['mean']:,.0f}" if has_size else "N/A",
+            f"{size['median']:,.0f}" if has_size else "N/A",
+            f"{size['std']:,.0f}" if has_size else "N/A",
+            f"{size['min']:,.0f}" if has_size else "N/A",
+            f"{size['max']:,.0f}" if has_size else "N/A",
+            f"{size['count']:,.0f}"
+        ],
+        'Beceri Sayısı': [
+            f"{skills['mean']:.1f}",
+            f"{skills['median']:.0f}",
+            f"{skills['std']:.1f}",
+            f"{skills['min']:.0f}",
+            f"{skills['max']:.0f}",
+            f"{len(df):,}"
+        ]
+    })
+
+    job_counts = df['job_title'].value_counts().head(5).reset_index()
+    job_counts.columns = ['Pozisyon', 'Sayı']
+
+    seniority_data = df[has_value(df['seniority_level'])]['seniority_level'].value_counts().reset_index()
+    seniority_data.columns = ['Kıdem', 'Sayı']
+
+    status_data = df[has_value(df['status'])]['status'].value_counts().reset_index()
+    status_data.columns = ['Model', 'Sayı']
+
+    return {
+        'numeric': numeric_stats,
+        'jobs': job_counts,
+        'seniority': seniority_data,
+        'status': status_data,
+    }
+
+
+@st.fragment
+@measure_section('descriptive')
+def render_descriptive_stats(df, data_key, filters):
+    """Sayısal ve kategorik değişken özetleri"""
+    # ==========================================================================
+    # 4️⃣ BETİMSEL İSTATİSTİKLER
+    # ==========================================================================
+    st.header("📈 Betimsel İstatistikler")
+    
+    # Sayısal değişkenler tablosu
+    st.subheader("🔢 Sayısal Değişkenler")
+    
+    tables = compute_descriptive_stats(data_key, filters)
+    st.markdown(create_dark_table(tables['numeric']), unsafe_allow_html=True)
+    
+    # Kategorik değişken dağılımları - TABLO FORMATINDA
+    st.subheader("📝 Kategorik Değişken Dağılımları")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**İş Pozisyonları**")
+        st.markdown(create_dark_table(tables['jobs']), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("**Kıdem Seviyeleri**")
+        st.markdown(create_dark_table(tables['seniority']), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("**Çalışma Modeli**")
+        st.markdown(create_dark_table(tables['status']), unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Data Scientist pozisyonu en yaygın iş türüdür. Senior seviye 
+        pozisyonlar çoğunluğu oluştururken, hybrid ve on-site çalışma modelleri en çok tercih 
+        edilen seçeneklerdir.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,197 @@
+# =============================================================================
+# 📊 BÖLÜM: DAĞILIM GRAFİKLERİ
+# =============================================================================
+
+import plotly.express as px
+import streamlit as st
+
+from figures import cached_figure
+from filters import has_value
+from instrumentation import instrumented, measure_section
+from loaders import load_filtered_data
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_distributions(data_key, filters):
+    """Kıdem, çalışma modeli ve sektör (ilk 15) ilan sayıları"""
+    df = load_filtered_data(*data_key, filters)
+
+    seniority_valid = df[has_value(df['seniority_level'])]
+    seniority_counts = seniority_valid['seniority_level'].value_counts().reset_index()
+    seniority_counts.columns = ['Kıdem', 'Sayı']
+
+    status_valid = df[has_value(df['status'])]
+    status_counts = status_valid['status'].value_counts().reset_index()
+    status_counts.columns = ['Model', 'Sayı']
+
+    industry_counts = df['industry'].value_counts().head(15).reset_index()
+    industry_counts.columns = ['Sektör', 'Sayı']
+
+    return {
+        'seniority': seniority_counts,
+        'status': status_counts,
+        'industry': industry_counts,
+    }
+
+
+@cached_figure
+def build_seniority_count_figure(data_key, filters):
+    """Kıdem seviyesi ilan sayıları figürü"""
+    seniority_counts = compute_distributions(data_key, filters)['seniority']
+
+    fig_seniority = px.bar(
+        seniority_counts,
+        x='Kıdem',
+        y='Sayı',
+        title='<b>Kıdem Seviyesi Dağılımı (Countplot)</b>',
+        template='plotly_dark',
+        height=400
+    )
+    fig_seniority.update_traces(marker_color='#00d4ff')
+    fig_seniority.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        showlegend=False
+    )
+    return fig_seniority
+
+
+@cached_figure
+def build_status_count_figure(data_key, filters):
+    """Çalışma modeli ilan sayıları figürü"""
+    status_counts = compute_distributions(data_key, filters)['status']
+
+    fig_status = px.bar(
+        status_counts,
+        x='Model',
+        y='Sayı',
+        title='<b>Çalışma Modeli Dağılımı (Countplot)</b>',
+        template='plotly_dark',
+        height=400
+    )
+    fig_status.update_traces(marker_color='#00d4ff')
+    fig_status.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        showlegend=False
+    )
+    return fig_status
+
+
+@cached_figure
+def build_status_pie_figure(data_key, filters):
+    """Çalışma modeli oranları pasta figürü"""
+    status_counts = compute_distributions(data_key, filters)['status']
+
+    fig_pie = px.pie(
+        status_counts,
+        values='Sayı',
+        names='Model',
+        title='<b>Remote / Hybrid / On-site Oranları</b>',
+        template='plotly_dark',
+        color_discrete_sequence=px.colors.qualitative.Set3,
+        hole=0.4
+    )
+    fig_pie.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0')
+    )
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    return fig_pie
+
+
+@cached_figure
+def build_industry_count_figure(data_key, filters):
+    """İlk 15 sektörün ilan sayıları figürü"""
+    industry_counts = compute_distributions(data_key, filters)['industry']
+
+    fig_industry = px.bar(
+        industry_counts,
+        y='Sektör',
+        x='Sayı',
+        orientation='h',
+        title='<b>İlk 15 Sektörün İlan Sayısı</b>',
+        template='plotly_dark',
+        height=450
+    )
+    fig_industry.update_traces(marker_color='#00d4ff')
+    fig_industry.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig_industry
+
+
+@st.fragment
+@measure_section('distributions')
+def render_distributions(df, data_key, filters):
+    """Kıdem, çalışma modeli ve sektör dağılımları"""
+    # ==========================================================================
+    # 5️⃣ DAĞILIM GRAFİKLERİ (COUNTPLOTS)
+    # ==========================================================================
+    st.header("📊 Dağılım Grafikleri")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # 1. Seniority Level Distribution - Countplot
+        st.subheader("👔 Kıdem Seviyesi Dağılımı")
+        
+        st.plotly_chart(build_seniority_count_figure(data_key, filters), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Senior pozisyonlar en yüksek talep gören kıdem seviyesidir. 
+            Junior pozisyonlar nispeten daha az ilan içermektedir.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # 2. Work Model Distribution - Countplot
+        st.subheader("🏢 Çalışma Modeli Dağılımı")
+        
+        st.plotly_chart(build_status_count_figure(data_key, filters), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Hybrid ve on-site çalışma modelleri en yaygın tercihlerdir. 
+            Remote pozisyonlar da önemli bir pay almaktadır.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # 11. Work Status Distribution - Pie Chart
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🥧 Çalışma Modeli Oranları (Pie Chart)")
+        
+        st.plotly_chart(build_status_pie_figure(data_key, filters), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Pasta grafiği, çalışma modellerinin oransal dağılımını gösterir. 
+            Şirketlerin çoğu hibrit veya ofis bazlı çalışmayı tercih etmektedir.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # 4. Industry Distribution - Countplot (Top 15)
+        st.subheader("🏭 Sektör Dağılımı (Top 15)")
+        
+        st.plotly_chart(build_industry_count_figure(data_key, filters), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Technology sektörü veri bilimi ilanlarında açık ara lider konumdadır. 
+            Finance ve Healthcare sektörleri de önemli istihdam kaynakları arasındadır.
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,175 @@
+# =============================================================================
+# 🏢 BÖLÜM: SEKTÖR VE ŞİRKET ANALİZLERİ
+# =============================================================================
+
+import plotly.express as px
+import streamlit as st
+
+from figures import cached_figure
+from instrumentation import instrumented, measure_section
+from jobs_analytics import posting_trend, salary_by
+from loaders import load_filtered_data, load_salary_cube
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_industry(data_key, filters):
+    """Sektör ortalama maaşları, saçılım verisi ve günlük ilan trendi"""
+    df = load_filtered_data(*data_key, filters)
+
+    industry_salary = salary_by(df, 'industry', cube=load_salary_cube(*data_key, filters))[['industry', 'mean']]
+    industry_salary.columns = ['Sektör', 'Ortalama Maaş']
+    industry_salary = industry_salary.dropna().sort_values('Ortalama Maaş', ascending=True).tail(12)
+
+    # Aşırı değerler (%5 - %95 dışı) saçılım grafiğinden çıkarılır
+    scatter_df = df[['company_size_numeric', 'salary_numeric', 'industry', 'company', 'status']].dropna()
+    q1_size = scatter_df['company_size_numeric'].quantile(0.05)
+    q3_size = scatter_df['company_size_numeric'].quantile(0.95)
+    q1_salary = scatter_df['salary_numeric'].quantile(0.05)
+    q3_salary = scatter_df['salary_numeric'].quantile(0.95)
+    scatter_df = scatter_df[
+        (scatter_df['company_size_numeric'] >= q1_size) &
+        (scatter_df['company_size_numeric'] <= q3_size) &
+        (scatter_df['salary_numeric'] >= q1_salary) &
+        (scatter_df['salary_numeric'] <= q3_salary)
+    ]
+
+    trend_df = posting_trend(df).rename(columns={'days_ago': 'Gün', 'postings': 'İlan Sayısı'})
+
+    return {
+        'industry_salary': industry_salary,
+        'scatter': scatter_df,
+        'trend': trend_df,
+    }
+
+
+@cached_figure
+def build_industry_salary_figure(data_key, filters):
+    """Sektörlere göre ortalama maaş figürü (en yüksek 12 sektör)"""
+    industry_salary = compute_industry(data_key, filters)['industry_salary']
+
+    fig_ind_salary = px.bar(
+        industry_salary,
+        x='Ortalama Maaş',
+        y='Sektör',
+        orientation='h',
+        title='<b>Sektöre Göre Ortalama Maaş</b>',
+        template='plotly_dark',
+        height=450
+    )
+    fig_ind_salary.update_traces(marker_color='#00d4ff')
+    fig_ind_salary.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig_ind_salary
+
+
+@cached_figure
+def build_size_salary_figure(data_key, filters):
+    """Şirket büyüklüğü - maaş saçılım figürü"""
+    scatter_df = compute_industry(data_key, filters)['scatter']
+
+    fig_scatter = px.scatter(
+        scatter_df,
+        x='company_size_numeric',
+        y='salary_numeric',
+        color='industry',
+        size='salary_numeric',
+        hover_data=['company', 'status'],
+        title='<b>Şirket Büyüklüğü ve Maaş İlişkisi</b>',
+        template='plotly_dark',
+        labels={'company_size_numeric': 'Şirket Büyüklüğü', 'salary_numeric': 'Maaş (€)'},
+        height=450
+    )
+    fig_scatter.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        legend=dict(font=dict(size=9))
+    )
+    return fig_scatter
+
+
+@cached_figure
+def build_trend_figure(data_key, filters):
+    """Günlük ilan yayınlama trendi figürü"""
+    trend_df = compute_industry(data_key, filters)['trend']
+
+    fig_trend = px.line(
+        trend_df,
+        x='Gün',
+        y='İlan Sayısı',
+        title='<b>İlan Yayınlama Trendi (Gün Bazında)</b>',
+        template='plotly_dark',
+        markers=True,
+        height=400
+    )
+    fig_trend.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        xaxis_title='Kaç Gün Önce',
+        yaxis_title='İlan Sayısı'
+    )
+    fig_trend.update_traces(line_color='#00d4ff', marker_color='#ff6b6b')
+    return fig_trend
+
+
+@st.fragment
+@measure_section('industry')
+def render_industry(df, data_key, filters):
+    """Sektör/şirket analizleri ve ilan trendi"""
+    # ==========================================================================
+    # 8️⃣ SEKTÖR VE ŞİRKET ANALİZLERİ
+    # ==========================================================================
+    st.header("🏢 Sektör ve Şirket Analizleri")
+    
+    aggregates = compute_industry(data_key, filters)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # 9. Average Salary by Industry - Bar Plot
+        st.subheader("💰 Sektöre Göre Ortalama Maaş")
+        
+        st.plotly_chart(build_industry_salary_figure(data_key, filters), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Sektörler arasında maaş farklılıkları belirgindir. 
+            Teknoloji ve finans sektörleri en yüksek ortalama maaşları sunmaktadır.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # 7. Salary vs Company Size - Scatter Plot
+        st.subheader("📈 Şirket Büyüklüğü vs Maaş")
+        
+        if len(aggregates['scatter']) > 0:
+            st.plotly_chart(build_size_salary_figure(data_key, filters), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Şirket büyüklüğü ile maaş arasındaki ilişki sektöre göre değişkenlik gösterir. 
+            Büyük şirketler genellikle daha yüksek maaş sunma eğilimindedir.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # 10. Daily Job Posting Trend - Line Chart
+    st.subheader("📅 Günlük İlan Yayınlama Trendi")
+    
+    if len(aggregates['trend']) > 0:
+        st.plotly_chart(build_trend_figure(data_key, filters), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> İlan yayınlama trendi, piyasadaki işe alım aktivitesini gösterir. 
+            Son günlerde yoğunlaşan ilanlar, aktif bir işe alım dönemini işaret etmektedir.
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,77 @@
+# =============================================================================
+# 🌍 BÖLÜM: LOKASYON
+# =============================================================================
+
+import plotly.express as px
+import streamlit as st
+
+from figures import cached_figure
+from instrumentation import instrumented, measure_section
+from jobs_analytics import salary_by
+from loaders import load_filtered_data, load_salary_cube
+from tables import render_dark_table
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_location(data_key, filters):
+    """Maaşı olan şirket merkezlerinin ilan sayısı ve ortalama maaşı (ilan sayısına göre azalan)"""
+    df = load_filtered_data(*data_key, filters)
+    hq_data = salary_by(df, 'headquarter', cube=load_salary_cube(*data_key, filters))[['headquarter', 'mean', 'postings']]
+    hq_data.columns = ['Merkez', 'Ortalama Maaş', 'İlan Sayısı']
+    return hq_data.dropna().sort_values('İlan Sayısı', ascending=False)
+
+
+@cached_figure
+def build_location_figure(data_key, filters):
+    """En çok ilan veren 12 şirket merkezinin ilan sayısı figürü"""
+    hq_data = compute_location(data_key, filters).head(12)
+
+    fig_location = px.bar(
+        hq_data,
+        x='Merkez',
+        y='İlan Sayısı',
+        title='<b>Şirket Merkezine Göre İlan Sayısı</b>',
+        template='plotly_dark',
+        height=500
+    )
+    fig_location.update_traces(marker_color='#00d4ff')
+    fig_location.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        xaxis_tickangle=-45
+    )
+    return fig_location
+
+
+@st.fragment
+@measure_section('location')
+def render_location(df, data_key, filters):
+    """Şirket merkezine göre ilan ve maaş"""
+    # ==========================================================================
+    # 🌍 LOKASYON
+    # ==========================================================================
+    st.header("🌍 Lokasyon")
+    
+    st.subheader("🌍 Lokasyon Bazlı Analiz")
+    
+    # Headquarter bazlı analiz - BARPLOT
+    hq_data = compute_location(data_key, filters)
+    
+    st.plotly_chart(build_location_figure(data_key, filters), use_container_width=True)
+    
+    # Lokasyon tablosu
+    st.subheader("📊 Lokasyon Detayları")
+    location_table = hq_data.copy()
+    location_table['Ortalama Maaş'] = location_table['Ortalama Maaş'].apply(lambda x: f"€{x:,.0f}")
+    render_dark_table(location_table, key='location_table_page')
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> San Francisco, New York ve Seattle gibi teknoloji merkezleri 
+        hem en fazla iş ilanına hem de en yüksek maaşlara sahiptir. Coğrafi konum, maaş 
+        beklentilerini önemli ölçüde etkilemektedir.
+    </div>
+    """, unsafe_allow_html=True)
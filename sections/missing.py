@@ -0,0 +1,92 @@
+# =============================================================================
+# 🔍 BÖLÜM: EKSİK DEĞER ANALİZİ
+# =============================================================================
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from figures import cached_figure
+from instrumentation import instrumented, measure_section
+from loaders import load_filtered_data
+from parsing import DERIVED_COLUMNS
+from tables import create_dark_table
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_missing_values(data_key, filters):
+    """Orijinal sütunların eksik (boş veya boş metin) değer sayıları"""
+    df = load_filtered_data(*data_key, filters)
+    original_cols = [col for col in df.columns if col not in DERIVED_COLUMNS]
+    missing_data = []
+    for col in original_cols:
+        null_count = df[col].isnull().sum()
+        empty_count = (df[col] == '').sum() if df[col].dtype == 'object' else 0
+        total_missing = null_count + empty_count
+        missing_data.append({
+            'Sütun': col,
+            'Eksik Sayı': total_missing,
+            'Oran (%)': round(total_missing / len(df) * 100, 2)
+        })
+    return pd.DataFrame(missing_data).sort_values('Eksik Sayı', ascending=False)
+
+
+@cached_figure
+def build_missing_figure(data_key, filters):
+    """Eksik değeri olan sütunların eksik değer sayıları figürü"""
+    missing_df = compute_missing_values(data_key, filters)
+    missing_filtered = missing_df[missing_df['Eksik Sayı'] > 0]
+
+    fig_missing = px.bar(
+        missing_filtered,
+        x='Sütun',
+        y='Eksik Sayı',
+        color='Oran (%)',
+        title='<b>Sütunlara Göre Eksik Değer Dağılımı</b>',
+        template='plotly_dark',
+        color_continuous_scale='Reds',
+        height=450  # Daha yüksek
+    )
+    fig_missing.update_layout(
+        title_font=dict(size=18, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        xaxis_tickangle=-45
+    )
+    return fig_missing
+
+
+@st.fragment
+@measure_section('missing')
+def render_missing_values(df, data_key, filters):
+    """Sütun bazında eksik değer sayıları"""
+    # ==========================================================================
+    # 3️⃣ EKSİK DEĞER ANALİZİ
+    # ==========================================================================
+    st.header("🔍 Eksik Değer Analizi")
+    
+    missing_df = compute_missing_values(data_key, filters)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown(create_dark_table(missing_df), unsafe_allow_html=True)
+    
+    with col2:
+        # Eksik değer grafiği - daha yüksek boyut
+        missing_filtered = missing_df[missing_df['Eksik Sayı'] > 0]
+        
+        if len(missing_filtered) > 0:
+            st.plotly_chart(build_missing_figure(data_key, filters), use_container_width=True)
+        else:
+            st.success("✅ Veri setinde eksik değer bulunmamaktadır!")
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Eksik değerler analiz edildiğinde, seniority_level ve status 
+        sütunlarında en fazla eksiklik görülmektedir. Bu durum, bazı iş ilanlarında bu bilgilerin 
+        paylaşılmadığını göstermektedir. Model geliştirme aşamasında bu eksiklikler dikkate alınmalıdır.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,352 @@
+# =============================================================================
+# 📉 BÖLÜM: AYKIRI DEĞER ANALİZİ
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from cube import cube_sketch
+from figures import cached_figure
+from geometry import box_geometry, box_traces
+from histograms import Histogram, coarsen, histogram, histogram_trace, subtract_histograms, trim_empty
+from instrumentation import instrumented, measure_section
+from jobs_analytics import OUTLIER_COLUMNS, outlier_summary
+from loaders import load_bin_edges, load_filtered_data, load_salary_cube
+from sketch import sketch_between, sketch_from_values
+from tables import create_dark_table
+
+HISTOGRAM_COLUMNS = ['salary_numeric', 'company_size_numeric']
+HISTOGRAM_BINS = 50
+
+# Önce / sonra figürleri: (başlık işareti, renk, aşama, kapsam)
+OUTLIER_STAGES = [('🟥', '#ff6b6b', 'Önce', 'DAHİL'), ('🟦', '#00d4ff', 'Sonra', 'HARİÇ')]
+# Sütun -> (etiket, kutu grafiği y ekseni, histogram x ekseni)
+OUTLIER_LABELS = {
+    'salary_numeric': ('Maaş', 'Maaş (€)', 'Maaş (€)'),
+    'company_size_numeric': ('Şirket Büyüklüğü', 'Şirket Büyüklüğü (Çalışan Sayısı)', 'Şirket Büyüklüğü'),
+    'skills_count': ('Beceri Sayısı', 'Beceri Sayısı', 'Beceri Sayısı'),
+}
+
+
+def _column_sketches(data_key, filters):
+    """Aykırı değer analizindeki sütunların quantile özetleri"""
+    df = load_filtered_data(*data_key, filters)
+    sketches = {col: sketch_from_values(df[col]) for col in OUTLIER_COLUMNS if col != 'salary_numeric'}
+    # Maaş özeti küp hücrelerinin özetlerinden birleştirilir
+    sketches['salary_numeric'] = cube_sketch(load_salary_cube(*data_key, filters))
+    return sketches
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_outlier_stats(data_key, filters):
+    """Sayısal değişkenlerin IQR istatistikleri (sütun adı -> (aykırı sayısı, alt sınır, üst sınır, q1, q3, iqr))"""
+    df = load_filtered_data(*data_key, filters)
+    summary = outlier_summary(df, OUTLIER_COLUMNS, sketches=_column_sketches(data_key, filters))
+    return dict(zip(summary.index, summary.itertuples(index=False, name=None)))
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_outlier_boxes(data_key, filters):
+    """Sütun adı -> (önce, sonra) kutu geometrisi; 'sonra' IQR sınırları içindeki değerlerden"""
+    boxes = {}
+    for col, sketch in _column_sketches(data_key, filters).items():
+        before = box_geometry(sketch)
+        inside = sketch_between(sketch, before.stats.lower_fence, before.stats.upper_fence)
+        boxes[col] = (before, box_geometry(inside))
+    return boxes
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_outlier_histograms(data_key, filters):
+    """Sütun adı -> (önce, sonra) histogramı; ikisi de tek bir ince sayımdan türetilir"""
+    df = load_filtered_data(*data_key, filters)
+    outlier_stats = compute_outlier_stats(data_key, filters)
+    hists = {}
+    for col in HISTOGRAM_COLUMNS:
+        edges = load_bin_edges(*data_key, col, HISTOGRAM_BINS, filters=filters, inlier_width=True)
+        if edges is None:
+            empty = Histogram(np.zeros(1), np.zeros(0, dtype=np.int64))
+            hists[col] = (empty, empty)
+            continue
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        _, lower, upper = outlier_stats[col][:3]
+        counts = histogram(values, edges)
+        outliers = histogram(values[(values < lower) | (values > upper)], edges)
+        inliers = trim_empty(subtract_histograms(counts, outliers))
+        hists[col] = (coarsen(counts, HISTOGRAM_BINS), coarsen(inliers, HISTOGRAM_BINS))
+    return hists
+
+
+@cached_figure
+def build_outlier_box_figure(data_key, filters, column, after):
+    """Sütunun aykırı değerler dahil (after=False) ya da hariç (after=True) kutu figürü
+
+    Kutular ham değerler yerine önceden hesaplanmış çeyreklerle çizilir.
+    """
+    marker, color, stage, scope = OUTLIER_STAGES[after]
+    label, axis_title, _ = OUTLIER_LABELS[column]
+    fig = go.Figure()
+    fig.add_traces(box_traces(compute_outlier_boxes(data_key, filters)[column][after], f'{label} ({stage})', color))
+    fig.update_layout(
+        title=f'<b>{marker} Aykırı Değerler {scope}</b>',
+        template='plotly_dark',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        title_font=dict(size=16, color=color),
+        font=dict(color='#e0e0e0'),
+        yaxis_title=axis_title,
+        height=400,
+        showlegend=False
+    )
+    return fig
+
+
+@cached_figure
+def build_outlier_histogram_figure(data_key, filters, column, after):
+    """Sütunun aykırı değerler dahil (after=False) ya da hariç (after=True) histogram figürü"""
+    marker, color, stage, _ = OUTLIER_STAGES[after]
+    label, _, axis_title = OUTLIER_LABELS[column]
+    fig = go.Figure(histogram_trace(compute_outlier_histograms(data_key, filters)[column][after], color))
+    fig.update_layout(
+        title=f'<b>{marker} {label} Histogramı ({stage})</b>',
+        template='plotly_dark',
+        xaxis_title=axis_title,
+        yaxis_title='Frekans',
+        bargap=0,
+        title_font=dict(size=16, color=color),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        height=350
+    )
+    return fig
+
+
+@st.fragment
+@measure_section('outliers')
+def render_outliers(df, data_key, filters):
+    """IQR yöntemiyle aykırı değer analizi"""
+    # ==========================================================================
+    # 3.5️⃣ AYKIRI DEĞER ANALİZİ
+    # ==========================================================================
+    st.header("📉 Aykırı Değer Analizi")
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>🎯 Aykırı Değer Tespiti:</strong> IQR (Interquartile Range) yöntemi kullanılarak 
+        aykırı değerler tespit edilmiştir. Q1 - 1.5*IQR alt sınır, Q3 + 1.5*IQR üst sınır olarak belirlenir.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # IQR sınırları veri dosyası başına bir kez hesaplanır
+    outlier_stats = compute_outlier_stats(data_key, filters)
+    
+    # Maaş için aykırı değer analizi
+    salary_clean = df['salary_numeric'].dropna()
+    n_outliers_salary, lb_salary, ub_salary, q1_salary, q3_salary, iqr_salary = outlier_stats['salary_numeric']
+    
+    # Şirket büyüklüğü için aykırı değer analizi
+    company_size_clean = df['company_size_numeric'].dropna()
+    n_outliers_size, lb_size, ub_size, q1_size, q3_size, iqr_size = outlier_stats['company_size_numeric']
+    
+    # Beceri sayısı için aykırı değer analizi
+    skills_count_clean = df['skills_count'].dropna()
+    n_outliers_skills, lb_skills, ub_skills, q1_skills, q3_skills, iqr_skills = outlier_stats['skills_count']
+    
+    # Aykırı değer istatistikleri tablosu
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📊 Aykırı Değer İstatistikleri")
+        outlier_table = pd.DataFrame({
+            'Metrik': ['Q1 (25%)', 'Q3 (75%)', 'IQR', 'Alt Sınır', 'Üst Sınır', 'Aykırı Değer Sayısı', 'Aykırı Oran (%)'],
+            'Maaş (€)': [
+                f"{q1_salary:,.0f}",
+                f"{q3_salary:,.0f}",
+                f"{iqr_salary:,.0f}",
+                f"{lb_salary:,.0f}",
+                f"{ub_salary:,.0f}",
+                f"{n_outliers_salary}",
+                f"{n_outliers_salary/len(salary_clean)*100:.1f}%"
+            ],
+            'Şirket Büyüklüğü': [
+                f"{q1_size:,.0f}" if len(company_size_clean) > 0 else "N/A",
+                f"{q3_size:,.0f}" if len(company_size_clean) > 0 else "N/A",
+                f"{iqr_size:,.0f}" if len(company_size_clean) > 0 else "N/A",
+                f"{lb_size:,.0f}" if len(company_size_clean) > 0 else "N/A",
+                f"{ub_size:,.0f}" if len(company_size_clean) > 0 else "N/A",
+                f"{n_outliers_size}" if len(company_size_clean) > 0 else "N/A",
+                f"{n_outliers_size/len(company_size_clean)*100:.1f}%" if len(company_size_clean) > 0 else "N/A"
+            ],
+            'Beceri Sayısı': [
+                f"{q1_skills:.0f}",
+                f"{q3_skills:.0f}",
+                f"{iqr_skills:.0f}",
+                f"{lb_skills:.0f}",
+                f"{ub_skills:.0f}",
+                f"{n_outliers_skills}",
+                f"{n_outliers_skills/len(skills_count_clean)*100:.1f}%"
+            ]
+        })
+        st.markdown(create_dark_table(outlier_table), unsafe_allow_html=True)
+    
+    with col2:
+        st.subheader("📝 Özet")
+        total_outliers = n_outliers_salary + n_outliers_size + n_outliers_skills
+        summary_outlier = pd.DataFrame({
+            'Değişken': ['Maaş', 'Şirket Büyüklüğü', 'Beceri Sayısı', 'Toplam'],
+            'Aykırı Sayısı': [n_outliers_salary, n_outliers_size, n_outliers_skills, total_outliers],
+            'Durum': [
+                '⚠️ Yüksek' if n_outliers_salary > 50 else '✅ Normal',
+                '⚠️ Yüksek' if n_outliers_size > 50 else '✅ Normal',
+                '⚠️ Yüksek' if n_outliers_skills > 50 else '✅ Normal',
+                '⚠️ Dikkat' if total_outliers > 100 else '✅ Kabul Edilebilir'
+            ]
+        })
+        st.markdown(create_dark_table(summary_outlier), unsafe_allow_html=True)
+    
+    # Aykırı değer grafikleri - ÖNCE ve SONRA
+    st.subheader("📊 Maaş Dağılımı: Aykırı Değer Öncesi vs Sonrası")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # ÖNCE - Aykırı değerler dahil
+        st.plotly_chart(build_outlier_box_figure(data_key, filters, 'salary_numeric', False), use_container_width=True)
+        
+        st.markdown(f"""
+        <div class="insight-box">
+            <strong>🟥 Önce:</strong> Toplam {len(salary_clean):,} kayıt<br>
+            Min: €{salary_clean.min():,.0f} | Max: €{salary_clean.max():,.0f}<br>
+            Aykırı Değer: {n_outliers_salary} adet
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # SONRA - Aykırı değerler hariç
+        salary_no_outliers = salary_clean[(salary_clean >= lb_salary) & (salary_clean <= ub_salary)]
+        
+        st.plotly_chart(build_outlier_box_figure(data_key, filters, 'salary_numeric', True), use_container_width=True)
+        
+        st.markdown(f"""
+        <div class="insight-box">
+            <strong>🟦 Sonra:</strong> Toplam {len(salary_no_outliers):,} kayıt<br>
+            Min: €{salary_no_outliers.min():,.0f} | Max: €{salary_no_outliers.max():,.0f}<br>
+            Silinen: {len(salary_clean) - len(salary_no_outliers)} kayıt
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Histogram karşılaştırması (sunucuda kutulanmış; 'sonra' = önce − aykırı kutular)
+    st.subheader("📊 Histogram Karşılaştırması")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(build_outlier_histogram_figure(data_key, filters, 'salary_numeric', False), use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(build_outlier_histogram_figure(data_key, filters, 'salary_numeric', True), use_container_width=True)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Aykırı değerler temizlendikten sonra maaş dağılımı daha homojen 
+        bir yapıya kavuşmuştur. Sol taraftaki grafiklerde (kırmızı) aşırı yüksek maaş değerleri 
+        görülürken, sağ taraftaki temizlenmiş verilerde (mavi) daha tutarlı bir dağılım elde edilmiştir.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ŞİRKET BÜYÜKLÜĞÜ AYKIRI DEĞER ANALİZİ
+    if len(company_size_clean) > 0:
+        st.subheader("🏢 Şirket Büyüklüğü: Aykırı Değer Öncesi vs Sonrası")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # ÖNCE - Aykırı değerler dahil
+            st.plotly_chart(build_outlier_box_figure(data_key, filters, 'company_size_numeric', False), use_container_width=True)
+            
+            st.markdown(f"""
+            <div class="insight-box">
+                <strong>🟥 Önce:</strong> Toplam {len(company_size_clean):,} kayıt<br>
+                Min: {company_size_clean.min():,.0f} | Max: {company_size_clean.max():,.0f}<br>
+                Aykırı Değer: {n_outliers_size} adet
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            # SONRA - Aykırı değerler hariç
+            size_no_outliers = company_size_clean[(company_size_clean >= lb_size) & (company_size_clean <= ub_size)]
+            
+            st.plotly_chart(build_outlier_box_figure(data_key, filters, 'company_size_numeric', True), use_container_width=True)
+            
+            st.markdown(f"""
+            <div class="insight-box">
+                <strong>🟦 Sonra:</strong> Toplam {len(size_no_outliers):,} kayıt<br>
+                Min: {size_no_outliers.min():,.0f} | Max: {size_no_outliers.max():,.0f}<br>
+                Silinen: {len(company_size_clean) - len(size_no_outliers)} kayıt
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Şirket büyüklüğü histogram karşılaştırması
+        st.subheader("📊 Şirket Büyüklüğü Histogram Karşılaştırması")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.plotly_chart(build_outlier_histogram_figure(data_key, filters, 'company_size_numeric', False), use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(build_outlier_histogram_figure(data_key, filters, 'company_size_numeric', True), use_container_width=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Şirket büyüklüğü değişkeninde de aykırı değerler tespit edilmiştir. 
+            Çok büyük şirketler (dev kuruluşlar) aykırı değer olarak belirlenmiş olup, temizleme sonrası 
+            daha dengeli bir dağılım elde edilmiştir.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # BECERİ SAYISI AYKIRI DEĞER ANALİZİ
+    if n_outliers_skills > 0:
+        st.subheader("🛠️ Beceri Sayısı: Aykırı Değer Öncesi vs Sonrası")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # ÖNCE - Aykırı değerler dahil
+            st.plotly_chart(build_outlier_box_figure(data_key, filters, 'skills_count', False), use_container_width=True)
+            
+            st.markdown(f"""
+            <div class="insight-box">
+                <strong>🟥 Önce:</strong> Toplam {len(skills_count_clean):,} kayıt<br>
+                Min: {skills_count_clean.min():.0f} | Max: {skills_count_clean.max():.0f}<br>
+                Aykırı Değer: {n_outliers_skills} adet
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            # SONRA - Aykırı değerler hariç
+            skills_no_outliers = skills_count_clean[(skills_count_clean >= lb_skills) & (skills_count_clean <= ub_skills)]
+            
+            st.plotly_chart(build_outlier_box_figure(data_key, filters, 'skills_count', True), use_container_width=True)
+            
+            st.markdown(f"""
+            <div class="insight-box">
+                <strong>🟦 Sonra:</strong> Toplam {len(skills_no_outliers):,} kayıt<br>
+                Min: {skills_no_outliers.min():.0f} | Max: {skills_no_outliers.max():.0f}<br>
+                Silinen: {len(skills_count_clean) - len(skills_no_outliers)} kayıt
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Beceri sayısı değişkeninde bazı ilanlar aşırı fazla beceri gerektirmektedir. 
+            Bu ilanlar aykırı değer olarak tespit edilmiştir. Normal ilanlar ortalama 5-10 beceri ararken, 
+            bazı ilanlar 20+ beceri talep etmektedir.
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,84 @@
+# =============================================================================
+# 📁 BÖLÜM: ÖRNEK VERİLER VE SÜTUN BİLGİSİ
+# =============================================================================
+
+import pandas as pd
+import streamlit as st
+
+from instrumentation import instrumented, measure_section
+from loaders import load_filtered_data
+from parsing import DERIVED_COLUMNS
+from tables import create_dark_table
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_overview(data_key, filters):
+    """Özet metrikler, örnek satırlar ve sütun tipleri"""
+    df = load_filtered_data(*data_key, filters)
+
+    display_cols = ['job_title', 'seniority_level', 'status', 'company', 'location', 'industry', 'salary']
+    sample_df = df[display_cols].head(10).copy()
+    sample_df.columns = ['Pozisyon', 'Kıdem', 'Durum', 'Şirket', 'Lokasyon', 'Sektör', 'Maaş']
+
+    original_cols = [col for col in df.columns if col not in DERIVED_COLUMNS]
+    columns_info = pd.DataFrame({
+        'Sütun Adı': original_cols,
+        'Veri Tipi': [str(df[col].dtype) for col in original_cols]
+    })
+
+    return {
+        'n_rows': df.shape[0],
+        'mean_salary': df['salary_numeric'].mean(),
+        'n_companies': df['company'].nunique(),
+        'sample': sample_df,
+        'columns_info': columns_info,
+    }
+
+
+@st.fragment
+@measure_section('overview')
+def render_overview(df, data_key, filters):
+    """Örnek veriler, sütunlar ve özet metrikler"""
+    # ==========================================================================
+    # 2️⃣ ÖRNEK VERİLER VE SÜTUN BİLGİSİ
+    # ==========================================================================
+    st.header("📁 Örnek Veriler ve Sütun Bilgisi")
+
+    overview = compute_overview(data_key, filters)
+
+    # Metrikler
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("📊 Toplam İlan", f"{overview['n_rows']:,}")
+    with col2:
+        st.metric("📋 Özellik Sayısı", 13)
+    with col3:
+        st.metric("💰 Ort. Maaş", f"€{overview['mean_salary']:,.0f}")
+    with col4:
+        st.metric("🏢 Şirket Sayısı", overview['n_companies'])
+
+    st.subheader("🔍 Örnek Veriler")
+    st.markdown(create_dark_table(overview['sample']), unsafe_allow_html=True)
+
+    # Sütun bilgileri
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📋 Sütunlar")
+        st.markdown(create_dark_table(overview['columns_info']), unsafe_allow_html=True)
+
+    with col2:
+        st.subheader("📊 Değişken Özeti")
+        summary_df = pd.DataFrame({
+            'Metrik': ['Sayısal Değişken', 'Kategorik Değişken', 'Toplam Satır', 'Toplam Sütun'],
+            'Değer': [3, 10, overview['n_rows'], 13]
+        })
+        st.markdown(create_dark_table(summary_df), unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Veri seti 946 iş ilanı içermektedir. Her ilan için pozisyon,
+        kıdem seviyesi, lokasyon, sektör, maaş ve gereken beceriler gibi detaylı bilgiler bulunmaktadır.
+    </div>
+    """, unsafe_allow_html=True)
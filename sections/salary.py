@@ -0,0 +1,130 @@
+# =============================================================================
+# 💶 BÖLÜM: MAAŞ DAĞILIMI (HISTOGRAM + KDE)
+# =============================================================================
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from histograms import histogram, histogram_trace
+from figures import cached_figure
+from images import DEFAULT_THEME, THEMES, figure_png, new_figure
+from instrumentation import instrumented, measure_section
+from kde import kde, scott_bandwidth
+from loaders import load_bin_edges, load_filtered_data
+
+HISTOGRAM_BINS = 40
+BIN_METHOD_LABELS = {'nice': 'Otomatik (en fazla 40 kutu)', 'fd': 'Freedman–Diaconis'}
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_salary_summary(data_key, filters):
+    """Maaşın ortalama, medyan ve çarpıklık değerleri"""
+    salary_data = load_filtered_data(*data_key, filters)['salary_numeric'].dropna()
+    return {
+        'mean': salary_data.mean(),
+        'median': salary_data.median(),
+        'skew': salary_data.skew(),
+    }
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_salary_histogram(data_key, filters, method):
+    """Maaş histogramı (kutu sınırları sütun ve yöntem başına önbellekli); maaş yoksa None"""
+    edges = load_bin_edges(*data_key, 'salary_numeric', HISTOGRAM_BINS, method, filters)
+    if edges is None:
+        return None
+    return histogram(load_filtered_data(*data_key, filters)['salary_numeric'], edges)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_salary_kde_png(data_key, filters, theme=DEFAULT_THEME):
+    """Seaborn histogram + KDE grafiğinin PNG görüntüsü"""
+    import seaborn as sns  # yalnızca görsel ilk kez üretilirken yüklenir
+
+    palette = THEMES[theme]
+    salary_data = load_filtered_data(*data_key, filters)['salary_numeric'].dropna()
+
+    fig_kde, ax = new_figure((10, 5.5), theme)
+    sns.histplot(salary_data, ax=ax, color=palette['accent'], alpha=0.7, edgecolor=palette['edge'])
+    if len(salary_data) > 1 and ax.patches:
+        # KDE eğrisi FFT motoruyla (seaborn'daki gibi Scott bandı, veri aralığında, frekans ölçeğinde)
+        bandwidth = scott_bandwidth(salary_data.std(), len(salary_data))
+        if bandwidth > 0:
+            grid, density = kde(salary_data, bandwidth, low=salary_data.min(), high=salary_data.max())
+            ax.plot(grid, density * len(salary_data) * ax.patches[0].get_width(), color=palette['accent'])
+    ax.set_title('Maaş Dağılımı (Histogram + KDE)', fontweight='bold', color=palette['accent'], fontsize=14)
+    ax.set_xlabel('Maaş (€)', color=palette['text'], fontsize=11)
+    ax.set_ylabel('Frekans', color=palette['text'], fontsize=11)
+    ax.tick_params(colors=palette['text'])
+    ax.spines['bottom'].set_color(palette['grid'])
+    ax.spines['left'].set_color(palette['grid'])
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(True, alpha=0.2, color=palette['grid'])
+
+    fig_kde.tight_layout()
+    return figure_png(fig_kde)
+
+
+@cached_figure
+def build_salary_histogram_figure(data_key, filters, method):
+    """Seçilen kutu genişliği yöntemiyle maaş histogramı figürü"""
+    salary_hist = compute_salary_histogram(data_key, filters, method)
+
+    fig_hist = go.Figure(histogram_trace(salary_hist, '#00d4ff') if salary_hist is not None else None)
+    fig_hist.update_layout(
+        title='<b>Maaş Dağılımı (Histogram)</b>',
+        template='plotly_dark',
+        xaxis_title='Maaş (€)',
+        yaxis_title='Frekans',
+        bargap=0,
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        showlegend=False,
+        height=400
+    )
+    return fig_hist
+
+
+@st.fragment
+@measure_section('salary')
+def render_salary_distribution(df, data_key, filters):
+    """Maaş histogramı ve KDE"""
+    # ==========================================================================
+    # 6️⃣ MAAŞ DAĞILIMI (Histogram + KDE)
+    # ==========================================================================
+    st.header("📊 Maaş Dağılımı (Histogram + KDE)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Plotly Histogram (sunucuda kutulanmış çubuklar)
+        method = st.radio(
+            "Kutu genişliği",
+            list(BIN_METHOD_LABELS),
+            format_func=BIN_METHOD_LABELS.get,
+            horizontal=True,
+            key='salary_hist_bins'
+        )
+        st.plotly_chart(build_salary_histogram_figure(data_key, filters, method), use_container_width=True)
+    
+    with col2:
+        # Matplotlib + Seaborn KDE (veri anahtarı / filtre / tema başına bir kez PNG)
+        st.image(compute_salary_kde_png(data_key, filters), use_container_width=True)
+    
+    # İstatistikler
+    summary = compute_salary_summary(data_key, filters)
+    skewness = summary['skew']
+    
+    st.markdown(f"""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Maaş dağılımı analiz edildiğinde; Ortalama: €{summary['mean']:,.0f}, 
+        Medyan: €{summary['median']:,.0f}, Çarpıklık: {skewness:.2f}. 
+        {'Sağa çarpık dağılım yüksek maaşlı pozisyonların azlığını gösterir.' if skewness > 0.5 else 'Dağılım nispeten simetriktir.'}
+    </div>
+    """, unsafe_allow_html=True)
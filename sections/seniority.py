@@ -0,0 +1,98 @@
+# =============================================================================
+# 📦 BÖLÜM: KIDEM VS MAAŞ
+# =============================================================================
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from figures import cached_figure
+from geometry import box_geometry, box_traces
+from instrumentation import instrumented, measure_section
+from jobs_analytics import salary_by
+from loaders import load_filtered_data, load_salary_cube
+from tables import create_dark_table
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_seniority_stats(data_key, filters):
+    """Kıdem seviyesine göre ortalama, medyan maaş ve ilan sayısı"""
+    # Medyan, hücre quantile özetlerinin birleştirilmesiyle gelir
+    df = load_filtered_data(*data_key, filters)
+    seniority_stats = salary_by(df, 'seniority_level', cube=load_salary_cube(*data_key, filters))
+    seniority_stats = seniority_stats[['seniority_level', 'mean', 'median', 'count']]
+    seniority_stats.columns = ['Kıdem', 'Ortalama (€)', 'Medyan (€)', 'İlan Sayısı']
+    seniority_stats['Ortalama (€)'] = seniority_stats['Ortalama (€)'].apply(lambda x: f"{x:,.0f}")
+    seniority_stats['Medyan (€)'] = seniority_stats['Medyan (€)'].apply(lambda x: f"{x:,.0f}")
+    return seniority_stats
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_seniority_boxes(data_key, filters):
+    """Kıdem seviyesi -> kutu geometrisi, toplam maaşa göre artan sırada"""
+    df = load_filtered_data(*data_key, filters)
+    seniority = salary_by(df, 'seniority_level', cube=load_salary_cube(*data_key, filters))
+    seniority = seniority[seniority['count'] > 0].sort_values('sum', kind='stable')
+    return [(level, box_geometry(sketch)) for level, sketch in zip(seniority['seniority_level'], seniority['sketch'])]
+
+
+@cached_figure
+def build_seniority_box_figure(data_key, filters):
+    """Kıdem seviyelerinin yatay maaş kutu figürü (kutular önceden hesaplanmış çeyreklerle)"""
+    seniority_boxes = compute_seniority_boxes(data_key, filters)
+    colors = px.colors.qualitative.Plotly
+
+    fig_box = go.Figure()
+    for i, (level, geometry) in enumerate(seniority_boxes):
+        fig_box.add_traces(box_traces(geometry, level, colors[i % len(colors)], orientation='h', width=0.6))
+    fig_box.update_layout(
+        title='<b>Kıdem Seviyesine Göre Maaş Boxplot</b>',
+        template='plotly_dark',
+        height=500,
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        showlegend=False,
+        xaxis_title='Maaş (€)',
+        yaxis=dict(
+            title='Kıdem Seviyesi',
+            tickfont=dict(size=12),
+            categoryorder='array',
+            categoryarray=[level for level, _ in seniority_boxes]
+        ),
+        boxmode='overlay',
+        boxgap=0.3,
+        boxgroupgap=0.4
+    )
+    return fig_box
+
+
+@st.fragment
+@measure_section('seniority')
+def render_seniority(df, data_key, filters):
+    """Kıdem seviyesine göre maaş"""
+    # ==========================================================================
+    # 📦 KIDEM VS MAAŞ
+    # ==========================================================================
+    st.header("📦 Kıdem vs Maaş")
+    
+    st.subheader("📦 Kıdem Seviyesine Göre Maaş Dağılımı")
+    
+    # Yatay boxplot - daha net görünüm
+    st.plotly_chart(build_seniority_box_figure(data_key, filters), use_container_width=True)
+    
+    # Kıdem istatistikleri tablosu
+    st.subheader("📊 Kıdem Bazlı İstatistikler")
+    seniority_stats = compute_seniority_stats(data_key, filters)
+    st.markdown(create_dark_table(seniority_stats), unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="insight-box">
+        <strong>💡 Yorum:</strong> Lead pozisyonlar en yüksek maaş aralığına sahipken, 
+        junior pozisyonlar giriş seviyesi maaşlarla başlamaktadır. Senior pozisyonlar 
+        geniş bir maaş aralığına sahiptir.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,526 @@
+# =============================================================================
+# 🛠️ BÖLÜM: BECERİ ANALİZİ
+# =============================================================================
+# Sabit grafikler tek bir hesaplama fonksiyonundan beslenir; ısı haritası,
+# sık küme gezgini, serbest kombinasyon sorgusu ve merkez beceri görünümü
+# kendi kontrollerine sahip ayrı fragment'lardır. Bu kontrollerden biri
+# değiştiğinde yalnızca ilgili fragment yeniden çalışır.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from figures import cached_figure
+from instrumentation import instrumented, measure_section
+from itemsets import top_itemsets, association_rules
+from jobs_analytics import skill_cooccurrence
+from loaders import (
+    ITEMSET_MIN_SUPPORT,
+    load_filtered_data,
+    load_skill_incidence,
+    load_skill_cooccurrence,
+    load_skill_index,
+    mine_skill_itemsets,
+)
+from skill_index import count_postings
+from skill_matrix import (
+    top_skills,
+    skill_count,
+    cooccurrence_with,
+)
+from tables import create_dark_table, render_dark_table
+
+SKILL_GROUPS = {
+    'programming': ['python', 'r', 'sql', 'java', 'scala'],
+    'ml_tools': ['machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras', 'scikit-learn'],
+    'cloud_tools': ['aws', 'gcp', 'azure', 'docker', 'kubernetes'],
+}
+
+POPULAR_COMBOS = [
+    ('Python', 'Machine Learning'),
+    ('Python', 'SQL'),
+    ('Python', 'Machine Learning', 'Deep Learning'),
+    ('Python', 'SQL', 'Machine Learning'),
+    ('Python', 'TensorFlow', 'PyTorch'),
+    ('AWS', 'Python', 'Machine Learning'),
+    ('Python', 'Spark', 'SQL'),
+    ('R', 'Python', 'SQL'),
+]
+
+
+# =============================================================================
+# 🧮 HESAPLAMA FONKSİYONLARI
+# =============================================================================
+@st.cache_data(max_entries=8, show_spinner=False)
+@instrumented
+def compute_skill_summary(data_key, filters):
+    """En çok aranan beceriler, beceri grupları ve popüler kombinasyonlar"""
+    skill_incidence = load_skill_incidence(*data_key, filters)
+    n_postings = skill_incidence.matrix.shape[0]
+
+    groups = {}
+    for name, skills in SKILL_GROUPS.items():
+        rows = []
+        for skill in skills:
+            count = skill_count(skill_incidence, skill)
+            if count > 0:
+                rows.append({'Beceri': skill, 'Sayı': count})
+        groups[name] = pd.DataFrame(rows)
+
+    skill_index = load_skill_index(*data_key, filters)
+    combo_results = []
+    for combo in POPULAR_COMBOS:
+        count = count_postings(skill_index, combo)
+        combo_results.append({
+            'Kombinasyon': ' + '.join(combo),
+            'İlan Sayısı': count,
+            'Oran (%)': f"{count / n_postings * 100:.1f}%"
+        })
+
+    # İkili ve üçlü kombinasyonlar sık öğe kümesi madenciliğinden
+    chart_itemsets = mine_skill_itemsets(*data_key, min_support=ITEMSET_MIN_SUPPORT, max_size=3, filters=filters)
+
+    return {
+        'top_20': top_skills(skill_incidence, top=20),
+        'top_30': top_skills(skill_incidence, top=30),
+        'options': top_skills(skill_incidence).index.tolist(),
+        'groups': groups,
+        'pairs': top_itemsets(chart_itemsets, size=2, top=15),
+        'triplets': top_itemsets(chart_itemsets, size=3, top=10),
+        'combos': pd.DataFrame(combo_results).sort_values('İlan Sayısı', ascending=False),
+    }
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+@instrumented
+def compute_cooccurrence_heatmap(data_key, filters, size):
+    """En sık `size` beceri arasındaki birliktelik sayıları"""
+    return skill_cooccurrence(
+        load_filtered_data(*data_key, filters),
+        top=size,
+        incidence=load_skill_incidence(*data_key, filters),
+        cooccurrence=load_skill_cooccurrence(*data_key, filters)
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+@instrumented
+def compute_itemset_tables(data_key, filters, min_support, max_size):
+    """En büyük sık kümeler ve en güçlü kurallar (çok becerili küme yoksa None)"""
+    explore_itemsets = mine_skill_itemsets(*data_key, min_support=min_support, max_size=max_size, filters=filters)
+    multi_itemsets = explore_itemsets[explore_itemsets['size'] >= 2]
+    if len(multi_itemsets) == 0:
+        return None
+
+    n_postings = load_skill_incidence(*data_key, filters).matrix.shape[0]
+    largest_size = int(multi_itemsets['size'].max())
+    largest_itemsets = top_itemsets(multi_itemsets, size=largest_size, top=10)
+    largest_df = pd.DataFrame({
+        'Beceri Kümesi': [' + '.join(items) for items in largest_itemsets.index],
+        'İlan Sayısı': largest_itemsets.values,
+        'Destek (%)': [f"{count / n_postings * 100:.1f}%" for count in largest_itemsets.values]
+    })
+
+    rules = association_rules(explore_itemsets, n_postings, min_confidence=0.6)
+    rules = rules.sort_values(['lift', 'count'], ascending=False, kind='stable').head(10)
+    rules_df = pd.DataFrame({
+        'Kural': [f"{' + '.join(a)} → {c}" for a, c in zip(rules['antecedent'], rules['consequent'])],
+        'Destek (%)': [f"{x * 100:.1f}%" for x in rules['support']],
+        'Güven (%)': [f"{x * 100:.1f}%" for x in rules['confidence']],
+        'Lift': [f"{x:.2f}" for x in rules['lift']]
+    })
+    return largest_size, largest_df, rules_df
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+@instrumented
+def compute_anchor_cooccurrence(data_key, filters, anchor_skill):
+    """Merkez becerinin ilan sayısı ve onunla en sık birlikte aranan 10 beceri"""
+    skill_incidence = load_skill_incidence(*data_key, filters)
+    anchor_total = skill_count(skill_incidence, anchor_skill)
+    anchor_cooccurrence = cooccurrence_with(
+        skill_incidence, anchor_skill, cooccurrence=load_skill_cooccurrence(*data_key, filters)
+    ).head(10)
+    return anchor_total, anchor_cooccurrence
+
+
+def _anchor_table(data_key, filters, anchor_skill):
+    """Merkez becerinin ilan sayısı ve birlikte arandığı becerilerin tablosu"""
+    anchor_total, anchor_cooccurrence = compute_anchor_cooccurrence(data_key, filters, anchor_skill)
+    anchor_co_df = pd.DataFrame({
+        'Beceri': anchor_cooccurrence.index,
+        f"{anchor_skill} ile Birlikte": anchor_cooccurrence.values,
+        'Oran (%)': [f"{x / anchor_total * 100:.1f}%" for x in anchor_cooccurrence.values]
+    })
+    return anchor_total, anchor_co_df
+
+
+# =============================================================================
+# 📊 FİGÜRLER
+# =============================================================================
+@cached_figure
+def build_top_skills_figure(data_key, filters):
+    """En çok aranan 20 becerinin figürü"""
+    skill_counts = compute_skill_summary(data_key, filters)['top_20']
+
+    fig_skills = px.bar(
+        x=skill_counts.values,
+        y=skill_counts.index,
+        orientation='h',
+        title='<b>En Çok Aranan 20 Beceri</b>',
+        template='plotly_dark',
+        labels={'x': 'İlan Sayısı', 'y': 'Beceri'},
+        height=500
+    )
+    fig_skills.update_traces(marker_color='#00d4ff')
+    fig_skills.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        showlegend=False,
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig_skills
+
+
+@cached_figure
+def build_top_30_skills_figure(data_key, filters):
+    """En çok aranan 30 becerinin figürü"""
+    skill_counts_30 = compute_skill_summary(data_key, filters)['top_30']
+
+    fig_skills_30 = px.bar(
+        x=skill_counts_30.values,
+        y=skill_counts_30.index,
+        orientation='h',
+        title='<b>En Çok Aranan 30 Beceri (Detaylı)</b>',
+        template='plotly_dark',
+        labels={'x': 'İlan Sayısı', 'y': 'Beceri'},
+        height=700
+    )
+    fig_skills_30.update_traces(marker_color='#00d4ff')
+    fig_skills_30.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        showlegend=False,
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig_skills_30
+
+
+@cached_figure
+def build_skill_pairs_figure(data_key, filters):
+    """En sık birlikte aranan 15 beceri çiftinin figürü"""
+    pair_counts = compute_skill_summary(data_key, filters)['pairs']
+
+    pair_df = pd.DataFrame({
+        'Beceri Çifti': [f"{p[0]} + {p[1]}" for p in pair_counts.index],
+        'İlan Sayısı': pair_counts.values
+    })
+
+    fig_pairs = px.bar(
+        pair_df,
+        x='İlan Sayısı',
+        y='Beceri Çifti',
+        orientation='h',
+        title='<b>En Sık Birlikte Aranan Beceri Çiftleri</b>',
+        template='plotly_dark',
+        height=500
+    )
+    fig_pairs.update_traces(marker_color='#00d4ff')
+    fig_pairs.update_layout(
+        title_font=dict(size=16, color='#00d4ff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig_pairs
+
+
+@cached_figure
+def build_cooccurrence_heatmap_figure(data_key, filters, heatmap_size):
+    """En sık heatmap_size beceri arasındaki birliktelik ısı haritası figürü"""
+    cooc_df = compute_cooccurrence_heatmap(data_key, filters, heatmap_size)
+    # Köşegen (tekil sayılar) renk skalasını bastırmasın
+    cooc_values = np.array(cooc_df, dtype=float)
+    np.fill_diagonal(cooc_values, np.nan)
+
+    fig_cooc = go.Figure(go.Heatmap(
+        z=cooc_values,
+        x=cooc_df.columns,
+        y=cooc_df.index,
+        colorscale='Blues',
+        hovertemplate='<b>%{y} + %{x}</b><br>İlan Sayısı: %{z:,.0f}<extra></extra>'
+    ))
+    fig_cooc.update_layout(
+        title='<b>En Çok Aranan Beceriler Arasındaki Birliktelik</b>',
+        template='plotly_dark',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        title_font=dict(size=16, color='#00d4ff'),
+        font=dict(color='#e0e0e0'),
+        height=max(450, 28 * len(cooc_df)),
+        yaxis=dict(autorange='reversed')
+    )
+    return fig_cooc
+
+
+@cached_figure
+def build_skill_triplets_figure(data_key, filters):
+    """En sık birlikte aranan 10 beceri üçlüsünün figürü"""
+    triplet_counts = compute_skill_summary(data_key, filters)['triplets']
+
+    triplet_df = pd.DataFrame({
+        'Beceri Üçlüsü': [f"{t[0]} + {t[1]} + {t[2]}" for t in triplet_counts.index],
+        'İlan Sayısı': triplet_counts.values
+    })
+
+    fig_triplets = px.bar(
+        triplet_df,
+        x='İlan Sayısı',
+        y='Beceri Üçlüsü',
+        orientation='h',
+        title='<b>En Sık Birlikte Aranan Beceri Üçlüleri</b>',
+        template='plotly_dark',
+        height=450
+    )
+    fig_triplets.update_traces(marker_color='#48bb78')
+    fig_triplets.update_layout(
+        title_font=dict(size=16, color='#48bb78'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig_triplets
+
+
+@cached_figure
+def build_anchor_figure(data_key, filters, anchor_skill):
+    """Merkez beceri ile birlikte en çok aranan 10 becerinin figürü"""
+    anchor_co_df = _anchor_table(data_key, filters, anchor_skill)[1]
+    anchor_label = f"{anchor_skill} ile Birlikte"
+
+    fig_anchor_co = px.bar(
+        anchor_co_df,
+        x=anchor_label,
+        y='Beceri',
+        orientation='h',
+        title=f'<b>{anchor_skill} ile Birlikte En Çok Aranan 10 Beceri</b>',
+        template='plotly_dark',
+        height=400
+    )
+    fig_anchor_co.update_traces(marker_color='#ed8936')
+    fig_anchor_co.update_layout(
+        title_font=dict(size=16, color='#ed8936'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig_anchor_co
+
+
+# =============================================================================
+# 🎛️ ETKİLEŞİMLİ ALT BÖLÜMLER (FRAGMENT)
+# =============================================================================
+@st.fragment
+@measure_section('skills.cooccurrence_heatmap')
+def render_cooccurrence_heatmap(data_key, filters, n_vocab):
+    """Seçilen sayıda beceri için birliktelik ısı haritası"""
+    st.markdown("**🔥 Beceri Birliktelik Isı Haritası**")
+
+    heatmap_size = st.slider(
+        "Gösterilecek beceri sayısı",
+        min_value=min(5, n_vocab),
+        max_value=min(40, n_vocab),
+        value=min(15, n_vocab),
+        key='cooccurrence_heatmap_size'
+    ) if n_vocab > 5 else n_vocab
+
+    st.plotly_chart(build_cooccurrence_heatmap_figure(data_key, filters, heatmap_size), use_container_width=True)
+
+
+@st.fragment
+@measure_section('skills.itemset_explorer')
+def render_itemset_explorer(data_key, filters):
+    """Destek ve küme boyutu seçilebilen sık küme / kural tabloları"""
+    st.markdown("**🧩 Sık Beceri Kümeleri ve Birliktelik Kuralları**")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        min_support_pct = st.slider("Minimum destek (%)", 1, 50, 5, key='itemset_min_support')
+    with col2:
+        max_itemset_size = st.slider("En büyük küme boyutu", 2, 6, 4, key='itemset_max_size')
+
+    itemset_tables = compute_itemset_tables(data_key, filters, min_support_pct / 100, max_itemset_size)
+
+    if itemset_tables is not None:
+        largest_size, largest_df, rules_df = itemset_tables
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(f"**En Sık Beceri Kümeleri ({largest_size} Beceri)**")
+            render_dark_table(largest_df, key='itemset_largest_page')
+        with col2:
+            st.markdown("**En Güçlü Kurallar (Güven ≥ %60, Lift'e Göre)**")
+            if len(rules_df) > 0:
+                render_dark_table(rules_df, key='itemset_rules_page')
+            else:
+                st.info("Bu destek seviyesinde güveni %60'ı geçen kural bulunamadı.")
+    else:
+        st.info("Bu destek seviyesinde birden fazla beceri içeren sık küme bulunamadı.")
+
+
+@st.fragment
+@measure_section('skills.combo_query')
+def render_combo_query(data_key, filters, skill_options, total_jobs):
+    """Serbest kombinasyon sorgusu (ters indeks: kesişim + popcount)"""
+    st.markdown("**🔎 Kendi Beceri Kombinasyonunuzu Sorgulayın**")
+
+    custom_combo = st.multiselect(
+        "Beceri kombinasyonu seçin",
+        options=skill_options,
+        default=[s for s in ['python', 'machine learning'] if s in skill_options],
+        key='custom_skill_combo'
+    )
+
+    if custom_combo:
+        custom_count = count_postings(load_skill_index(*data_key, filters), custom_combo)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("📊 Eşleşen İlan", f"{custom_count:,}")
+        with col2:
+            st.metric("📈 Oran", f"{custom_count / total_jobs * 100:.1f}%")
+
+
+@st.fragment
+@measure_section('skills.anchor_view')
+def render_anchor_view(data_key, filters, skill_options):
+    """Seçilen beceri merkezli analiz (birliktelik matrisinin tek satırı)"""
+    st.markdown("**⚓ Seçilen Beceri ile Birlikte En Çok Aranan Beceriler**")
+
+    anchor_skill = st.selectbox(
+        "Merkez beceri",
+        options=skill_options,
+        index=skill_options.index('python') if 'python' in skill_options else 0,
+        key='anchor_skill'
+    )
+    anchor_total, anchor_co_df = _anchor_table(data_key, filters, anchor_skill)
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.plotly_chart(build_anchor_figure(data_key, filters, anchor_skill), use_container_width=True)
+
+    with col2:
+        st.markdown(create_dark_table(anchor_co_df), unsafe_allow_html=True)
+        st.caption(f"Oran: {anchor_total:,} '{anchor_skill}' ilanı içindeki payı")
+
+
+# =============================================================================
+# 🛠️ BÖLÜM
+# =============================================================================
+@st.fragment
+@measure_section('skills')
+def render_skills(df, data_key, filters):
+    """Beceri sayımları, birliktelikler ve kombinasyonlar"""
+    # ==========================================================================
+    # 🛠️ BECERİ ANALİZİ
+    # ==========================================================================
+    st.header("🛠️ Beceri Analizi")
+
+    st.subheader("🛠️ En Çok Aranan Beceriler")
+
+    # Beceri sayımları insidans matrisinden (veri dosyası başına bir kez kurulur)
+    skill_incidence = load_skill_incidence(*data_key, filters)
+
+    if skill_incidence.matrix.nnz > 0:
+        summary = compute_skill_summary(data_key, filters)
+
+        # 5. Top 20 Most Requested Skills - Barplot
+        st.plotly_chart(build_top_skills_figure(data_key, filters), use_container_width=True)
+
+        # 8. Top 30 Most Requested Skills - Horizontal Bar Chart
+        st.subheader("📊 En Çok Aranan 30 Beceri")
+        st.plotly_chart(build_top_30_skills_figure(data_key, filters), use_container_width=True)
+
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Python, SQL ve Machine Learning en kritik becerilerdir.
+            Cloud ve DevOps becerileri de giderek önem kazanmaktadır.
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Beceri grupları tabloları
+        st.subheader("📋 Beceri Grupları")
+
+        col1, col2, col3 = st.columns(3)
+
+        for column, (name, label) in zip(
+            (col1, col2, col3),
+            [('programming', '**💻 Programlama**'), ('ml_tools', '**🤖 ML/DL**'), ('cloud_tools', '**☁️ Cloud/DevOps**')]
+        ):
+            with column:
+                st.markdown(label)
+                group_df = summary['groups'][name]
+                if len(group_df) > 0:
+                    render_dark_table(group_df, key=f'skill_group_{name}_page')
+
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Python ve SQL en çok aranan becerilerdir. Machine Learning
+            bilgisi neredeyse tüm pozisyonlarda beklenmektedir. Cloud platformları da giderek
+            daha önemli hale gelmektedir.
+        </div>
+        """, unsafe_allow_html=True)
+
+        # ==================================================================
+        # 🔗 BECERİ BİRLİKTELİK ANALİZİ (YENİ BÖLÜM)
+        # ==================================================================
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        st.subheader("🔗 Beceri Birliktelik Analizi")
+
+        st.markdown("""
+        <div class="insight-box">
+            <strong>📌 Beceri Birlikteliği Nedir?</strong> Hangi becerilerin birlikte arandığını
+            gösterir. Örneğin, Python arayan ilanların kaçında aynı zamanda Machine Learning de aranıyor?
+        </div>
+        """, unsafe_allow_html=True)
+
+        # İkili kombinasyon grafiği
+        st.markdown("**👫 En Sık Birlikte Aranan İkili Beceriler (Top 15)**")
+
+        st.plotly_chart(build_skill_pairs_figure(data_key, filters), use_container_width=True)
+
+        # Birliktelik ısı haritası (en sık aranan N beceri)
+        render_cooccurrence_heatmap(data_key, filters, len(skill_incidence.vocabulary))
+
+        # Üçlü beceri kombinasyonları
+        st.markdown("**👨‍👩‍👧 En Sık Birlikte Aranan Üçlü Beceriler (Top 10)**")
+
+        st.plotly_chart(build_skill_triplets_figure(data_key, filters), use_container_width=True)
+
+        # Sık beceri kümeleri (2, 3, 4... beceri) ve birliktelik kuralları
+        render_itemset_explorer(data_key, filters)
+
+        # Özel kombinasyon analizi
+        st.markdown("**🎯 Popüler Beceri Kombinasyonları Detayı**")
+        render_dark_table(summary['combos'], key='skill_combos_page')
+
+        render_combo_query(data_key, filters, summary['options'], len(df))
+        render_anchor_view(data_key, filters, summary['options'])
+
+        st.markdown("""
+        <div class="insight-box">
+            <strong>💡 Yorum:</strong> Python + Machine Learning en popüler ikili kombinasyondur.
+            Üçlü kombinasyonlarda Python + SQL + Machine Learning öne çıkmaktadır.
+            Bu, veri bilimi pozisyonlarının temel beklentilerini net şekilde ortaya koymaktadır.
+            Deep Learning ve TensorFlow/PyTorch gibi ileri düzey beceriler de sıkça birlikte aranmaktadır.
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,200 @@
+# =============================================================================
+# 📐 BİRLEŞTİRİLEBİLİR QUANTİLE ÖZETLERİ (T-DIGEST)
+# =============================================================================
+# Bir sayısal dağılım, ağırlıklı merkezlerden (centroid) oluşan küçük bir
+# özetle tutulur. Merkezler dağılımın uçlarında küçük, ortasında büyük olacak
+# şekilde k1 ölçek fonksiyonuyla birleştirilir; böylece medyan, çeyrekler ve
+# kutu grafiği sınırları milyonlarca değer yerine en fazla ~compression
+# merkezden okunur. İki özet, merkezleri birleştirilip yeniden sıkıştırılarak
+# tek özete dönüştürülür (parçalar, küp hücreleri ve filtreler arasında).
+#
+# Merkez sayısı EXACT_LIMIT'i geçmeyen özetler sıkıştırılmaz; tek tek
+# değerlerden oluşan böyle bir özetin sonuçları pandas'ın quantile (doğrusal
+# enterpolasyon) sonuçlarıyla aynıdır.
+# =============================================================================
+
+from typing import NamedTuple
+
+import numpy as np
+
+DEFAULT_COMPRESSION = 200
+EXACT_LIMIT = 10_000  # bu kadar merkeze kadar sıkıştırma yapılmaz
+
+
+class QuantileSketch(NamedTuple):
+    """Sıralı merkez ortalamaları ve ağırlıkları"""
+    means: np.ndarray    # float64, artan sırada
+    weights: np.ndarray  # float64, merkez başına değer sayısı
+    min: float
+    max: float
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    @property
+    def exact(self):
+        """Her merkez tek bir değer mi (sıkıştırma yapılmamış)"""
+        return bool(np.all(self.weights == 1))
+
+
+EMPTY_SKETCH = QuantileSketch(np.empty(0), np.empty(0), np.nan, np.nan)
+
+
+def _k_scale(q, compression):
+    """k1 ölçek fonksiyonu: uçlarda daha sık, ortada daha seyrek bölmeler"""
+    return compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+
+def _compress(means, weights, compression):
+    """Sıralı merkezleri k ölçeğinde birim aralıklara düşenleri birleştirerek sıkıştır"""
+    if len(means) <= max(compression, EXACT_LIMIT):
+        return means, weights
+
+    total = weights.sum()
+    left_q = (np.cumsum(weights) - weights) / total
+    groups = np.floor(_k_scale(left_q, compression)).astype(np.int64)
+    # Gruplar artan sırada; her yeni grup değerinde yeni bir merkez başlar
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+    return merged_means, merged_weights
+
+
+def sketch_from_values(values, compression=DEFAULT_COMPRESSION):
+    """Değerlerden özet oluştur (NaN değerler atlanır)"""
+    values = np.asarray(values, dtype=np.float64)
+    values = np.sort(values[~np.isnan(values)])
+    if len(values) == 0:
+        return EMPTY_SKETCH
+    means, weights = _compress(values, np.ones(len(values)), compression)
+    return QuantileSketch(means, weights, float(values[0]), float(values[-1]))
+
+
+def merge_sketches(sketches, compression=DEFAULT_COMPRESSION):
+    """Birden fazla özeti tek özette birleştir"""
+    sketches = [s for s in sketches if len(s.means)]
+    if not sketches:
+        return EMPTY_SKETCH
+    if len(sketches) == 1:
+        return sketches[0]
+
+    means = np.concatenate([s.means for s in sketches])
+    weights = np.concatenate([s.weights for s in sketches])
+    order = np.argsort(means, kind='stable')
+    means, weights = _compress(means[order], weights[order], compression)
+    return QuantileSketch(
+        means, weights,
+        min(s.min for s in sketches),
+        max(s.max for s in sketches),
+    )
+
+
+def _interpolation_points(sketch):
+    """Sıra konumu -> değer eşlemesi: her merkez kendi ağırlığının ortasında, uçlarda min/max"""
+    centers = np.cumsum(sketch.weights) - sketch.weights / 2
+    positions = np.r_[0.0, centers, sketch.count]
+    values = np.r_[sketch.min, sketch.means, sketch.max]
+    return positions, values
+
+
+def sketch_quantile(sketch, q):
+    """q (tek değer veya dizi) quantile'ları; boş özet için NaN"""
+    q = np.asarray(q, dtype=np.float64)
+    if len(sketch.means) == 0:
+        return np.full(q.shape, np.nan) if q.ndim else np.nan
+    if sketch.exact:
+        return np.quantile(sketch.means, q)
+
+    total = sketch.count
+    positions, values = _interpolation_points(sketch)
+    return np.interp(q * total, positions, values)
+
+
+def _rank(sketch, x):
+    """Sıkıştırılmış özette x'in (kesirli) sıra konumu; quantile enterpolasyonunun tersi"""
+    positions, values = _interpolation_points(sketch)
+    return float(np.interp(x, values, positions))
+
+
+def sketch_count_below(sketch, x):
+    """x'ten küçük değer sayısı (sıkıştırılmış özette yaklaşık)"""
+    if len(sketch.means) == 0:
+        return 0.0
+    if sketch.exact:
+        return float(np.searchsorted(sketch.means, x, side='left'))
+    return _rank(sketch, x)
+
+
+def sketch_count_above(sketch, x):
+    """x'ten büyük değer sayısı (sıkıştırılmış özette yaklaşık)"""
+    if len(sketch.means) == 0:
+        return 0.0
+    if sketch.exact:
+        return float(len(sketch.means) - np.searchsorted(sketch.means, x, side='right'))
+    return sketch.count - _rank(sketch, x)
+
+
+def sketch_between(sketch, low, high):
+    """Ortalaması [low, high] aralığında kalan merkezlerden oluşan özet"""
+    inside = (sketch.means >= low) & (sketch.means <= high)
+    if not inside.any():
+        return EMPTY_SKETCH
+    means = sketch.means[inside]
+    return QuantileSketch(
+        means, sketch.weights[inside],
+        sketch.min if sketch.min >= low else float(means[0]),
+        sketch.max if sketch.max <= high else float(means[-1]),
+    )
+
+
+def sketch_outside(sketch, low, high):
+    """[low, high] dışında kalan merkez ortalamaları (sıkıştırılmamış özette değerlerin kendisi)"""
+    return sketch.means[(sketch.means < low) | (sketch.means > high)]
+
+
+def sketch_mean_std(sketch):
+    """Ağırlıklı ortalama ve örneklem standart sapması (merkez içi varyans yok sayılır)"""
+    count = sketch.count
+    if count == 0:
+        return np.nan, np.nan
+    mean = float(np.dot(sketch.weights, sketch.means) / count)
+    if count <= 1:
+        return mean, np.nan
+    var = float(np.dot(sketch.weights, (sketch.means - mean) ** 2) / (count - 1))
+    return mean, np.sqrt(var)
+
+
+class BoxStats(NamedTuple):
+    """Kutu grafiği özeti (Tukey, 1.5 × IQR)"""
+    q1: float
+    median: float
+    q3: float
+    iqr: float
+    lower_fence: float
+    upper_fence: float
+    lower_whisker: float  # alt sınırın içindeki en küçük değer
+    upper_whisker: float  # üst sınırın içindeki en büyük değer
+    n_outliers: int
+
+
+def box_stats(sketch):
+    """Özetten çeyrekler, IQR sınırları, bıyıklar ve aykırı değer sayısı"""
+    q1, median, q3 = sketch_quantile(sketch, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    lower_fence = q1 - 1.5 * iqr
+    upper_fence = q3 + 1.5 * iqr
+
+    # Gerçek min/max sınırların içindeyse bıyık odur; değilse sınır içindeki uç merkez
+    inside = sketch.means[(sketch.means >= lower_fence) & (sketch.means <= upper_fence)]
+    if sketch.min >= lower_fence:
+        lower_whisker = sketch.min
+    else:
+        lower_whisker = float(inside[0]) if len(inside) else q1
+    if sketch.max <= upper_fence:
+        upper_whisker = sketch.max
+    else:
+        upper_whisker = float(inside[-1]) if len(inside) else q3
+    n_outliers = sketch_count_below(sketch, lower_fence) + sketch_count_above(sketch, upper_fence)
+
+    return BoxStats(q1, median, q3, iqr, lower_fence, upper_fence, lower_whisker, upper_whisker, int(round(n_outliers)))
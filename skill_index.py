@@ -0,0 +1,107 @@
+# =============================================================================
+# 🔎 BECERİ TERS İNDEKSİ (BECERİ → İLAN KÜMESİ)
+# =============================================================================
+# Her (küçük harfe çevrilmiş) beceri için onu içeren ilanların kümesi tutulur.
+# Roaring bitmap'lere benzer şekilde seyrek beceriler sıralı ilan numarası
+# dizisi, yoğun beceriler paketlenmiş bit dizisi (np.packbits) olarak saklanır.
+# "A VE B VE C'yi isteyen kaç ilan var?" sorusu kesişim + popcount ile
+# yanıtlanır.
+# =============================================================================
+
+from typing import NamedTuple
+
+import numpy as np
+
+# Bu orandan daha az ilanda geçen beceriler dizi olarak saklanır
+# (4 baytlık ilan numarası < 1 bitlik bitmap olduğu sınır: 1/32)
+ARRAY_DENSITY_LIMIT = 1 / 32
+
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+class SkillBitmapIndex(NamedTuple):
+    """Beceri → ilan kümesi ters indeksi"""
+    containers: dict   # küçük harf beceri -> ('array', ids) | ('bitmap', paketli bitler)
+    cardinality: dict  # küçük harf beceri -> ilan sayısı
+    n_postings: int
+
+
+def _popcount(packed):
+    """Paketli bit dizisindeki 1 sayısı"""
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(packed).sum(dtype=np.int64))
+    return int(_POPCOUNT_TABLE[packed].sum(dtype=np.int64))
+
+
+def _test_bits(packed, ids):
+    """ids içindeki ilanların paketli bitmap'te bulunup bulunmadığı"""
+    return ((packed[ids >> 3] >> (7 - (ids & 7))) & 1).astype(bool)
+
+
+def build_skill_bitmap_index(incidence):
+    """İnsidans matrisinden ters indeksi oluştur
+
+    Beceri adları burada bir kez küçük harfe çevrilir; aynı küçük harfli
+    ada sahip sütunlar tek bir ilan kümesinde birleştirilir.
+    """
+    csc = incidence.matrix.tocsc()
+    n_postings = incidence.matrix.shape[0]
+
+    rows_by_skill = {}
+    for col, skill in enumerate(incidence.vocabulary):
+        rows = csc.indices[csc.indptr[col]:csc.indptr[col + 1]].astype(np.int64)
+        key = skill.lower()
+        if key in rows_by_skill:
+            rows = np.union1d(rows_by_skill[key], rows)
+        rows_by_skill[key] = np.sort(rows)
+
+    containers, cardinality = {}, {}
+    for key, rows in rows_by_skill.items():
+        cardinality[key] = len(rows)
+        if len(rows) < ARRAY_DENSITY_LIMIT * n_postings:
+            containers[key] = ('array', rows)
+        else:
+            mask = np.zeros(n_postings, dtype=bool)
+            mask[rows] = True
+            containers[key] = ('bitmap', np.packbits(mask))
+    return SkillBitmapIndex(containers, cardinality, n_postings)
+
+
+def posting_ids(index, combo):
+    """Kombinasyondaki tüm becerileri içeren ilanların numaraları"""
+    keys = {skill.lower() for skill in combo}
+    if not keys:
+        return np.arange(index.n_postings)
+    if any(key not in index.containers for key in keys):
+        return np.array([], dtype=np.int64)
+
+    # En seyrek kümeden başla; kesişim en küçük kümeyle sınırlı kalır
+    ordered = sorted(keys, key=index.cardinality.get)
+    arrays = [index.containers[k][1] for k in ordered if index.containers[k][0] == 'array']
+    bitmaps = [index.containers[k][1] for k in ordered if index.containers[k][0] == 'bitmap']
+
+    if arrays:
+        ids = arrays[0]
+        for other in arrays[1:]:
+            ids = np.intersect1d(ids, other, assume_unique=True)
+        for packed in bitmaps:
+            ids = ids[_test_bits(packed, ids)]
+        return ids
+
+    packed = _and_bitmaps(bitmaps)
+    return np.flatnonzero(np.unpackbits(packed, count=index.n_postings))
+
+
+def _and_bitmaps(bitmaps):
+    result = bitmaps[0].copy()
+    for packed in bitmaps[1:]:
+        np.bitwise_and(result, packed, out=result)
+    return result
+
+
+def count_postings(index, combo):
+    """Kombinasyondaki tüm becerileri (harf duyarsız) içeren ilan sayısı"""
+    keys = {skill.lower() for skill in combo}
+    if keys and all(key in index.containers and index.containers[key][0] == 'bitmap' for key in keys):
+        return _popcount(_and_bitmaps([index.containers[k][1] for k in keys]))
+    return len(posting_ids(index, combo))
@@ -0,0 +1,136 @@
+# =============================================================================
+# 🧮 BECERİ İNSİDANS MATRİSİ
+# =============================================================================
+# İlan × beceri seyrek (CSR) 0/1 matrisi. Beceri analizlerindeki tüm sayımlar
+# (tekil sayılar, ikili/üçlü birliktelikler, koşullu sayımlar) Python
+# listeleri yeniden gezilmeden bu matris üzerinden hesaplanır.
+# =============================================================================
+
+from itertools import chain
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class SkillIncidence(NamedTuple):
+    """İlan × beceri matrisi ve beceri sözlüğü"""
+    matrix: sparse.csr_matrix  # (ilan sayısı, beceri sayısı), int32 0/1
+    vocabulary: np.ndarray     # alfabetik sıralı beceri adları
+    index: dict                # beceri adı -> sütun numarası
+
+
+def build_skill_incidence(skills_list):
+    """skills_list sütunundan insidans matrisini oluştur
+
+    Sütunlar beceri adına göre alfabetik sıralıdır; böylece i < j olan her
+    sütun çifti, sıralı bir beceri çiftine karşılık gelir. Bir ilanda aynı
+    beceri birden fazla kez geçse de bir kez sayılır.
+    """
+    lists = skills_list.tolist()
+    lengths = np.fromiter((len(skills) for skills in lists), dtype=np.int64, count=len(lists))
+    flat = np.fromiter(chain.from_iterable(lists), dtype=object, count=int(lengths.sum()))
+
+    codes, uniques = pd.factorize(flat)
+    order = np.argsort(np.asarray(uniques, dtype=str), kind='stable')
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    codes = rank[codes]
+    vocabulary = np.asarray(uniques, dtype=object)[order]
+    rows = np.repeat(np.arange(len(lists)), lengths)
+
+    matrix = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.int32), (rows, codes)),
+        shape=(len(lists), len(vocabulary)),
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+
+    return SkillIncidence(matrix, vocabulary, {skill: i for i, skill in enumerate(vocabulary)})
+
+
+def top_indices(values, top=None):
+    """Azalan sırada (eşitlikte konuma göre) en büyük `top` değerin indeksleri
+
+    Tam sıralama yerine önce argpartition ile eşik bulunur; yalnızca eşiği
+    geçen adaylar sıralanır.
+    """
+    values = np.asarray(values)
+    candidates = np.arange(len(values))
+    if top is not None and top < len(values):
+        if top <= 0:
+            return candidates[:0]
+        threshold = values[np.argpartition(-values, top - 1)[:top]].min()
+        candidates = np.flatnonzero(values >= threshold)
+    order = candidates[np.lexsort((candidates, -values[candidates]))]
+    return order[:top]
+
+
+def _ranked(values, labels, top=None):
+    """Sayımları azalan sırada (eşitlikte etikete göre) Series olarak döndür"""
+    order = top_indices(values, top)
+    return pd.Series(np.asarray(values)[order], index=[labels[i] for i in order])
+
+
+def top_skills(incidence, top=None):
+    """Her becerinin geçtiği ilan sayısı (azalan)"""
+    counts = np.asarray(incidence.matrix.sum(axis=0)).ravel()
+    return _ranked(counts, incidence.vocabulary, top)
+
+
+def skill_count(incidence, skill):
+    """Tek bir becerinin geçtiği ilan sayısı (sözlükte yoksa 0)"""
+    col = incidence.index.get(skill)
+    if col is None:
+        return 0
+    return int(incidence.matrix[:, col].sum())
+
+
+def cooccurrence_matrix(incidence):
+    """Beceri × beceri birliktelik matrisi (X.T @ X); köşegen tekil sayılardır"""
+    matrix = incidence.matrix
+    return (matrix.T @ matrix).tocsr()
+
+
+def cooccurrence_frame(incidence, top=20, cooccurrence=None):
+    """En sık `top` beceri arasındaki birliktelik sayıları (kare DataFrame)"""
+    if cooccurrence is None:
+        cooccurrence = cooccurrence_matrix(incidence)
+    counts = cooccurrence.diagonal()
+    cols = top_indices(counts, top)
+    dense = cooccurrence[cols][:, cols].toarray()
+    labels = incidence.vocabulary[cols]
+    return pd.DataFrame(dense, index=labels, columns=labels)
+
+
+def columns_matching(incidence, skill):
+    """Büyük/küçük harf duyarsız olarak beceriye karşılık gelen sütunlar"""
+    target = skill.lower()
+    return [i for skill_name, i in incidence.index.items() if skill_name.lower() == target]
+
+
+def postings_with(incidence, skill):
+    """Beceriyi (harf duyarsız) içeren ilanların maskesi"""
+    cols = columns_matching(incidence, skill)
+    if not cols:
+        return np.zeros(incidence.matrix.shape[0], dtype=bool)
+    return np.asarray(incidence.matrix[:, cols].sum(axis=1)).ravel() > 0
+
+
+def cooccurrence_with(incidence, skill, cooccurrence=None):
+    """Beceriyi içeren ilanlarda diğer becerilerin geçme sayıları (azalan)
+
+    Beceri sözlükte tek bir sütuna karşılık geliyorsa sayımlar önceden
+    hesaplanmış birliktelik matrisinin ilgili satırından tek adımda okunur.
+    """
+    cols = columns_matching(incidence, skill)
+    if len(cols) == 1 and cooccurrence is not None:
+        counts = cooccurrence[cols[0]].toarray().ravel()
+    else:
+        mask = postings_with(incidence, skill)
+        counts = np.asarray(incidence.matrix[mask].sum(axis=0)).ravel()
+    keep = np.ones(len(counts), dtype=bool)
+    keep[cols] = False
+    keep &= counts > 0
+    return _ranked(counts[keep], incidence.vocabulary[keep])
@@ -0,0 +1,114 @@
+# =============================================================================
+# 💾 SÜTUNSAL VERİ ANLIK GÖRÜNTÜSÜ (PARQUET)
+# =============================================================================
+# Ön işlenmiş veri seti, CSV'nin yanına tipli bir Parquet dosyası olarak
+# yazılır. Sonraki açılışlarda CSV metni yeniden ayrıştırılmaz; CSV'nin
+# içeriği (SHA-256) değiştiğinde anlık görüntü yeniden oluşturulur.
+# =============================================================================
+
+import hashlib
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from startup import startup_phase
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow yoksa her zaman CSV'den yüklenir
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# prepare_dataset çıktısının biçimi değiştiğinde artırılmalı
+SNAPSHOT_VERSION = '2'
+
+_HASH_KEY = b'source_sha256'
+_VERSION_KEY = b'snapshot_version'
+
+
+def snapshot_path(csv_path):
+    """CSV dosyasının yanındaki anlık görüntü yolu"""
+    root, _ = os.path.splitext(csv_path)
+    return root + '.parquet'
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Dosyanın SHA-256 özeti (parça parça okunur)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _restore_skill_lists(df):
+    """Arrow list sütunundan gelen dizileri Python listelerine çevir
+
+    Aynı skills metnine sahip satırlar tek bir liste nesnesini paylaşır.
+    """
+    codes, _ = pd.factorize(df['skills'], use_na_sentinel=False)
+    _, first_rows = np.unique(codes, return_index=True)
+    arrays = df['skills_list'].to_numpy()
+    lists = np.empty(len(first_rows), dtype=object)
+    lists[:] = [[] if arrays[i] is None else arrays[i].tolist() for i in first_rows]
+    df['skills_list'] = pd.Series(lists[codes], index=df.index, dtype=object)
+    return df
+
+
+def read_snapshot(path, source_hash):
+    """Anlık görüntü güncelse oku, değilse None döndür"""
+    if pq is None or not os.path.exists(path):
+        return None
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+        if (metadata.get(_HASH_KEY) != source_hash.encode()
+                or metadata.get(_VERSION_KEY) != SNAPSHOT_VERSION.encode()):
+            return None
+        df = pq.read_table(path).to_pandas()
+    except (OSError, pa.ArrowException) as exc:
+        logger.warning("Anlık görüntü okunamadı (%s): %s", path, exc)
+        return None
+    return _restore_skill_lists(df)
+
+
+def write_snapshot(df, path, source_hash):
+    """Ön işlenmiş veriyi anlık görüntü olarak yaz (atomik)"""
+    if pq is None:
+        return False
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_HASH_KEY] = source_hash.encode()
+    metadata[_VERSION_KEY] = SNAPSHOT_VERSION.encode()
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        # Salt okunur dosya sistemlerinde anlık görüntü olmadan devam edilir
+        logger.warning("Anlık görüntü yazılamadı (%s): %s", path, exc)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def load_with_snapshot(csv_path, build):
+    """Anlık görüntüden yükle; yoksa/eskiyse build(csv_path) ile üretip yaz"""
+    with startup_phase('CSV özeti (SHA-256)'):
+        source_hash = file_sha256(csv_path)
+    path = snapshot_path(csv_path)
+
+    with startup_phase('Anlık görüntü okuma'):
+        df = read_snapshot(path, source_hash)
+    if df is None:
+        df = build(csv_path)
+        with startup_phase('Anlık görüntü yazma'):
+            write_snapshot(df, path, source_hash)
+    return df
@@ -0,0 +1,117 @@
+# =============================================================================
+# ⏱️ BAŞLANGIÇ ZAMANLAMASI
+# =============================================================================
+# Uygulamanın süreçteki ilk çalıştırmasında içe aktarmaların, veri yüklemenin
+# (anlık görüntü / CSV okuma) ve ön işlemenin ne kadar sürdüğünü ölçer.
+# Aşamalar iç içe olabilir; aynı aşama birden çok kez ölçülürse (ör. CSV
+# parçaları) süreler toplanır. İlk çalıştırma bitince rapor dondurulur ve
+# sonraki yeniden çalıştırmalarda ölçüm yapılmaz.
+#
+# Modül düzeyinde içe aktarma dökümü için:
+#     python startup.py [en_yavaş_n]
+# =============================================================================
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Tanımlıysa dashboard kenar çubuğunda başlangıç süreleri paneli gösterilir
+REPORT_ENV = 'JOBS_STARTUP_REPORT'
+
+# python startup.py ile içe aktarma süreleri ölçülen uygulama modülleri
+APP_MODULES = (
+    'streamlit', 'figures', 'instrumentation', 'prerender', 'tables', 'ingest', 'filters', 'loaders', 'sections',
+)
+
+_started = time.perf_counter()
+_lock = threading.Lock()
+_local = threading.local()
+_phases = {}  # (derinlik, ad) -> toplam süre (s); ilk ölçüm sırasıyla
+_total = None
+
+
+def report_enabled():
+    """Başlangıç süreleri paneli açık mı"""
+    return bool(os.environ.get(REPORT_ENV))
+
+
+@contextmanager
+def startup_phase(name):
+    """Bloğun süresini başlangıç raporuna ekle (rapor dondurulduktan sonra ölçmez)"""
+    if _total is not None:
+        yield
+        return
+    stack = _local.__dict__.setdefault('stack', [])
+    key = (len(stack), name)
+    with _lock:
+        _phases.setdefault(key, 0.0)
+    stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        with _lock:
+            if _total is None:
+                _phases[key] += elapsed
+
+
+def finish_startup():
+    """İlk çalıştırma bitti: raporu dondur ve bir kez logla"""
+    global _total
+    with _lock:
+        if _total is not None:
+            return
+        _total = time.perf_counter() - _started
+    logger.info("Başlangıç süreleri:\n%s", format_report())
+
+
+def startup_report():
+    """(aşama, süre ms) satırları; iç içe aşamalar girintili, son satır toplam"""
+    with _lock:
+        phases = list(_phases.items())
+        total = _total
+    rows = [('\u00a0' * 4 * depth + ('↳ ' if depth else '') + name, seconds * 1000) for (depth, name), seconds in phases]
+    if total is not None:
+        rows.append(('Toplam (ilk çalıştırma)', total * 1000))
+    return rows
+
+
+def format_report():
+    """Başlangıç raporunun düz metin hali"""
+    return '\n'.join(f'{name:<48} {ms:>10,.1f} ms' for name, ms in startup_report())
+
+
+# =============================================================================
+# 📦 İÇE AKTARMA DÖKÜMÜ (python -X importtime)
+# =============================================================================
+
+def import_times(modules=APP_MODULES):
+    """Modülleri temiz bir yorumlayıcıda içe aktarıp modül başına (kendi, kümülatif) µs"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times.append((name.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+if __name__ == '__main__':
+    top_n = int(sys.argv[1]) if len(sys.argv) > 1 else 25
+    times = sorted(import_times(), key=lambda row: row[2], reverse=True)
+    print(f'{"modül":<60} {"kendi ms":>10} {"kümülatif ms":>14}')
+    for name, self_us, cumulative_us in times[:top_n]:
+        print(f'{name:<60} {self_us / 1000:>10,.1f} {cumulative_us / 1000:>14,.1f}')
@@ -0,0 +1,58 @@
+# =============================================================================
+# 🧾 GECE MODU HTML TABLOLARI
+# =============================================================================
+# DataFrame'leri .dark-table sınıflı HTML tablolara çevirir. Hücreler sütun
+# bazında dönüştürülür ve tek bir join ile birleştirilir; büyük tablolar
+# sayfalara bölünerek yalnızca görünen pencere HTML'e yazılır.
+# render_dark_table, PAGE_SIZE satırı aşan tablolara sayfa seçici ekler.
+# =============================================================================
+
+from html import escape
+import math
+
+import streamlit as st
+
+# render_dark_table'ın sayfa başına satır sayısı
+PAGE_SIZE = 10
+
+
+def total_pages(n_rows, page_size):
+    """Verilen sayfa boyutu için toplam sayfa sayısı"""
+    if not page_size:
+        return 1
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def _column_cells(series):
+    """Bir sütunun HTML-kaçışlı hücre metinleri"""
+    return [escape(str(val), quote=False) for val in series.tolist()]
+
+
+def create_dark_table(df, max_rows=None, page=0, page_size=None):
+    """Gece moduna uygun HTML tablo oluştur
+
+    page_size verilirse yalnızca `page` numaralı (0 tabanlı) satır penceresi
+    yazılır.
+    """
+    if max_rows:
+        df = df.head(max_rows)
+    if page_size:
+        start = page * page_size
+        df = df.iloc[start:start + page_size]
+
+    header = ''.join(f'<th>{escape(str(col), quote=False)}</th>' for col in df.columns)
+    columns = [_column_cells(df.iloc[:, i]) for i in range(df.shape[1])]
+    rows = ''.join('<tr><td>' + '</td><td>'.join(cells) + '</td></tr>' for cells in zip(*columns))
+    return f'<table class="dark-table"><thead><tr>{header}</tr></thead><tbody>{rows}</tbody></table>'
+
+
+def render_dark_table(df, key, page_size=PAGE_SIZE):
+    """Tabloyu çiz; page_size satırı aşarsa sayfa seçiciyle yalnızca seçili sayfayı yaz"""
+    pages = total_pages(len(df), page_size)
+    page = 1
+    if pages > 1:
+        page = st.selectbox(
+            "Sayfa", range(1, pages + 1), key=key,
+            format_func=lambda number: f"{number} / {pages}", label_visibility='collapsed'
+        )
+    st.markdown(create_dark_table(df, page=page - 1, page_size=page_size), unsafe_allow_html=True)